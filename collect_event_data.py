@@ -1,17 +1,56 @@
 import os
 import re
+import sys
+import random
+import hashlib
+import sqlite3
 import json
 import time
-import calendar
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
-
+import gzip
+import zlib
+import asyncio
+import contextlib
+import logging
+import threading
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import fastjsonschema
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from openpyxl.utils import get_column_letter
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+try:
+    import orjson  # type: ignore
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing handlers still apply.
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    orjson = None  # type: ignore
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+try:
+    import xlsxwriter  # type: ignore
+except ImportError:
+    xlsxwriter = None  # type: ignore
 try:
     from dotenv import load_dotenv  # type: ignore
 except Exception:
     load_dotenv = None  # type: ignore
 
+# Per-month progress goes through logging; the __main__ driver sets up a plain handler.
+logger = logging.getLogger(__name__)
+
 # Minimal .env loader (fallback if python-dotenv is not installed)
 def _load_env_file(path: str = ".env") -> None:
     """Load key=value pairs from a .env file into os.environ if not already set.
@@ -25,18 +64,15 @@ def _load_env_file(path: str = ".env") -> None:
         with open(path, "r", encoding="utf-8") as fp:
             for raw_line in fp:
                 line = raw_line.strip()
-                if not line or line.startswith("#"):
+                if not line or line[0] == "#":
                     continue
-                if line.startswith("export "):
-                    line = line[len("export ") :].strip()
-                if "=" not in line:
+                line = line.removeprefix("export ").lstrip()
+                key, sep, value = line.partition("=")
+                if not sep:
                     continue
-                key, value = line.split("=", 1)
                 key = key.strip()
                 value = value.strip()
-                if (value.startswith("\"") and value.endswith("\"")) or (
-                    value.startswith("'") and value.endswith("'")
-                ):
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
                     value = value[1:-1]
                 if key and key not in os.environ:
                     os.environ[key] = value
@@ -54,25 +90,257 @@ class PerplexityAPIError(RuntimeError):
     """Raised when the Perplexity API returns an HTTP or API-level error."""
 
 
+class PerplexityTransientError(PerplexityAPIError):
+    """
+    A failure worth retrying later: network error, timeout, 429 or 5xx.
+
+    `retry_after` carries the server's Retry-After hint in seconds, if any.
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class JSONStructureError(ValueError):
     """Raised when the model's response is not valid JSON or fails schema checks."""
 
 
-def _last_day_of_month(year: int, month: int) -> int:
-    """Return the last day number (28-31) for the given month/year."""
-    return calendar.monthrange(year, month)[1]
+PERPLEXITY_API_URL = "https://api.perplexity.ai/chat/completions"
 
+# Shared HTTP session so consecutive months reuse the same TCP/TLS connection.
+_SESSION: Optional[requests.Session] = None
 
-def _build_prompt(year: int, month: int) -> str:
+
+def _get_session() -> requests.Session:
+    """Return the module-level pooled session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        session.headers.update({
+            "Content-Type": "application/json",
+            # Perplexity is OpenAI-compatible; keep UA minimal & clear for traceability.
+            "User-Agent": "research-client/1.0",
+        })
+        # Retries are handled explicitly in fetch_negative_bank_events.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=0)
+        session.mount("https://", adapter)
+        _SESSION = session
+    return _SESSION
+
+
+def _retry_after_seconds(headers: Any) -> Optional[float]:
+    """The Retry-After header in seconds, or None if absent or in HTTP-date form."""
+    value = headers.get("Retry-After") if headers is not None else None
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class _AimdConcurrency:
     """
-    Build the strict JSON-only research prompt, parameterized by the given month/year.
-    The prompt enforces scope, sourcing, de-duplication, and output schema.
+    Adaptive cap on in-flight async requests (additive increase, multiplicative decrease).
+
+    Each fast success raises the cap by `alpha`; a 429 or 5xx multiplies it by
+    `beta`. The cap stays within [min_limit, max_limit] and starts at max_limit.
     """
-    start_date = f"{year:04d}-{month:02d}-01"
-    end_date = f"{year:04d}-{month:02d}-{_last_day_of_month(year, month):02d}"
 
-    # Important: Keep this aligned with the expected output schema the caller will validate.
-    return f"""
+    def __init__(self, max_limit: int, *, min_limit: int = 1, alpha: float = 0.5,
+                 beta: float = 0.5, latency_target: float = 30.0) -> None:
+        self.max_limit = max(1, int(max_limit))
+        self.min_limit = max(1, min(int(min_limit), self.max_limit))
+        self.alpha = alpha
+        self.beta = beta
+        self.latency_target = latency_target
+        self.limit = float(self.max_limit)
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @contextlib.asynccontextmanager
+    async def slot(self):
+        """Hold one request slot for the duration of the block."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def observe(self, status_code: int, latency: float) -> None:
+        """Adjust the cap from one response's status and latency (seconds)."""
+        if status_code == 429 or status_code >= 500:
+            self.limit = max(float(self.min_limit), self.limit * self.beta)
+        elif status_code == 200 and latency <= self.latency_target:
+            self.limit = min(float(self.max_limit), self.limit + self.alpha)
+
+
+class _RateLimiter:
+    """
+    Limiter that spaces request starts at least `interval` seconds apart (threads or asyncio).
+
+    Responses are fed back through observe(): Retry-After on a 429, or an exhausted
+    x-ratelimit-remaining-requests budget, pauses every caller until the provider's
+    window resets, and the optional AIMD controller adjusts concurrency.
+    """
+
+    def __init__(self, interval: float, concurrency: Optional[_AimdConcurrency] = None) -> None:
+        self.interval = max(0.0, float(interval))
+        self.concurrency = concurrency
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all request starts for at least `seconds` from now."""
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+    def observe(self, status_code: int, headers: Any, latency: float) -> None:
+        """Feed one response's status, rate-limit headers and latency back into the limiter."""
+        pause = 0.0
+        if status_code == 429:
+            pause = _retry_after_seconds(headers) or 0.0
+        if str(headers.get("x-ratelimit-remaining-requests", "")).strip() == "0":
+            # Budget exhausted: wait for the window reset (plain or "s"-suffixed seconds)
+            try:
+                pause = max(pause, float(str(headers.get("x-ratelimit-reset-requests", "")).rstrip("s")))
+            except ValueError:
+                pass
+        if pause > 0:
+            self.pause(pause)
+        if self.concurrency is not None:
+            self.concurrency.observe(status_code, latency)
+
+    def _reserve(self) -> float:
+        """Claim the next request slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        return wait
+
+    def acquire(self) -> None:
+        """Block until the caller may issue the next request."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until the next request may be issued."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+# Default on-disk cache of validated Perplexity responses (pass cache_path=None to disable).
+DEFAULT_CACHE_PATH = "pplx_cache.db"
+
+
+class _ResponseCache:
+    """
+    SQLite store of validated model payloads.
+
+    `responses` is keyed by a (year, month, model, prompt) fingerprint; `month_results`
+    checkpoints each collected month by (year, month, model) so an interrupted
+    backfill resumes where it stopped, even if the month was fetched as part of a batch.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        # One autocommit connection shared by the worker threads (access is serialized by _lock).
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                cache_key TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                created_at INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS month_results (
+                year INTEGER NOT NULL,
+                month INTEGER NOT NULL,
+                model TEXT NOT NULL,
+                json_output BLOB NOT NULL,
+                created_at INTEGER NOT NULL,
+                PRIMARY KEY (year, month, model)
+            )
+        """)
+
+    @staticmethod
+    def make_key(year: int, month: int, model: str, prompt: str) -> str:
+        """Stable fingerprint of a request; changes whenever the prompt text changes."""
+        raw = f"{year:04d}-{month:02d}|{model}|{prompt}".encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached JSON bytes for `key`, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM responses WHERE cache_key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, body: bytes) -> None:
+        """Store (or replace) the JSON bytes for `key`."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (cache_key, body, created_at) VALUES (?, ?, ?)",
+                (key, body, int(time.time())),
+            )
+
+    def get_months(self, model: str) -> Dict[Tuple[int, int], bytes]:
+        """All checkpointed months for `model` as {(year, month): compressed JSON bytes}."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT year, month, json_output FROM month_results WHERE model = ?", (model,)
+            ).fetchall()
+        return {(year, month): body for year, month, body in rows}
+
+    def put_month(self, year: int, month: int, model: str, json_output: bytes) -> None:
+        """Checkpoint one month's compressed JSON payload."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO month_results (year, month, model, json_output, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (year, month, model, json_output, int(time.time())),
+            )
+
+
+_RESPONSE_CACHES: Dict[str, _ResponseCache] = {}
+_RESPONSE_CACHES_LOCK = threading.Lock()
+
+
+def _get_response_cache(path: str) -> _ResponseCache:
+    """Return the process-wide cache for `path`, opening it on first use."""
+    with _RESPONSE_CACHES_LOCK:
+        cache = _RESPONSE_CACHES.get(path)
+        if cache is None:
+            cache = _RESPONSE_CACHES[path] = _ResponseCache(path)
+        return cache
+
+
+# Days per month in a non-leap year.
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _last_day_of_month(year: int, month: int) -> int:
+    """Return the last day number (28-31) for the given month/year."""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+# Static body of the research prompt; only the month window is filled in per call.
+# Important: Keep this aligned with the expected output schema the caller will validate.
+_PROMPT_TEMPLATE = """
 You are a meticulous research assistant. Search credible, publicly verifiable sources and return ONLY valid UTF-8 JSON (no prose, no markdown). Your job is to list every major negative event involving banks operating in the USA during {start_date}–{end_date} inclusive.
 
 ## Scope & definitions
@@ -183,26 +451,65 @@ Return a single JSON object with this exact structure:
 """.strip()
 
 
+@lru_cache(maxsize=512)
+def _build_prompt(year: int, month: int) -> str:
+    """
+    Build the strict JSON-only research prompt, parameterized by the given month/year.
+    The prompt enforces scope, sourcing, de-duplication, and output schema.
+    """
+    start_date = f"{year:04d}-{month:02d}-01"
+    end_date = f"{year:04d}-{month:02d}-{_last_day_of_month(year, month):02d}"
+    return _PROMPT_TEMPLATE.format(start_date=start_date, end_date=end_date)
+
+
+# Appended to the single-window prompt when several months are requested at once.
+_RANGE_PROMPT_SUFFIX = """
+## Monthly windows (overrides the output format above)
+This request covers {count} consecutive monthly windows:
+{window_lines}
+
+Instead of the top-level "events" array, return "events_by_window": an array with exactly one entry per window above, in the same order, each shaped as:
+{{ "window": {{ "start": "YYYY-MM-DD", "end": "YYYY-MM-DD" }}, "events": [ event objects exactly as specified above ] }}
+Place each event in the window that contains its event_date and use "events": [] for windows with no qualifying events. Keep "query", "dedupe_note", "coverage_notes" and "last_updated" at the top level as specified.
+"""
+
+
+def _month_window(year: int, month: int) -> Tuple[str, str]:
+    """ISO (start, end) dates of a calendar month."""
+    return f"{year:04d}-{month:02d}-01", f"{year:04d}-{month:02d}-{_last_day_of_month(year, month):02d}"
+
+
+@lru_cache(maxsize=256)
+def _build_prompt_range(months: Tuple[Tuple[int, int], ...]) -> str:
+    """
+    Build one prompt covering several consecutive months.
+
+    The base prompt is parameterized with the whole span; the model is asked to
+    split its answer into one `events_by_window` entry per month.
+    """
+    windows = [_month_window(year, month) for year, month in months]
+    base = _PROMPT_TEMPLATE.format(start_date=windows[0][0], end_date=windows[-1][1])
+    window_lines = "\n".join(f"- {start} to {end}" for start, end in windows)
+    return base + "\n" + _RANGE_PROMPT_SUFFIX.format(count=len(windows), window_lines=window_lines).rstrip()
+
+
+# Greedy match from first "{" to last "}".
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
 def _extract_json_block(text: str) -> str:
     """
     Attempts to extract the largest JSON object substring from a text blob.
     Useful if the model prepends/appends stray prose despite instructions.
     """
-    # Greedy match from first "{" to last "}".
-    m = re.search(r"\{.*\}", text, re.DOTALL)
+    m = _JSON_BLOCK_RE.search(text)
     return m.group(0) if m else ""
 
 
-def _repair_json(json_text: str) -> str:
-    """
-    Attempt to repair common JSON syntax errors.
-    Returns the repaired JSON string or the original if repair fails.
-    """
-    if not json_text:
-        return json_text
-    
-    # Common JSON repair patterns - more conservative approach
-    repairs = [
+# Common JSON repair patterns - more conservative approach
+_JSON_REPAIRS = [
+    (re.compile(pattern), replacement)
+    for pattern, replacement in (
         # Fix trailing commas in objects and arrays (most common)
         (r',(\s*[}\]])', r'\1'),
         # Fix single quotes to double quotes (but be careful with nested quotes)
@@ -214,53 +521,65 @@ def _repair_json(json_text: str) -> str:
         (r':\s*true\s*([,}\]])', r': true\1'),
         (r':\s*false\s*([,}\]])', r': false\1'),
         (r':\s*null\s*([,}\]])', r': null\1'),
-    ]
+    )
+]
+
+
+def _repair_json(json_text: str) -> str:
+    """
+    Attempt to repair common JSON syntax errors.
+    Returns the repaired JSON string or the original if repair fails.
+    """
+    if not json_text:
+        return json_text
     
     repaired = json_text
-    for pattern, replacement in repairs:
+    for pattern, replacement in _JSON_REPAIRS:
         try:
-            repaired = re.sub(pattern, replacement, repaired)
+            repaired = pattern.sub(replacement, repaired)
         except Exception:
             continue
     
     return repaired
 
 
-def _validate_and_repair_json(content: str) -> tuple[str, bool]:
+def _validate_and_repair_json(content: str) -> tuple[str, Optional[Any], bool]:
     """
     Validate JSON and attempt repair if invalid.
-    Returns (json_text, was_repaired).
+    Returns (json_text, data, was_repaired); data is None if nothing could be parsed.
     """
-    # First try to extract JSON block
-    json_text = _extract_json_block(content)
-    if not json_text:
-        return content, False
+    stripped = content.strip()
+    if stripped[:1] == "{" and stripped[-1:] == "}":
+        # Bare JSON object (the usual reply at temperature 0): no regex scan needed
+        json_text = stripped
+    else:
+        # Otherwise extract the JSON block from surrounding prose
+        json_text = _extract_json_block(content)
+        if not json_text:
+            return content, None, False
     
     # Try to parse the extracted JSON
     try:
-        json.loads(json_text)
-        return json_text, False  # Valid JSON, no repair needed
+        return json_text, _loads(json_text), False  # Valid JSON, no repair needed
     except json.JSONDecodeError:
         pass
     
     # Attempt repair
     repaired = _repair_json(json_text)
     try:
-        json.loads(repaired)
-        return repaired, True  # Repair successful
+        return repaired, _loads(repaired), True  # Repair successful
     except json.JSONDecodeError:
         pass
     
     # If repair failed, try repairing the original content
     repaired_original = _repair_json(content)
     try:
-        json.loads(repaired_original)
-        return repaired_original, True  # Repair successful on original
+        return repaired_original, _loads(repaired_original), True  # Repair successful on original
     except json.JSONDecodeError:
         pass
     
     # All repair attempts failed
-    return json_text, False
+    return json_text, None, False
 
 
 def _validate_params(year: int, month: int) -> None:
@@ -271,46 +590,237 @@ def _validate_params(year: int, month: int) -> None:
         raise ValueError("month must be an int between 1 and 12.")
 
 
+# Minimal structural schema for the model's JSON payload.
+_MIN_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["query", "events", "dedupe_note", "coverage_notes", "last_updated"],
+    "properties": {
+        "query": {
+            "type": "object",
+            "required": ["timeframe"],
+            "properties": {
+                "timeframe": {
+                    "type": "object",
+                    "required": ["start", "end", "timezone"],
+                },
+            },
+        },
+        "events": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": [
+                    "event_id",
+                    "title",
+                    "institutions",
+                    "categories",
+                    "event_date",
+                    "summary",
+                    "reputational_damage",
+                    "sources",
+                    "source_count",
+                    "confidence",
+                ],
+                "properties": {
+                    "sources": {"type": "array", "minItems": 1},
+                },
+            },
+        },
+    },
+}
+
+# Compiled once at import; fastjsonschema generates a plain Python validator function.
+_MIN_SCHEMA_VALIDATOR = fastjsonschema.compile(_MIN_SCHEMA)
+
+
 def _validate_min_schema(payload: Dict[str, Any]) -> None:
     """
     Minimal structural validation of the returned JSON.
     Raises JSONStructureError with a helpful message on failure.
     """
-    required_top = ["query", "events", "dedupe_note", "coverage_notes", "last_updated"]
-    for k in required_top:
-        if k not in payload:
-            raise JSONStructureError(f"Missing top-level key: '{k}'.")
-
-    q = payload.get("query", {})
-    if "timeframe" not in q or not isinstance(q["timeframe"], dict):
-        raise JSONStructureError("query.timeframe missing or not an object.")
-    tf = q["timeframe"]
-    for dkey in ("start", "end", "timezone"):
-        if dkey not in tf:
-            raise JSONStructureError(f"query.timeframe.{dkey} is required.")
-
-    if not isinstance(payload["events"], list):
-        raise JSONStructureError("'events' must be a list.")
-
-    # Spot-check event fields if events exist
-    if payload["events"]:
-        sample = payload["events"][0]
-        for f in (
-            "event_id",
-            "title",
-            "institutions",
-            "categories",
-            "event_date",
-            "summary",
-            "reputational_damage",
-            "sources",
-            "source_count",
-            "confidence",
-        ):
-            if f not in sample:
-                raise JSONStructureError(f"events[*].{f} is required (missing in first event).")
-        if not isinstance(sample["sources"], list) or not sample["sources"]:
-            raise JSONStructureError("events[*].sources must be a non-empty list.")
+    try:
+        _MIN_SCHEMA_VALIDATOR(payload)
+    except fastjsonschema.JsonSchemaException as e:
+        raise JSONStructureError(f"Schema validation failed: {e.message}") from e
+
+
+# Multi-month variant: events are grouped per monthly window.
+_RANGE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["query", "events_by_window", "dedupe_note", "coverage_notes", "last_updated"],
+    "properties": {
+        "query": _MIN_SCHEMA["properties"]["query"],
+        "events_by_window": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["window", "events"],
+                "properties": {
+                    "window": {"type": "object", "required": ["start", "end"]},
+                    "events": _MIN_SCHEMA["properties"]["events"],
+                },
+            },
+        },
+    },
+}
+
+_RANGE_SCHEMA_VALIDATOR = fastjsonschema.compile(_RANGE_SCHEMA)
+
+
+def _validate_range_schema(payload: Dict[str, Any]) -> None:
+    """Structural validation of a multi-month payload; raises JSONStructureError."""
+    try:
+        _RANGE_SCHEMA_VALIDATOR(payload)
+    except fastjsonschema.JsonSchemaException as e:
+        raise JSONStructureError(f"Schema validation failed: {e.message}") from e
+
+
+def _split_range_payload(payload: Dict[str, Any],
+                         months: Sequence[Tuple[int, int]]) -> Dict[Tuple[int, int], Dict[str, Any]]:
+    """
+    Fan a validated multi-month payload out into single-month payloads.
+
+    Each result has the same shape as a fetch_negative_bank_events response, so
+    it can be stored and tabulated like any other month.
+    """
+    by_month = {}
+    for entry in payload["events_by_window"]:
+        start = str(entry["window"]["start"])
+        by_month[start[:7]] = entry["events"]
+
+    timezone_name = payload["query"]["timeframe"]["timezone"]
+    results = {}
+    for year, month in months:
+        events = by_month.get(f"{year:04d}-{month:02d}")
+        if events is None:
+            raise JSONStructureError(f"Response has no window for {year}-{month:02d}")
+        start_date, end_date = _month_window(year, month)
+        results[(year, month)] = {
+            "query": {
+                **payload["query"],
+                "timeframe": {"start": start_date, "end": end_date, "timezone": timezone_name},
+            },
+            "events": events,
+            "dedupe_note": payload["dedupe_note"],
+            "coverage_notes": payload["coverage_notes"],
+            "last_updated": payload["last_updated"],
+        }
+    return results
+
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    """Return the explicit key or the one from PERPLEXITY_API_KEY / PPLX_API_KEY."""
+    api_key = api_key or os.getenv("PERPLEXITY_API_KEY") or os.getenv("PPLX_API_KEY")
+    if not api_key:
+        raise ValueError("Missing API key. Set PERPLEXITY_API_KEY or PPLX_API_KEY, or pass api_key=...")
+    return api_key
+
+
+def _build_request_payload(model: str, prompt: str) -> Dict[str, Any]:
+    """Chat Completions request body for one research prompt."""
+    # We send both a System and a User message to maximize JSON-only compliance.
+    return {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": "You are a meticulous research assistant. Output valid JSON only."},
+            {"role": "user", "content": prompt},
+        ],
+        # Zero temperature to reduce creative drift; keep defaults conservative.
+        "temperature": 0,
+        "top_p": 1,
+        # REMOVED response_format as Perplexity doesn't support OpenAI's json_object type
+        # The JSON-only instruction in the prompt should be sufficient
+        # "response_format": {"type": "json_object"},  # <-- REMOVED THIS LINE
+        # Helpful for source auditing if your plan supports it:
+        "return_citations": True,
+        "stream": False,
+        # Guard rails in case the result is long.
+        "max_tokens": 4096,
+    }
+
+
+def _lookup_cached_response(cache_path: Optional[str], year: int, month: int, model: str,
+                            prompt: str) -> Tuple[Optional[_ResponseCache], str, Optional[Dict[str, Any]]]:
+    """Return (cache, cache_key, cached_payload); cached_payload is None on a miss or when caching is off."""
+    cache = _get_response_cache(cache_path) if cache_path else None
+    cache_key = _ResponseCache.make_key(year, month, model, prompt)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cache, cache_key, _loads(cached)
+    return cache, cache_key, None
+
+
+# Exponential back-off schedule (1.5 ** n seconds, capped at 30 s), indexed by attempt.
+_BACKOFFS = tuple(min(30.0, 1.5 ** i) for i in range(10))
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Jittered back-off for the given attempt, so concurrent retries don't fire in lockstep."""
+    return _BACKOFFS[min(attempt, len(_BACKOFFS) - 1)] * (0.5 + random.random())
+
+
+def _retry_delay(status_code: int, headers: Any, attempt: int, max_retries: int) -> Optional[float]:
+    """Seconds to wait before retrying a transient 429/5xx response, or None to stop retrying."""
+    if attempt >= max_retries:
+        return None
+    if status_code == 429:
+        # Rate limited: back off, but never retry sooner than Retry-After asks.
+        return max(_backoff_delay(attempt), _retry_after_seconds(headers) or 0.0)
+    if status_code >= 500:
+        return _backoff_delay(attempt)
+    return None
+
+
+def _parse_completion(status_code: int, body: bytes,
+                      validate: Callable[[Dict[str, Any]], None] = _validate_min_schema,
+                      *, headers: Any = None) -> Tuple[Dict[str, Any], str]:
+    """
+    Turn a final HTTP response into the validated payload.
+
+    Returns (data, json_text), where json_text is the (possibly repaired) JSON the
+    data was parsed from. Raises PerplexityAPIError (PerplexityTransientError for
+    429/5xx) or JSONStructureError.
+    """
+    if status_code != 200:
+        try:
+            detail = _loads(body)
+        except Exception:
+            detail = body.decode("utf-8", errors="replace")
+        message = f"Perplexity API error (HTTP {status_code}). Detail: {detail}"
+        if status_code == 429 or status_code >= 500:
+            raise PerplexityTransientError(message, _retry_after_seconds(headers))
+        raise PerplexityAPIError(message)
+
+    # Parse the Perplexity envelope
+    try:
+        # Parse the raw bytes directly; skips the decode-to-str pass.
+        envelope = _loads(body)
+    except json.JSONDecodeError as e:
+        raise PerplexityAPIError(f"Non-JSON HTTP body from API: {e}") from e
+
+    choices = envelope.get("choices")
+    if not choices or not isinstance(choices, list):
+        raise PerplexityAPIError("API response missing 'choices' list.")
+
+    message = choices[0].get("message", {})
+    content = message.get("content")
+    if not content or not isinstance(content, str):
+        raise PerplexityAPIError("API response missing message.content string.")
+
+    # Parse (and repair if needed) in one pass; the parsed object is reused below
+    json_text, data, was_repaired = _validate_and_repair_json(content)
+    if data is None:
+        # If repair failed, this is a JSONStructureError
+        raise JSONStructureError("Returned content is not valid JSON and could not be repaired.")
+    if was_repaired:
+        logger.info("  (JSON repaired successfully)")
+
+    # Minimal schema validation
+    validate(data)
+
+    return data, json_text
 
 
 def fetch_negative_bank_events(
@@ -321,6 +831,8 @@ def fetch_negative_bank_events(
     timeout: int = 90,
     max_retries: int = 3,
     api_key: Optional[str] = None,
+    rate_limiter: Optional[_RateLimiter] = None,
+    cache_path: Optional[str] = DEFAULT_CACHE_PATH,
 ) -> Dict[str, Any]:
     """
     Query Perplexity's Chat Completions API to retrieve structured JSON of major
@@ -340,6 +852,12 @@ def fetch_negative_bank_events(
         Number of automatic retries for transient 429/5xx responses.
     api_key : str, optional
         Perplexity API key. If None, reads from env var PERPLEXITY_API_KEY or PPLX_API_KEY.
+    rate_limiter : _RateLimiter, optional
+        Shared limiter consulted before every HTTP attempt (including retries),
+        so concurrent callers stay within the API's request rate.
+    cache_path : str, optional
+        SQLite file used to cache validated responses per (year, month, model, prompt).
+        A cache hit skips the API call entirely. Pass None to always query the API.
 
     Returns
     -------
@@ -362,110 +880,303 @@ def fetch_negative_bank_events(
     - Set your API key in the environment as PERPLEXITY_API_KEY (preferred) or PPLX_API_KEY, or pass `api_key=...`.
     """
     _validate_params(year, month)
-    api_key = api_key or os.getenv("PERPLEXITY_API_KEY") or os.getenv("PPLX_API_KEY")
-    if not api_key:
-        raise ValueError("Missing API key. Set PERPLEXITY_API_KEY or PPLX_API_KEY, or pass api_key=...")
-
     prompt = _build_prompt(year, month)
 
-    url = "https://api.perplexity.ai/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-        # Perplexity is OpenAI-compatible; keep UA minimal & clear for traceability.
-        "User-Agent": "research-client/1.0",
-    }
+    # Serve previously validated responses from the on-disk cache
+    cache, cache_key, cached = _lookup_cached_response(cache_path, year, month, model, prompt)
+    if cached is not None:
+        return cached
 
-    # We send both a System and a User message to maximize JSON-only compliance.
-    payload = {
-        "model": model,
-        "messages": [
-            {"role": "system", "content": "You are a meticulous research assistant. Output valid JSON only."},
-            {"role": "user", "content": prompt},
-        ],
-        # Zero temperature to reduce creative drift; keep defaults conservative.
-        "temperature": 0,
-        "top_p": 1,
-        # REMOVED response_format as Perplexity doesn't support OpenAI's json_object type
-        # The JSON-only instruction in the prompt should be sufficient
-        # "response_format": {"type": "json_object"},  # <-- REMOVED THIS LINE
-        # Helpful for source auditing if your plan supports it:
-        "return_citations": True,
-        "stream": False,
-        # Guard rails in case the result is long.
-        "max_tokens": 4096,
-    }
+    # Content-Type and User-Agent are set on the shared session; only the key is per-call.
+    headers = {"Authorization": f"Bearer {_resolve_api_key(api_key)}"}
+    # Serialized once (as UTF-8 bytes) and re-sent unchanged on retries.
+    body = _dumps(_build_request_payload(model, prompt))
 
-    # Simple retry loop with exponential backoff for transient errors.
-    backoff = 1.5
+    # Simple retry loop with jittered exponential backoff for transient errors.
     attempt = 0
     while True:
         attempt += 1
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        started = time.monotonic()
         try:
-            resp = requests.post(url, headers=headers, json=payload, timeout=timeout)
+            resp = _get_session().post(PERPLEXITY_API_URL, headers=headers, data=body, timeout=timeout)
         except requests.Timeout as e:
             if attempt < max_retries:
-                time.sleep(backoff ** attempt)
+                time.sleep(_backoff_delay(attempt))
                 continue
-            raise PerplexityAPIError(f"Request timed out after {attempt} attempt(s): {e}") from e
+            raise PerplexityTransientError(f"Request timed out after {attempt} attempt(s): {e}") from e
         except requests.RequestException as e:
             # Network-level errors (DNS, SSL, connection reset, etc.)
-            raise PerplexityAPIError(f"Network error calling Perplexity API: {e}") from e
+            raise PerplexityTransientError(f"Network error calling Perplexity API: {e}") from e
 
-        # HTTP status handling
-        if resp.status_code == 429 and attempt < max_retries:
-            # Rate limited: honor Retry-After if present, else exponential backoff.
-            retry_after = float(resp.headers.get("Retry-After", backoff ** attempt))
-            time.sleep(retry_after)
-            continue
-        if resp.status_code >= 500 and attempt < max_retries:
-            time.sleep(backoff ** attempt)
+        if rate_limiter is not None:
+            rate_limiter.observe(resp.status_code, resp.headers, time.monotonic() - started)
+
+        delay = _retry_delay(resp.status_code, resp.headers, attempt, max_retries)
+        if delay is not None:
+            time.sleep(delay)
             continue
-        if resp.status_code != 200:
-            try:
-                detail = resp.json()
-            except Exception:
-                detail = resp.text
-            raise PerplexityAPIError(
-                f"Perplexity API error (HTTP {resp.status_code}). Detail: {detail}"
-            )
 
-        # Parse the Perplexity envelope
-        try:
-            envelope = resp.json()
-        except json.JSONDecodeError as e:
-            raise PerplexityAPIError(f"Non-JSON HTTP body from API: {e}") from e
+        data, json_text = _parse_completion(resp.status_code, resp.content, headers=resp.headers)
 
-        choices = envelope.get("choices")
-        if not choices or not isinstance(choices, list):
-            raise PerplexityAPIError("API response missing 'choices' list.")
+        if cache is not None:
+            cache.put(cache_key, json_text.encode("utf-8"))
 
-        message = choices[0].get("message", {})
-        content = message.get("content")
-        if not content or not isinstance(content, str):
-            raise PerplexityAPIError("API response missing message.content string.")
+        return data
 
-        # Try to parse and repair JSON if needed
-        json_text, was_repaired = _validate_and_repair_json(content)
-        
+
+def _new_async_client() -> httpx.AsyncClient:
+    """HTTP/2 client for Perplexity; concurrent requests multiplex over one TLS connection."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=8, keepalive_expiry=60),
+        headers={
+            "Content-Type": "application/json",
+            "User-Agent": "research-client/1.0",
+        },
+    )
+
+
+async def _post_completion_async(
+    client: httpx.AsyncClient,
+    prompt: str,
+    *,
+    model: str,
+    timeout: int,
+    max_retries: int,
+    api_key: Optional[str],
+    rate_limiter: Optional[_RateLimiter],
+    validate: Callable[[Dict[str, Any]], None] = _validate_min_schema,
+) -> Tuple[Dict[str, Any], str]:
+    """POST one prompt with retries for transient errors; returns (data, json_text)."""
+    headers = {"Authorization": f"Bearer {_resolve_api_key(api_key)}"}
+    # Serialized once (as UTF-8 bytes) and re-sent unchanged on retries.
+    body = _dumps(_build_request_payload(model, prompt))
+
+    attempt = 0
+    while True:
+        attempt += 1
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async()
+        started = time.monotonic()
         try:
-            data = json.loads(json_text)
-            if was_repaired:
-                print(f"  (JSON repaired successfully)")
-        except json.JSONDecodeError as e:
-            # If repair failed, this is a JSONStructureError
-            raise JSONStructureError(f"Returned content is not valid JSON and could not be repaired: {e}") from e
+            resp = await client.post(PERPLEXITY_API_URL, headers=headers, content=body, timeout=timeout)
+        except httpx.TimeoutException as e:
+            if attempt < max_retries:
+                await asyncio.sleep(_backoff_delay(attempt))
+                continue
+            raise PerplexityTransientError(f"Request timed out after {attempt} attempt(s): {e}") from e
+        except httpx.HTTPError as e:
+            # Network-level errors (DNS, SSL, connection reset, etc.)
+            raise PerplexityTransientError(f"Network error calling Perplexity API: {e}") from e
 
-        # Minimal schema validation
-        _validate_min_schema(data)
+        if rate_limiter is not None:
+            rate_limiter.observe(resp.status_code, resp.headers, time.monotonic() - started)
+
+        delay = _retry_delay(resp.status_code, resp.headers, attempt, max_retries)
+        if delay is not None:
+            await asyncio.sleep(delay)
+            continue
+
+        return _parse_completion(resp.status_code, resp.content, validate, headers=resp.headers)
 
-        return data
+
+async def fetch_negative_bank_events_async(
+    year: int,
+    month: int,
+    *,
+    client: httpx.AsyncClient,
+    model: str = "sonar-pro",
+    timeout: int = 90,
+    max_retries: int = 3,
+    api_key: Optional[str] = None,
+    rate_limiter: Optional[_RateLimiter] = None,
+    cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+) -> Dict[str, Any]:
+    """
+    Async counterpart of fetch_negative_bank_events using a shared httpx.AsyncClient.
+
+    Takes the same arguments (plus `client`), returns the same payload and raises the
+    same exceptions. Retry back-off and rate limiting wait with asyncio.sleep, so other
+    months keep making progress on the event loop.
+    """
+    _validate_params(year, month)
+    prompt = _build_prompt(year, month)
+
+    cache, cache_key, cached = _lookup_cached_response(cache_path, year, month, model, prompt)
+    if cached is not None:
+        return cached
+
+    data, json_text = await _post_completion_async(
+        client, prompt, model=model, timeout=timeout, max_retries=max_retries,
+        api_key=api_key, rate_limiter=rate_limiter,
+    )
+
+    if cache is not None:
+        cache.put(cache_key, json_text.encode("utf-8"))
+
+    return data
+
+
+async def fetch_negative_bank_events_range_async(
+    months: Sequence[Tuple[int, int]],
+    *,
+    client: httpx.AsyncClient,
+    model: str = "sonar-pro",
+    timeout: int = 180,
+    max_retries: int = 3,
+    api_key: Optional[str] = None,
+    rate_limiter: Optional[_RateLimiter] = None,
+    cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+) -> Dict[Tuple[int, int], Dict[str, Any]]:
+    """
+    Fetch several consecutive months with a single API call.
+
+    Returns a dict mapping (year, month) to a payload shaped like the
+    fetch_negative_bank_events result. Raises JSONStructureError if the model
+    omits a window, plus the errors of fetch_negative_bank_events_async.
+    """
+    months = tuple(months)
+    if not months:
+        raise ValueError("months must not be empty.")
+    for year, month in months:
+        _validate_params(year, month)
+    prompt = _build_prompt_range(months)
+    first_year, first_month = months[0]
+
+    cache, cache_key, cached = _lookup_cached_response(cache_path, first_year, first_month, model, prompt)
+    if cached is not None:
+        return _split_range_payload(cached, months)
+
+    data, json_text = await _post_completion_async(
+        client, prompt, model=model, timeout=timeout, max_retries=max_retries,
+        api_key=api_key, rate_limiter=rate_limiter, validate=_validate_range_schema,
+    )
+    # Split before caching so a payload with missing windows is never stored
+    results = _split_range_payload(data, months)
+
+    if cache is not None:
+        cache.put(cache_key, json_text.encode("utf-8"))
+
+    return results
+
+
+def fetch_negative_bank_events_range(months: Sequence[Tuple[int, int]],
+                                     **kwargs: Any) -> Dict[Tuple[int, int], Dict[str, Any]]:
+    """Synchronous wrapper around fetch_negative_bank_events_range_async with its own client."""
+    async def run() -> Dict[Tuple[int, int], Dict[str, Any]]:
+        async with _new_async_client() as client:
+            return await fetch_negative_bank_events_range_async(months, client=client, **kwargs)
+    return asyncio.run(run())
 
 import json
 import pandas as pd
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+# Output columns of json_to_bank_events_table, in order.
+_EVENT_COLUMNS = [
+    "query_start_date", "query_end_date", "query_timezone", "data_last_updated",
+    "event_id", "title", "event_date", "institutions", "parent_company", 
+    "us_operations", "jurisdictions", "categories", "reported_dates", "summary",
+    "damage_nature", "materiality_score", "fine_usd", "customers_affected",
+    "service_disruption_hours", "executive_changes", "litigation_status",
+    "regulators_involved", "penalties_usd", "settlements_usd", "other_amounts_usd",
+    "amounts_original_text", "total_financial_impact_usd", "source_count",
+    "primary_source_title", "primary_source_publisher", "primary_source_url",
+    "primary_source_date", "primary_source_type", "all_source_urls", 
+    "source_types", "confidence"
+]
+
+# Event field path -> (output column, default when the key is missing). Read
+# from the raw events like event.get(...) chains, so an explicit null stays
+# None while a missing key gets the default (flattening can't tell them apart)
+_EVENT_FIELD_MAP = {
+    ("event_id",): ("event_id", ""),
+    ("title",): ("title", ""),
+    ("event_date",): ("event_date", ""),
+    ("parent_company",): ("parent_company", ""),
+    ("us_operations",): ("us_operations", False),
+    ("summary",): ("summary", ""),
+    ("reputational_damage", "materiality_score"): ("materiality_score", 0),
+    ("reputational_damage", "drivers", "customers_affected"): ("customers_affected", None),
+    ("reputational_damage", "drivers", "service_disruption_hours"): ("service_disruption_hours", None),
+    ("reputational_damage", "drivers", "executive_changes"): ("executive_changes", False),
+    ("reputational_damage", "drivers", "litigation_status"): ("litigation_status", ""),
+    ("amounts", "original_text"): ("amounts_original_text", ""),
+    ("source_count",): ("source_count", 0),
+    ("confidence",): ("confidence", ""),
+}
+
+# List-valued fields joined with "; " into a single text column
+_EVENT_LIST_FIELDS = {
+    "institutions": "institutions",
+    "jurisdictions": "jurisdictions",
+    "categories": "categories",
+    "reported_dates": "reported_dates",
+    "reputational_damage_nature": "damage_nature",
+    "reputational_damage_drivers_regulator_involved": "regulators_involved",
+}
+
+# Amount fields coerced to float (invalid/null -> 0.0)
+_EVENT_AMOUNT_FIELDS = {
+    "reputational_damage_drivers_fine_usd": "fine_usd",
+    "amounts_penalties_usd": "penalties_usd",
+    "amounts_settlements_usd": "settlements_usd",
+    "amounts_other_amounts_usd": "other_amounts_usd",
+}
+
+
+def _event_field(event: Dict[str, Any], path: Tuple[str, ...], default: Any) -> Any:
+    """Value at a nested key path of an event, or the default when a key is missing."""
+    value: Any = event
+    for key in path[:-1]:
+        value = value.get(key, {})
+        if not isinstance(value, dict):
+            return default
+    return value.get(path[-1], default)
+
+
+def _join_list(value: Any) -> str:
+    """Join a list of strings with '; ' (non-lists become '')."""
+    if isinstance(value, list):
+        return "; ".join(str(v) for v in value if v is not None)
+    return value if isinstance(value, str) else ""
+
+
+def _source_fields(sources: Any) -> Dict[str, str]:
+    """Summarize an event's sources list into the primary_source_* / all-source columns."""
+    if not isinstance(sources, list) or not sources:
+        return {
+            "primary_source_title": "",
+            "primary_source_publisher": "",
+            "primary_source_url": "",
+            "primary_source_date": "",
+            "primary_source_type": "",
+            "all_source_urls": "",
+            "source_types": "",
+        }
+    primary = sources[0] if isinstance(sources[0], dict) else {}
+    source_dicts = [s for s in sources if isinstance(s, dict)]
+    # Unique source types in first-seen order
+    source_types = dict.fromkeys(s["source_type"] for s in source_dicts if s.get("source_type"))
+    return {
+        "primary_source_title": primary.get("title", ""),
+        "primary_source_publisher": primary.get("publisher", ""),
+        "primary_source_url": primary.get("url", ""),
+        "primary_source_date": primary.get("date_published", ""),
+        "primary_source_type": primary.get("source_type", ""),
+        "all_source_urls": "; ".join(s.get("url", "") for s in source_dicts),
+        "source_types": "; ".join(source_types),
+    }
+
+
+def _valid_events(json_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """The event objects of one payload (non-dict entries are dropped)."""
+    return [e for e in json_data.get("events", []) if isinstance(e, dict)]
+
+
 def json_to_bank_events_table(json_data: Dict[str, Any]) -> pd.DataFrame:
     """
     Convert the bank events JSON structure to a pandas DataFrame.
@@ -480,148 +1191,77 @@ def json_to_bank_events_table(json_data: Dict[str, Any]) -> pd.DataFrame:
     pd.DataFrame
         A structured table with one row per event containing all relevant fields
     """
-    
-    # Extract metadata
-    query_info = json_data.get("query", {})
-    timeframe = query_info.get("timeframe", {})
-    last_updated = json_data.get("last_updated", "")
-    
-    # Initialize list to store flattened records
-    records = []
-    
-    # Helper to coerce possibly-null/invalid numeric values to a number
-    def _num(value: Any) -> float:
-        if isinstance(value, (int, float)):
-            return float(value)
-        try:
-            # Try parse strings like "123.45"
-            return float(value)
-        except Exception:
-            return 0.0
+    return _events_table([json_data])
 
-    # Process each event
-    for event in json_data.get("events", []):
-        record = {}
-        
-        # Query metadata (same for all events in a single query)
-        record["query_start_date"] = timeframe.get("start", "")
-        record["query_end_date"] = timeframe.get("end", "")
-        record["query_timezone"] = timeframe.get("timezone", "")
-        record["data_last_updated"] = last_updated
-        
-        # Event basic information
-        record["event_id"] = event.get("event_id", "")
-        record["title"] = event.get("title", "")
-        record["event_date"] = event.get("event_date", "")
-        
-        # Institutions (join multiple with semicolon)
-        institutions = event.get("institutions", [])
-        record["institutions"] = "; ".join(institutions) if institutions else ""
-        record["parent_company"] = event.get("parent_company", "")
-        record["us_operations"] = event.get("us_operations", False)
-        
-        # Jurisdictions and categories (join multiple with semicolon)
-        jurisdictions = event.get("jurisdictions", [])
-        record["jurisdictions"] = "; ".join(jurisdictions) if jurisdictions else ""
-        
-        categories = event.get("categories", [])
-        record["categories"] = "; ".join(categories) if categories else ""
-        
-        # Reported dates (join multiple with semicolon)
-        reported_dates = event.get("reported_dates", [])
-        record["reported_dates"] = "; ".join(reported_dates) if reported_dates else ""
-        
-        # Summary
-        record["summary"] = event.get("summary", "")
-        
-        # Reputational damage
-        rep_damage = event.get("reputational_damage", {})
-        
-        # Nature of damage (join multiple with semicolon)
-        nature = rep_damage.get("nature", [])
-        record["damage_nature"] = "; ".join(nature) if nature else ""
-        record["materiality_score"] = rep_damage.get("materiality_score", 0)
-        
-        # Drivers
-        drivers = rep_damage.get("drivers", {})
-        record["fine_usd"] = _num(drivers.get("fine_usd"))
-        record["customers_affected"] = drivers.get("customers_affected", None)
-        record["service_disruption_hours"] = drivers.get("service_disruption_hours", None)
-        record["executive_changes"] = drivers.get("executive_changes", False)
-        record["litigation_status"] = drivers.get("litigation_status", "")
-        
-        # Regulators (join multiple with semicolon)
-        regulators = drivers.get("regulator_involved", [])
-        record["regulators_involved"] = "; ".join(regulators) if regulators else ""
-        
-        # Amounts
-        amounts = event.get("amounts", {})
-        record["penalties_usd"] = _num(amounts.get("penalties_usd"))
-        record["settlements_usd"] = _num(amounts.get("settlements_usd"))
-        record["other_amounts_usd"] = _num(amounts.get("other_amounts_usd"))
-        record["amounts_original_text"] = amounts.get("original_text", "")
-        
-        # Calculate total financial impact
-        record["total_financial_impact_usd"] = (
-            float(record["penalties_usd"]) +
-            float(record["settlements_usd"]) +
-            float(record["other_amounts_usd"])
+
+def _events_table(payloads: Sequence[Dict[str, Any]],
+                  periods: Optional[Sequence[Tuple[int, int]]] = None) -> pd.DataFrame:
+    """
+    Build one events table from several payloads in a single pass.
+    
+    All events are flattened together, so there is one DataFrame build instead
+    of a frame per payload plus a concat. When `periods` (one (year, month) per
+    payload) is given, 'year' and 'month' columns are added in front.
+    """
+    events: List[Dict[str, Any]] = []
+    # Per-row query metadata (the same for all events of one payload)
+    meta_rows: List[Tuple[Any, ...]] = []
+    for i, json_data in enumerate(payloads):
+        payload_events = _valid_events(json_data)
+        if not payload_events:
+            continue
+        timeframe = json_data.get("query", {}).get("timeframe", {})
+        meta = (
+            timeframe.get("start", ""),
+            timeframe.get("end", ""),
+            timeframe.get("timezone", ""),
+            json_data.get("last_updated", ""),
         )
-        
-        # Sources information
-        sources = event.get("sources", [])
-        record["source_count"] = event.get("source_count", 0)
-        
-        # Aggregate source information
-        if sources:
-            # Primary source (first one)
-            primary_source = sources[0]
-            record["primary_source_title"] = primary_source.get("title", "")
-            record["primary_source_publisher"] = primary_source.get("publisher", "")
-            record["primary_source_url"] = primary_source.get("url", "")
-            record["primary_source_date"] = primary_source.get("date_published", "")
-            record["primary_source_type"] = primary_source.get("source_type", "")
-            
-            # All source URLs (for reference)
-            all_urls = [s.get("url", "") for s in sources]
-            record["all_source_urls"] = "; ".join(all_urls)
-            
-            # Source types present
-            source_types = list(set([s.get("source_type", "") for s in sources if s.get("source_type")]))
-            record["source_types"] = "; ".join(source_types)
-        else:
-            record["primary_source_title"] = ""
-            record["primary_source_publisher"] = ""
-            record["primary_source_url"] = ""
-            record["primary_source_date"] = ""
-            record["primary_source_type"] = ""
-            record["all_source_urls"] = ""
-            record["source_types"] = ""
-        
-        # Confidence
-        record["confidence"] = event.get("confidence", "")
-        
-        # Add record to list
-        records.append(record)
+        if periods is not None:
+            meta = periods[i] + meta
+        events.extend(payload_events)
+        meta_rows.extend([meta] * len(payload_events))
     
-    # Create DataFrame
-    df = pd.DataFrame(records)
+    output_columns = (['year', 'month'] if periods is not None else []) + _EVENT_COLUMNS
     
     # If no events, create empty DataFrame with all columns
-    if len(records) == 0:
-        columns = [
-            "query_start_date", "query_end_date", "query_timezone", "data_last_updated",
-            "event_id", "title", "event_date", "institutions", "parent_company", 
-            "us_operations", "jurisdictions", "categories", "reported_dates", "summary",
-            "damage_nature", "materiality_score", "fine_usd", "customers_affected",
-            "service_disruption_hours", "executive_changes", "litigation_status",
-            "regulators_involved", "penalties_usd", "settlements_usd", "other_amounts_usd",
-            "amounts_original_text", "total_financial_impact_usd", "source_count",
-            "primary_source_title", "primary_source_publisher", "primary_source_url",
-            "primary_source_date", "primary_source_type", "all_source_urls", 
-            "source_types", "confidence"
-        ]
-        df = pd.DataFrame(columns=columns)
+    if not events:
+        return pd.DataFrame(columns=output_columns)
+    
+    # Flatten nested objects (reputational_damage.drivers.*, amounts.*) in one pass
+    flat = pd.json_normalize(events, sep="_", max_level=3)
+    n = len(flat)
+    missing = pd.Series([None] * n, index=flat.index, dtype=object)
+    
+    meta_names = ["query_start_date", "query_end_date", "query_timezone", "data_last_updated"]
+    if periods is not None:
+        meta_names = ['year', 'month'] + meta_names
+    columns: Dict[str, Any] = dict(zip(meta_names, map(list, zip(*meta_rows))))
+    
+    for path, (dst, default) in _EVENT_FIELD_MAP.items():
+        columns[dst] = pd.Series([_event_field(e, path, default) for e in events], index=flat.index)
+    
+    for src, dst in _EVENT_LIST_FIELDS.items():
+        columns[dst] = flat.get(src, missing).map(_join_list)
+    
+    for src, dst in _EVENT_AMOUNT_FIELDS.items():
+        columns[dst] = pd.to_numeric(flat.get(src, missing), errors='coerce').fillna(0.0).astype(float)
+    
+    # Calculate total financial impact
+    columns["total_financial_impact_usd"] = (
+        columns["penalties_usd"] + columns["settlements_usd"] + columns["other_amounts_usd"]
+    )
+    
+    # Sources information
+    source_rows = pd.DataFrame.from_records(
+        flat.get("sources", missing).map(_source_fields).tolist(), index=flat.index
+    )
+    for col in source_rows.columns:
+        columns[col] = source_rows[col]
+    
+    # Build in output order straight from the column arrays; copy=False skips the
+    # defensive copy of every input Series (and the reselection copy after it)
+    df = pd.DataFrame({col: columns[col] for col in output_columns}, index=flat.index, copy=False)
     
     # Convert date columns to datetime (timezone-naive for Excel compatibility)
     date_columns = ["query_start_date", "query_end_date", "event_date", "primary_source_date"]
@@ -650,6 +1290,22 @@ def json_to_bank_events_table(json_data: Dict[str, Any]) -> pd.DataFrame:
     return df
 
 
+def _estimate_column_width(series: pd.Series) -> int:
+    """Display width for an Excel column: fixed for numbers/dates, longest value for text."""
+    if pd.api.types.is_bool_dtype(series):
+        return 5
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return 19
+    if pd.api.types.is_numeric_dtype(series):
+        return 12
+    try:
+        # Vectorized length; non-string cells (None, lists, ...) count as empty
+        longest = series.str.len().max()
+    except AttributeError:
+        longest = series.astype(str).str.len().max()
+    return 0 if pd.isna(longest) else int(longest)
+
+
 def save_to_excel(df: pd.DataFrame, filename: str = "bank_events.xlsx") -> None:
     """
     Save the DataFrame to an Excel file with formatting.
@@ -666,256 +1322,523 @@ def save_to_excel(df: pd.DataFrame, filename: str = "bank_events.xlsx") -> None:
         
         # Auto-adjust column widths
         worksheet = writer.sheets['Bank Events']
-        for column in df:
-            column_width = max(df[column].astype(str).map(len).max(), len(column))
+        for col_idx, column in enumerate(df.columns, 1):
+            column_width = max(_estimate_column_width(df[column]), len(str(column)))
             column_width = min(column_width, 50)  # Cap at 50 characters
-            col_idx = df.columns.get_loc(column)
-            worksheet.column_dimensions[chr(65 + col_idx % 26)].width = column_width + 2
+            worksheet.column_dimensions[get_column_letter(col_idx)].width = column_width + 2
+
+
+def save_to_parquet(df: pd.DataFrame, filename: str = "bank_events.parquet") -> None:
+    """
+    Save the DataFrame to a Snappy-compressed Parquet file (requires pyarrow).
+    
+    Much faster and smaller than save_to_excel, and keeps the column dtypes
+    (categoricals, datetimes, bytes) intact on reload with pd.read_parquet.
+    
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame to save
+    filename : str
+        Output filename (default: "bank_events.parquet")
+    """
+    df.to_parquet(filename, engine="pyarrow", compression="snappy", index=False)
+
+def _split_value_counts(series: pd.Series, sep: str = "; ") -> pd.Series:
+    """Count the individual values in a column of `sep`-joined strings."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # fillna("") would need "" to be a category; plain labels are enough here
+        series = series.astype(object)
+    values = series.fillna("").astype(str).str.split(sep).explode()
+    return values[values != ""].value_counts()
+
 
 def print_summary_stats(df: pd.DataFrame) -> None:
     """
     Print summary statistics about the bank events data.
     
+    The report is assembled in memory and written to stdout in one call.
+    
     Parameters
     ----------
     df : pd.DataFrame
         The bank events DataFrame
     """
-    print("\n=== BANK EVENTS SUMMARY STATISTICS ===\n")
-    print(f"Total events: {len(df)}")
+    lines: List[str] = ["\n=== BANK EVENTS SUMMARY STATISTICS ===\n", f"Total events: {len(df)}"]
     
     if len(df) > 0:
-        print(f"\nDate range: {df['event_date'].min()} to {df['event_date'].max()}")
+        lines.append(f"\nDate range: {df['event_date'].min()} to {df['event_date'].max()}")
         
-        print(f"\n--- Financial Impact ---")
-        print(f"Total penalties: ${df['penalties_usd'].sum():,.2f}")
-        print(f"Total settlements: ${df['settlements_usd'].sum():,.2f}")
-        print(f"Total other amounts: ${df['other_amounts_usd'].sum():,.2f}")
-        print(f"Total financial impact: ${df['total_financial_impact_usd'].sum():,.2f}")
+        lines.append(f"\n--- Financial Impact ---")
+        lines.append(f"Total penalties: ${df['penalties_usd'].sum():,.2f}")
+        lines.append(f"Total settlements: ${df['settlements_usd'].sum():,.2f}")
+        lines.append(f"Total other amounts: ${df['other_amounts_usd'].sum():,.2f}")
+        lines.append(f"Total financial impact: ${df['total_financial_impact_usd'].sum():,.2f}")
         
-        print(f"\n--- Materiality Distribution ---")
+        lines.append(f"\n--- Materiality Distribution ---")
         materiality_counts = df['materiality_score'].value_counts().sort_index()
-        for score, count in materiality_counts.items():
-            print(f"  Score {score}: {count} event(s)")
+        lines.extend(f"  Score {score}: {count} event(s)" for score, count in materiality_counts.items())
         
-        print(f"\n--- Categories ---")
-        all_categories = []
-        for cat_str in df['categories']:
-            if cat_str:
-                all_categories.extend(cat_str.split("; "))
-        category_counts = pd.Series(all_categories).value_counts()
-        for category, count in category_counts.items():
-            print(f"  {category}: {count}")
+        lines.append(f"\n--- Categories ---")
+        category_counts = _split_value_counts(df['categories'])
+        lines.extend(f"  {category}: {count}" for category, count in category_counts.items())
         
-        print(f"\n--- Regulators Involved ---")
-        all_regulators = []
-        for reg_str in df['regulators_involved']:
-            if reg_str:
-                all_regulators.extend(reg_str.split("; "))
-        regulator_counts = pd.Series(all_regulators).value_counts()
-        for regulator, count in regulator_counts.items():
-            print(f"  {regulator}: {count}")
+        lines.append(f"\n--- Regulators Involved ---")
+        regulator_counts = _split_value_counts(df['regulators_involved'])
+        lines.extend(f"  {regulator}: {count}" for regulator, count in regulator_counts.items())
         
-        print(f"\n--- Litigation Status ---")
+        lines.append(f"\n--- Litigation Status ---")
         litigation_counts = df['litigation_status'].value_counts()
-        for status, count in litigation_counts.items():
-            if status:  # Skip empty strings
-                print(f"  {status}: {count}")
-                    
+        # Skip empty strings
+        lines.extend(f"  {status}: {count}" for status, count in litigation_counts.items() if status)
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+
 import json
 import pandas as pd
 from datetime import datetime
 from typing import List, Dict, Any
 import time
 
-def collect_all_bank_events(start_year: int = 2000, start_month: int = 1,
-                           end_year: int = 2025, end_month: int = 7,
-                           model: str = "sonar-pro",
-                           delay_seconds: float = 1.0) -> tuple[pd.DataFrame, pd.DataFrame]:
+def _encode_monthly_json(payload: Dict[str, Any]) -> bytes:
+    """Serialize a month's JSON payload to zlib-compressed UTF-8 bytes for monthly_df."""
+    # Level 1: these strings are highly repetitive, so even the fastest level shrinks them several-fold.
+    try:
+        raw = _dumps(payload)
+    except TypeError:
+        # orjson rejects a few values the stdlib accepts (e.g. integers beyond 64 bits)
+        raw = json.dumps(payload).encode("utf-8")
+    return zlib.compress(raw, 1)
+
+
+def decode_monthly_json(raw: bytes) -> Dict[str, Any]:
+    """Inverse of the monthly_df 'json_output' encoding: decompress and parse one row."""
+    return _loads(zlib.decompress(raw))
+
+
+def save_monthly_jsonl(monthly_df: pd.DataFrame,
+                       filename: str = "bank_reputation_monthly.jsonl.gz") -> None:
+    """
+    Write the full monthly JSON responses as gzip-compressed JSON Lines.
+    
+    One line per month: {"year": ..., "month": ..., "json_output": {...}}.
+    """
+    with gzip.open(filename, "wb", compresslevel=1) as f:
+        for year, month, raw in zip(monthly_df['year'], monthly_df['month'], monthly_df['json_output']):
+            # The stored bytes are already JSON; splice them in rather than re-parsing
+            f.write(b'{"year":%d,"month":%d,"json_output":' % (year, month))
+            f.write(zlib.decompress(raw))
+            f.write(b"}\n")
+
+
+# Low-cardinality labels stored as category codes in the combined events table.
+# Joined lists (institutions, categories, ...) are nearly unique per event, so
+# they stay plain object columns.
+_CATEGORY_COLUMNS = (
+    "query_timezone", "confidence", "litigation_status",
+    "primary_source_type", "primary_source_publisher",
+)
+
+# Free-text columns stored with pandas' dedicated string dtype
+_STRING_COLUMNS = (
+    "title", "summary", "amounts_original_text",
+    "primary_source_title", "primary_source_url", "all_source_urls",
+)
+
+
+def _compact_event_dtypes(events_df: pd.DataFrame) -> pd.DataFrame:
+    """Convert repeated labels to categoricals and free text to the string dtype, in place."""
+    for col in _CATEGORY_COLUMNS:
+        if col in events_df.columns:
+            events_df[col] = events_df[col].astype("category")
+    for col in _STRING_COLUMNS:
+        if col in events_df.columns:
+            events_df[col] = events_df[col].astype("string")
+    return events_df
+
+
+def _month_groups(months: Sequence[Tuple[int, int]], size: int) -> List[List[Tuple[int, int]]]:
+    """Split months into batches of at most `size` consecutive calendar months."""
+    groups: List[List[Tuple[int, int]]] = []
+    for year, month in months:
+        if groups and len(groups[-1]) < size:
+            last_year, last_month = groups[-1][-1]
+            if (last_year + last_month // 12, last_month % 12 + 1) == (year, month):
+                groups[-1].append((year, month))
+                continue
+        groups.append([(year, month)])
+    return groups
+
+
+# Exponential back-off with jitter between whole-fetch retries, capped at a minute
+_TRANSIENT_BACKOFF = wait_exponential_jitter(initial=1, max=60)
+
+
+def _transient_wait(retry_state: RetryCallState) -> float:
+    """Back-off for the next attempt, but never shorter than the server's Retry-After."""
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    retry_after = getattr(error, "retry_after", None) or 0.0
+    return max(_TRANSIENT_BACKOFF(retry_state), retry_after)
+
+
+@retry(
+    wait=_transient_wait,
+    stop=stop_after_attempt(6),
+    retry=retry_if_exception_type(PerplexityTransientError),
+    reraise=True,
+)
+async def _call_with_transient_retries(fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Await fetch(), re-running it when it fails with a transient API error.
+
+    This is the only retry layer for transient errors during collection, so
+    fetch() should make a single HTTP attempt (max_retries=1).
+    """
+    return await fetch()
+
+
+async def _fetch_with_retries(fetch: Callable[[], Awaitable[Any]], label: str,
+                             delay_seconds: float,
+                             max_retries_per_month: int = 2) -> Tuple[Optional[Any], Optional[str]]:
+    """
+    Run one fetch (a month or a batch of months), retrying malformed-JSON responses.
+
+    Returns:
+        Tuple of (result, error); exactly one of them is None.
+    """
+    retry_count = 0
+    while True:
+        try:
+            return await _call_with_transient_retries(fetch), None
+        except JSONStructureError as err:
+            retry_count += 1
+            if retry_count > max_retries_per_month:
+                return None, f"JSON error after {max_retries_per_month} retries: {err}"
+            logger.warning("  %s: JSON error, retrying %d/%d...", label, retry_count, max_retries_per_month)
+            await asyncio.sleep(delay_seconds * 2)  # Longer delay for retries
+        except (ValueError, PerplexityAPIError) as err:
+            return None, f"Error: {err}"
+
+
+async def collect_all_bank_events_async(start_year: int = 2000, start_month: int = 1,
+                                        end_year: int = 2025, end_month: int = 7,
+                                        model: str = "sonar-pro",
+                                        delay_seconds: float = 1.0,
+                                        max_concurrency: int = 8,
+                                        months_per_call: int = 3,
+                                        cache_path: Optional[str] = DEFAULT_CACHE_PATH) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Collect bank events for all months from start to end date.
     
+    All months share one HTTP/2 httpx.AsyncClient. An AIMD controller caps the number
+    of in-flight requests (up to `max_concurrency`, shrinking on 429/5xx and growing
+    back on fast successes) and a shared rate limiter keeps request starts at least
+    `delay_seconds` apart, pausing when the API reports its budget is exhausted. Consecutive months are requested `months_per_call` at a
+    time and split back into per-month results; a batch that keeps failing is
+    retried one month at a time.
+    
     Args:
         start_year: Starting year (default 2000)
         start_month: Starting month (default 1 for January)
         end_year: Ending year (default 2025)
         end_month: Ending month (default 7 for July)
         model: Perplexity model to use
-        delay_seconds: Delay between API calls to avoid rate limiting
+        delay_seconds: Minimum spacing between API requests to avoid rate limiting
+        max_concurrency: Upper bound on API requests in flight at the same time
+        months_per_call: Months covered by one API request (1 disables batching)
+        cache_path: SQLite response cache and per-month checkpoint; months already
+            collected for `model` are loaded instead of re-fetched, so an interrupted
+            run resumes where it stopped (None disables caching)
     
     Returns:
         Tuple of (monthly_df, events_df)
         - monthly_df: DataFrame with year, month, and JSON output columns
+          ('json_output' holds zlib-compressed JSON bytes; see decode_monthly_json)
         - events_df: DataFrame with one row per event
     """
     
-    # Initialize lists to store data
-    monthly_data = []
-    all_events = []
+    # Results keyed by (year, month); months finish out of order
+    monthly_data: Dict[Tuple[int, int], Dict[str, Any]] = {}
+    month_payloads: Dict[Tuple[int, int], Dict[str, Any]] = {}
     
     # Generate list of year-month pairs to iterate through
-    months_to_process = []
-    current_year = start_year
-    current_month = start_month
-    
-    while (current_year < end_year) or (current_year == end_year and current_month <= end_month):
-        months_to_process.append((current_year, current_month))
-        current_month += 1
-        if current_month > 12:
-            current_month = 1
-            current_year += 1
+    periods = pd.period_range(start=f"{start_year:04d}-{start_month:02d}",
+                              end=f"{end_year:04d}-{end_month:02d}", freq="M")
+    months_to_process = list(zip(periods.year.tolist(), periods.month.tolist()))
     
     total_months = len(months_to_process)
     print(f"Processing {total_months} months from {start_year}-{start_month:02d} to {end_year}-{end_month:02d}")
     print("=" * 60)
     
-    # Process each month
-    for idx, (year, month) in enumerate(months_to_process, 1):
-        print(f"Processing {year}-{month:02d} ({idx}/{total_months})...", end=" ")
-        
-        # Retry logic for API calls
-        max_retries_per_month = 2
-        retry_count = 0
-        result_json = None
-        
-        while retry_count <= max_retries_per_month:
-            try:
-                # Fetch data for current month
-                result_json = fetch_negative_bank_events(year, month, model=model)
-                break  # Success, exit retry loop
-                
-            except JSONStructureError as err:
-                retry_count += 1
-                if retry_count <= max_retries_per_month:
-                    print(f"  (JSON error, retrying {retry_count}/{max_retries_per_month})...")
-                    time.sleep(delay_seconds * 2)  # Longer delay for retries
-                    continue
-                else:
-                    print(f"✗ JSON error after {max_retries_per_month} retries: {err}")
-                    # Store empty/error entry for this month
-                    monthly_data.append({
-                        'year': year,
-                        'month': month,
-                        'json_output': json.dumps({"error": str(err), "events": []})
-                    })
-                    break
-                    
-            except (ValueError, PerplexityAPIError) as err:
-                print(f"✗ Error: {err}")
+    concurrency = _AimdConcurrency(max_concurrency)
+    rate_limiter = _RateLimiter(delay_seconds, concurrency)
+    completed = 0
+    fetched = 0  # Months that went to the API (checkpointed ones don't count towards the ETA)
+    collection_started = time.monotonic()
+    cache = _get_response_cache(cache_path) if cache_path else None
+    
+    def eta() -> str:
+        """Time left at the fetch rate so far, e.g. ', ETA 0:12:05'."""
+        if not fetched or completed >= total_months:
+            return ""
+        remaining = (time.monotonic() - collection_started) / fetched * (total_months - completed)
+        return f", ETA {timedelta(seconds=round(remaining))}"
+    
+    async with _new_async_client() as client:
+        def record_month(year: int, month: int, result_json: Optional[Dict[str, Any]],
+                         error: Optional[str], json_output: Optional[bytes] = None,
+                         elapsed: float = 0.0) -> None:
+            nonlocal completed, fetched
+            completed += 1
+            if json_output is None:
+                fetched += 1
+            
+            if result_json is None:
+                logger.warning("Processed %d-%02d (%d/%d): ✗ %s%s", year, month, completed, total_months,
+                               error, eta())
                 # Store empty/error entry for this month
-                monthly_data.append({
+                monthly_data[(year, month)] = {
                     'year': year,
                     'month': month,
-                    'json_output': json.dumps({"error": str(err), "events": []})
-                })
-                break
-        
-        # Process successful result
-        if result_json is not None:
+                    'json_output': _encode_monthly_json({"error": error, "events": []})
+                }
+                return
+            
+            if json_output is None:
+                json_output = _encode_monthly_json(result_json)  # Compressed JSON bytes
+                # Checkpoint successful months as soon as they arrive
+                if cache is not None:
+                    cache.put_month(year, month, model, json_output)
+            
             # Store monthly JSON data
-            monthly_data.append({
+            monthly_data[(year, month)] = {
                 'year': year,
                 'month': month,
-                'json_output': json.dumps(result_json)  # Store as JSON string
-            })
-            
-            # Convert to events DataFrame and add to all_events
-            month_events_df = json_to_bank_events_table(result_json)
-            if not month_events_df.empty:
-                # Add year and month columns for tracking
-                month_events_df['year'] = year
-                month_events_df['month'] = month
-                all_events.append(month_events_df)
+                'json_output': json_output
+            }
             
-            print(f"✓ Found {len(month_events_df)} events")
+            # Events are tabulated for all months at once after collection
+            month_payloads[(year, month)] = result_json
             
-            # Add delay between API calls to avoid rate limiting
-            if idx < total_months:  # Don't delay after the last request
-                time.sleep(delay_seconds)
+            logger.info("Processed %d-%02d (%d/%d): ✓ Found %d events in %.2fs%s", year, month, completed,
+                        total_months, len(_valid_events(result_json)), elapsed, eta())
+        
+        async def process_month(year: int, month: int) -> None:
+            async with concurrency.slot():
+                started = time.monotonic()
+                result_json, error = await _fetch_with_retries(
+                    lambda: fetch_negative_bank_events_async(
+                        year, month, client=client, model=model, max_retries=1,
+                        rate_limiter=rate_limiter, cache_path=cache_path,
+                    ),
+                    f"{year}-{month:02d}", delay_seconds,
+                )
+            record_month(year, month, result_json, error, elapsed=time.monotonic() - started)
+        
+        async def process_group(group: List[Tuple[int, int]]) -> None:
+            if len(group) > 1:
+                async with concurrency.slot():
+                    started = time.monotonic()
+                    results, error = await _fetch_with_retries(
+                        lambda: fetch_negative_bank_events_range_async(
+                            group, client=client, model=model, max_retries=1,
+                            rate_limiter=rate_limiter, cache_path=cache_path,
+                        ),
+                        f"{group[0][0]}-{group[0][1]:02d}..{group[-1][0]}-{group[-1][1]:02d}", delay_seconds,
+                    )
+                if results is not None:
+                    for year, month in group:
+                        record_month(year, month, results[(year, month)], None, elapsed=time.monotonic() - started)
+                    return
+                logger.warning("  Batch starting %d-%02d failed (%s); fetching months individually",
+                               group[0][0], group[0][1], error)
+            await asyncio.gather(*(process_month(year, month) for year, month in group))
+        
+        # Resume: months checkpointed by an earlier run are not fetched again
+        checkpointed = cache.get_months(model) if cache is not None else {}
+        pending = []
+        for year, month in months_to_process:
+            json_output = checkpointed.get((year, month))
+            if json_output is None:
+                pending.append((year, month))
+            else:
+                record_month(year, month, decode_monthly_json(json_output), None, json_output)
+        
+        groups = _month_groups(pending, max(1, months_per_call))
+        await asyncio.gather(*(process_group(group) for group in groups))
     
     print("=" * 60)
     print("Data collection complete!")
     
-    # Create monthly DataFrame
-    monthly_df = pd.DataFrame(monthly_data)
-    
-    # Create events DataFrame
-    if all_events:
-        # Filter out empty DataFrames to avoid FutureWarning
-        non_empty_events = [df for df in all_events if not df.empty]
-        if non_empty_events:
-            events_df = pd.concat(non_empty_events, ignore_index=True)
-            # Reorder columns to put year and month first
-            cols = ['year', 'month'] + [col for col in events_df.columns if col not in ['year', 'month']]
-            events_df = events_df[cols]
-        else:
-            # If all DataFrames were empty, create empty DataFrame with expected columns
-            events_df = pd.DataFrame(columns=['year', 'month', 'date', 'bank', 'event_type', 
-                                             'description', 'severity', 'link'])
-    else:
-        # Create empty DataFrame with expected columns if no events found
-        events_df = pd.DataFrame(columns=['year', 'month', 'date', 'bank', 'event_type', 
-                                         'description', 'severity', 'link'])
+    # Read results back in chronological order (one constructor call)
+    monthly_df = pd.DataFrame([monthly_data[key] for key in months_to_process])
+    collected = [key for key in months_to_process if key in month_payloads]
+    
+    # Create events DataFrame from all months' events in one build (no per-month frames)
+    events_df = _events_table([month_payloads[key] for key in collected], collected)
+    if not events_df.empty:
+        # Categories are built over the whole table so every month shares one set of codes
+        _compact_event_dtypes(events_df)
     
     return monthly_df, events_df
 
 
+def collect_all_bank_events(start_year: int = 2000, start_month: int = 1,
+                           end_year: int = 2025, end_month: int = 7,
+                           model: str = "sonar-pro",
+                           delay_seconds: float = 1.0,
+                           max_workers: int = 8,
+                           months_per_call: int = 3,
+                           cache_path: Optional[str] = DEFAULT_CACHE_PATH) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Synchronous entry point for collect_all_bank_events_async.
+    
+    `max_workers` is the number of API requests in flight at once. Must not be called
+    from a running event loop (e.g. inside Jupyter); await
+    collect_all_bank_events_async there instead.
+    """
+    return asyncio.run(collect_all_bank_events_async(
+        start_year, start_month, end_year, end_month,
+        model=model,
+        delay_seconds=delay_seconds,
+        max_concurrency=max_workers,
+        months_per_call=months_per_call,
+        cache_path=cache_path,
+    ))
+
+
+def _excel_cell(value: Any) -> Any:
+    """Cell value for xlsxwriter; missing values (None/NaN/NaT/NA) become blank cells."""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+
+def _write_excel_sheets(filename: str, sheets: Dict[str, pd.DataFrame]) -> None:
+    """
+    Write each DataFrame to its own sheet of one workbook (no index column).
+    
+    With xlsxwriter installed, rows are streamed to disk in constant_memory mode
+    instead of building the whole workbook in memory. DataFrame.to_excel writes
+    column by column, which that mode silently truncates, so rows are written
+    here directly. Falls back to pandas + openpyxl otherwise.
+    """
+    if xlsxwriter is None:
+        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+            for sheet_name, df in sheets.items():
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
+        return
+    
+    workbook = xlsxwriter.Workbook(filename, {
+        "constant_memory": True,
+        "default_date_format": "yyyy-mm-dd hh:mm:ss",
+        # Keep text as text, like the openpyxl output
+        "strings_to_urls": False,
+        "strings_to_formulas": False,
+    })
+    try:
+        header_format = workbook.add_format({"bold": True})
+        for sheet_name, df in sheets.items():
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+            for row_idx, row in enumerate(df.itertuples(index=False, name=None), 1):
+                worksheet.write_row(row_idx, 0, [_excel_cell(value) for value in row])
+    finally:
+        workbook.close()
+
+
+def _events_overview(events_df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Headline figures for the events table, computed with one pass per column.
+    
+    Shared by the Excel summary sheet and print_collection_summary. Banks come
+    from 'institutions', event types from 'categories', severity from
+    'materiality_score' and the date range from 'event_date'. Keys are only
+    present when the source column exists and the table is not empty.
+    """
+    overview: Dict[str, Any] = {'total': len(events_df)}
+    if events_df.empty:
+        return overview
+    if 'institutions' in events_df.columns:
+        overview['unique_banks'] = len(_split_value_counts(events_df['institutions']))
+    if 'categories' in events_df.columns:
+        # One value_counts serves the type count, the top-5 list and the mode
+        type_counts = _split_value_counts(events_df['categories'])
+        overview['event_type_counts'] = type_counts
+        overview['event_types'] = len(type_counts)
+        if not type_counts.empty:
+            # Ties resolve to the smallest value, as Series.mode() does
+            overview['top_event_type'] = type_counts.index[type_counts == type_counts.iloc[0]].min()
+    if 'materiality_score' in events_df.columns:
+        # Scores run 1-5; 0 is the table's fill for events without one
+        severity = pd.to_numeric(events_df['materiality_score'], errors='coerce')
+        severity = severity[severity > 0]
+        if not severity.empty:
+            # min/max in their own agg keep the column's dtype (mixing in mean upcasts to float)
+            overview['severity'] = {'mean': severity.mean(), **severity.agg(['min', 'max']).to_dict()}
+    if 'event_date' in events_df.columns:
+        overview['date'] = events_df['event_date'].agg(['min', 'max'])
+    return overview
+
+
 def save_tables_to_excel(monthly_df: pd.DataFrame, events_df: pd.DataFrame,
                          monthly_filename: str = "bank_reputation_monthly_JSON.xlsx",
-                         events_filename: str = "bank_reputation_events.xlsx"):
+                         events_filename: str = "bank_reputation_events.xlsx",
+                         json_filename: str = "bank_reputation_monthly.jsonl.gz"):
     """
     Save the monthly and events DataFrames to Excel files.
     
+    The full monthly JSON responses are too large for spreadsheet cells, so they
+    go to a compressed JSON Lines file alongside the workbook instead.
+    
     Args:
         monthly_df: DataFrame with monthly JSON data
         events_df: DataFrame with individual events
         monthly_filename: Filename for monthly data Excel file
         events_filename: Filename for events Excel file
+        json_filename: Filename for the monthly JSON Lines (gzip) file
     """
     
     # Save monthly table
     print(f"\nSaving monthly data to {monthly_filename}...")
-    with pd.ExcelWriter(monthly_filename, engine='openpyxl') as writer:
-        monthly_df.to_excel(writer, sheet_name='Monthly_JSON', index=False)
-        
-        # Add a summary sheet
-        summary_df = pd.DataFrame({
-            'Metric': ['Total Months', 'Start Date', 'End Date', 'Total JSON Records'],
-            'Value': [
-                len(monthly_df),
-                f"{monthly_df.iloc[0]['year']}-{monthly_df.iloc[0]['month']:02d}",
-                f"{monthly_df.iloc[-1]['year']}-{monthly_df.iloc[-1]['month']:02d}",
-                len(monthly_df)
-            ]
-        })
-        summary_df.to_excel(writer, sheet_name='Summary', index=False)
+    monthly_sheet = monthly_df
+    if 'json_output' in monthly_df.columns:
+        save_monthly_jsonl(monthly_df, json_filename)
+        print(f"✓ Monthly JSON saved to {json_filename}")
+        # Keep a per-month overview in the spreadsheet
+        payloads = [decode_monthly_json(raw) for raw in monthly_df['json_output']]
+        monthly_sheet = monthly_df[['year', 'month']].assign(
+            n_events=[len(payload.get("events") or []) for payload in payloads],
+            status=["error" if "error" in payload else "ok" for payload in payloads],
+        )
+    # Add a summary sheet
+    summary_df = pd.DataFrame.from_records([
+        ('Total Months', len(monthly_df)),
+        ('Start Date', f"{monthly_df.iloc[0]['year']}-{monthly_df.iloc[0]['month']:02d}"),
+        ('End Date', f"{monthly_df.iloc[-1]['year']}-{monthly_df.iloc[-1]['month']:02d}"),
+        ('Total JSON Records', len(monthly_df)),
+    ], columns=['Metric', 'Value'])
+    _write_excel_sheets(monthly_filename, {'Monthly_JSON': monthly_sheet, 'Summary': summary_df})
     
     print(f"✓ Monthly data saved: {len(monthly_df)} months")
     
     # Save events table
     print(f"\nSaving events data to {events_filename}...")
-    with pd.ExcelWriter(events_filename, engine='openpyxl') as writer:
-        events_df.to_excel(writer, sheet_name='Events', index=False)
-        
-        # Add summary statistics sheet
-        if not events_df.empty:
-            summary_stats = pd.DataFrame({
-                'Metric': [
-                    'Total Events',
-                    'Unique Banks',
-                    'Date Range',
-                    'Most Common Event Type',
-                    'Average Severity'
-                ],
-                'Value': [
-                    len(events_df),
-                    events_df['bank'].nunique() if 'bank' in events_df.columns else 0,
-                    f"{events_df['date'].min()} to {events_df['date'].max()}" if 'date' in events_df.columns else "N/A",
-                    events_df['event_type'].mode()[0] if 'event_type' in events_df.columns and not events_df.empty else "N/A",
-                    f"{events_df['severity'].mean():.2f}" if 'severity' in events_df.columns else "N/A"
-                ]
-            })
-            summary_stats.to_excel(writer, sheet_name='Summary', index=False)
+    event_sheets = {'Events': events_df}
+    
+    # Add summary statistics sheet
+    if not events_df.empty:
+        overview = _events_overview(events_df)
+        event_sheets['Summary'] = pd.DataFrame.from_records([
+            ('Total Events', overview['total']),
+            ('Unique Banks', overview.get('unique_banks', 0)),
+            ('Date Range', f"{overview['date']['min']} to {overview['date']['max']}" if 'date' in overview else "N/A"),
+            ('Most Common Event Type', overview.get('top_event_type', "N/A")),
+            ('Average Severity', f"{overview['severity']['mean']:.2f}" if 'severity' in overview else "N/A"),
+        ], columns=['Metric', 'Value'])
+    _write_excel_sheets(events_filename, event_sheets)
     
     print(f"✓ Events data saved: {len(events_df)} total events")
 
@@ -937,26 +1860,32 @@ def print_collection_summary(monthly_df: pd.DataFrame, events_df: pd.DataFrame):
     print(f"  - Date range: {monthly_df.iloc[0]['year']}-{monthly_df.iloc[0]['month']:02d} to "
           f"{monthly_df.iloc[-1]['year']}-{monthly_df.iloc[-1]['month']:02d}")
     
+    overview = _events_overview(events_df)
     print(f"\nEvents Table:")
-    print(f"  - Total events: {len(events_df)}")
-    if not events_df.empty and 'bank' in events_df.columns:
-        print(f"  - Unique banks: {events_df['bank'].nunique()}")
-    if not events_df.empty and 'event_type' in events_df.columns:
-        print(f"  - Event types: {events_df['event_type'].nunique()}")
+    print(f"  - Total events: {overview['total']}")
+    if 'unique_banks' in overview:
+        print(f"  - Unique banks: {overview['unique_banks']}")
+    if 'event_type_counts' in overview:
+        print(f"  - Event types: {overview['event_types']}")
         print("\n  Top 5 Event Types:")
-        for event_type, count in events_df['event_type'].value_counts().head().items():
+        for event_type, count in overview['event_type_counts'].head().items():
             print(f"    • {event_type}: {count}")
-    if not events_df.empty and 'severity' in events_df.columns:
+    if 'severity' in overview:
         print(f"\n  Severity Statistics:")
-        print(f"    • Mean: {events_df['severity'].mean():.2f}")
-        print(f"    • Min: {events_df['severity'].min()}")
-        print(f"    • Max: {events_df['severity'].max()}")
+        print(f"    • Mean: {overview['severity']['mean']:.2f}")
+        print(f"    • Min: {overview['severity']['min']}")
+        print(f"    • Max: {overview['severity']['max']}")
 
 
 if __name__ == "__main__":
     # Set environment variable before running:
     # PowerShell: $env:PERPLEXITY_API_KEY = "sk-..."
     # Bash: export PERPLEXITY_API_KEY="sk-..."
+    # Tables are saved as Parquet; also set SAVE_EXCEL=1 for the .xlsx workbooks
+    
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # httpx logs every request at INFO; keep only its warnings
+    logging.getLogger("httpx").setLevel(logging.WARNING)
     
     try:
         # Collect all data from January 2000 to July 2025
@@ -969,19 +1898,25 @@ if __name__ == "__main__":
             end_year=2025, 
             end_month=7,
             model="sonar-pro",
-            delay_seconds=1.0  # Adjust based on API rate limits
+            delay_seconds=1.0,  # Adjust based on API rate limits
+            max_workers=8
         )
         
         # Print summary
         print_collection_summary(monthly_df, events_df)
         
-        # Save to Excel files
-        save_tables_to_excel(
-            monthly_df, 
-            events_df,
-            monthly_filename="bank_reputation_monthly_JSON.xlsx",
-            events_filename="bank_reputation_events.xlsx"
-        )
+        # Save to Parquet files
+        save_to_parquet(monthly_df, "bank_reputation_monthly_JSON.parquet")
+        save_to_parquet(events_df, "bank_reputation_events.parquet")
+        
+        # Excel workbooks are much slower to write; set SAVE_EXCEL=1 to also write them
+        if os.getenv("SAVE_EXCEL", "").strip().lower() in ("1", "true", "yes"):
+            save_tables_to_excel(
+                monthly_df, 
+                events_df,
+                monthly_filename="bank_reputation_monthly_JSON.xlsx",
+                events_filename="bank_reputation_events.xlsx"
+            )
         
         print("\n✓ Process completed successfully!")
         
@@ -1,34 +1,58 @@
 import asyncio
+import httpx
+import pandas as pd
 from mediastack_search import MediaStackSearch
 from datetime import date, timedelta
-import json
+try:
+    import orjson  # type: ignore
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 
 async def collect_news_articles_monthly():
     """Collect and analyze news articles for Bank of America using monthly searches"""
     
-    # Initialize searcher
-    searcher = MediaStackSearch()
     all_articles = []
     
-    # Search month by month for 2023
+    # Month windows for 2023
+    months = []
     for month in range(1, 13):
         start_date = date(2023, month, 1)
         if month == 12:
             end_date = date(2023, 12, 31)
         else:
             end_date = date(2023, month + 1, 1) - timedelta(days=1)
+        months.append((start_date, end_date))
+    
+    # Cap concurrent MediaStack searches to stay within the API quota
+    search_slots = asyncio.Semaphore(4)
+    
+    async def search_month(searcher, start_date, end_date):
+        async with search_slots:
+            print(f"\n🔍 Searching {start_date.strftime('%B %Y')}: {start_date} to {end_date}")
+            return await searcher.search(
+                search_phrase="Bank of America",
+                start_date=start_date,
+                end_date=end_date,
+                exclude_keywords=["earnings", "quarterly", "profit"]
+            )
+    
+    # One pooled client for every month instead of a new connection pool per search
+    limits = httpx.Limits(max_connections=16)
+    async with httpx.AsyncClient(http2=True, limits=limits) as client:
+        monthly_searchers = [MediaStackSearch(client=client) for _ in months]
         
-        print(f"\n🔍 Searching {start_date.strftime('%B %Y')}: {start_date} to {end_date}")
-        
-        # Create a new searcher instance for each month
-        monthly_searcher = MediaStackSearch()
-        success = await monthly_searcher.search(
-            search_phrase="Bank of America",
-            start_date=start_date,
-            end_date=end_date,
-            exclude_keywords=["earnings", "quarterly", "profit"]
-        )
-        
+        # Search all months concurrently; results come back in month order
+        search_results = await asyncio.gather(*(
+            search_month(searcher, start_date, end_date)
+            for searcher, (start_date, end_date) in zip(monthly_searchers, months)
+        ))
+    
+    for monthly_searcher, (start_date, end_date), success in zip(monthly_searchers, months, search_results):
         if success:
             article_count = monthly_searcher.article_count()
             print(f"✅ Found {article_count} articles for {start_date.strftime('%B %Y')}")
@@ -47,44 +71,24 @@ async def collect_news_articles_monthly():
     if all_articles:
         print(f"\n📊 Total articles collected: {len(all_articles)}")
         
-        # Export to JSON
-        export_data = []
-        for article in all_articles:
-            article_data = {
-                "title": article.title,
-                "description": article.description,
-                "url": article.url,
-                "source": article.source,
-                "published_at": article.published_at,
-                "country": article.country,
-                "language": article.language,
-                "category": article.category,
-                "scraped_text": article.scraped_text,
-                "analysis": article.analysis
-            }
-            export_data.append(article_data)
-        
-        with open("analysis_results_monthly.json", 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        # Export as JSON Lines, streaming one article per line
+        with open("analysis_results_monthly.jsonl", 'wb') as f:
+            for article in all_articles:
+                f.write(_dumps(article.to_export_dict()))
+                f.write(b"\n")
         
-        print("✅ Results exported to analysis_results_monthly.json")
+        print("✅ Results exported to analysis_results_monthly.jsonl")
         
         # Show date distribution
-        dates = [article.published_at for article in all_articles if article.published_at]
-        if dates:
-            dates.sort()
-            print(f"📅 Date range: {dates[0]} to {dates[-1]}")
+        dates = pd.Series([article.published_at for article in all_articles if article.published_at], dtype=object)
+        if not dates.empty:
+            print(f"📅 Date range: {dates.min()} to {dates.max()}")
             
-            # Count by month
-            month_counts = {}
-            for article in all_articles:
-                if article.published_at:
-                    month = article.published_at[:7]  # YYYY-MM
-                    month_counts[month] = month_counts.get(month, 0) + 1
+            # Count by month (YYYY-MM prefix)
+            month_counts = dates.str[:7].value_counts().sort_index()
             
             print("📈 Articles by month:")
-            for month in sorted(month_counts.keys()):
-                print(f"   {month}: {month_counts[month]} articles")
+            print("\n".join(f"   {month}: {count} articles" for month, count in month_counts.items()))
     else:
         print("❌ No articles found across all months")
 
@@ -33,61 +33,74 @@ async def test_mediastack_date_ranges():
         ("Q4 2023", date(2023, 10, 1), date(2023, 12, 31)),
     ]
     
-    async with httpx.AsyncClient() as client:
-        for range_name, start_date, end_date in test_ranges:
-            print(f"\n🔍 Testing {range_name}: {start_date} to {end_date}")
-            
-            params = {
-                'access_key': api_key,
-                'keywords': 'Bank of America',
-                'date': f"{start_date.strftime('%Y-%m-%d')},{end_date.strftime('%Y-%m-%d')}",
-                'languages': 'en',
-                'countries': 'us',
-                'categories': 'business',
-                'limit': 10,  # Just get first 10 for testing
-                'offset': 0
-            }
-            
-            try:
+    # At most 3 requests in flight at once
+    limiter = asyncio.Semaphore(3)
+    
+    async def probe(range_name, start_date, end_date, client):
+        """Query one date range; returns the report lines for it."""
+        lines = [f"\n🔍 Testing {range_name}: {start_date} to {end_date}"]
+        
+        params = {
+            'access_key': api_key,
+            'keywords': 'Bank of America',
+            'date': f"{start_date.strftime('%Y-%m-%d')},{end_date.strftime('%Y-%m-%d')}",
+            'languages': 'en',
+            'countries': 'us',
+            'categories': 'business',
+            'limit': 10,  # Just get first 10 for testing
+            'offset': 0
+        }
+        
+        try:
+            async with limiter:
                 response = await client.get(base_url, params=params, timeout=30.0)
+            
+            if response.status_code == 200:
+                data = response.json()
+                articles = data.get('data', [])
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    articles = data.get('data', [])
-                    
-                    print(f"   ✅ Status: {response.status_code}")
-                    print(f"   📊 Articles found: {len(articles)}")
+                lines.append(f"   ✅ Status: {response.status_code}")
+                lines.append(f"   📊 Articles found: {len(articles)}")
+                
+                if articles:
+                    # Show date range of returned articles
+                    dates = [article.get('published_at', '') for article in articles]
+                    dates = [d for d in dates if d]  # Filter out empty dates
                     
-                    if articles:
-                        # Show date range of returned articles
-                        dates = [article.get('published_at', '') for article in articles]
-                        dates = [d for d in dates if d]  # Filter out empty dates
+                    if dates:
+                        dates.sort()
+                        lines.append(f"   📅 Date range: {dates[0]} to {dates[-1]}")
                         
-                        if dates:
-                            dates.sort()
-                            print(f"   📅 Date range: {dates[0]} to {dates[-1]}")
-                            
-                            # Count articles by month
-                            month_counts = {}
-                            for article in articles:
-                                pub_date = article.get('published_at', '')
-                                if pub_date:
-                                    month = pub_date[:7]  # YYYY-MM
-                                    month_counts[month] = month_counts.get(month, 0) + 1
-                            
-                            print(f"   📈 Articles by month: {month_counts}")
-                    else:
-                        print("   ❌ No articles found")
+                        # Count articles by month
+                        month_counts = {}
+                        for article in articles:
+                            pub_date = article.get('published_at', '')
+                            if pub_date:
+                                month = pub_date[:7]  # YYYY-MM
+                                month_counts[month] = month_counts.get(month, 0) + 1
                         
+                        lines.append(f"   📈 Articles by month: {month_counts}")
                 else:
-                    print(f"   ❌ Error: {response.status_code}")
-                    print(f"   📄 Response: {response.text}")
+                    lines.append("   ❌ No articles found")
                     
-            except Exception as e:
-                print(f"   ❌ Exception: {e}")
-            
-            # Small delay between requests
-            await asyncio.sleep(1)
+            else:
+                lines.append(f"   ❌ Error: {response.status_code}")
+                lines.append(f"   📄 Response: {response.text}")
+                
+        except Exception as e:
+            lines.append(f"   ❌ Exception: {e}")
+        
+        return lines
+    
+    async with httpx.AsyncClient() as client:
+        # Probe all ranges concurrently; reports are printed in the original order
+        reports = await asyncio.gather(*(
+            probe(range_name, start_date, end_date, client)
+            for range_name, start_date, end_date in test_ranges
+        ))
+    
+    for lines in reports:
+        print("\n".join(lines))
 
 if __name__ == "__main__":
     asyncio.run(test_mediastack_date_ranges()) 
\ No newline at end of file
@@ -10,6 +10,7 @@ from datetime import date, timedelta
 from pathlib import Path
 
 from storage.repository import EventRepository
+from ingestion.connectors.http import close_shared_client
 from ingestion.orchestrators.scheduler import EventScheduler
 
 
@@ -298,6 +299,9 @@ async def main():
         print(f"\nError running examples: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        # Connectors share one HTTP client; close it once at the end
+        await close_shared_client()
 
 
 if __name__ == "__main__":
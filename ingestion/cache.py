@@ -0,0 +1,135 @@
+"""
+On-disk caches for data source connectors.
+PDF text entries are keyed by PDF URL and carry the ETag / Last-Modified
+validators, so unchanged documents are revalidated with a conditional GET
+instead of being downloaded and parsed again. Lookup entries hold JSON API
+responses that rarely change (e.g. institution records) for a fixed time.
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+DEFAULT_PDF_CACHE_PATH = ".cache/pdf_text.db"
+DEFAULT_LOOKUP_CACHE_PATH = ".cache/lookups.db"
+DEFAULT_LOOKUP_TTL_SECONDS = 24 * 60 * 60
+
+
+class CachedPdfText(NamedTuple):
+    """Extracted text of a PDF plus the validators it was served with."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    text: str
+
+
+class PdfTextCache:
+    """SQLite-backed cache of extracted PDF text."""
+
+    def __init__(self, db_path: str = DEFAULT_PDF_CACHE_PATH):
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS pdf_text (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                text TEXT NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[CachedPdfText]:
+        """Return the cached entry for a PDF URL, if any."""
+        row = self._conn.execute(
+            "SELECT etag, last_modified, text FROM pdf_text WHERE url = ?", (url,)
+        ).fetchone()
+        return CachedPdfText(*row) if row else None
+
+    def put(self, url: str, etag: Optional[str], last_modified: Optional[str], text: str):
+        """Store the extracted text of a PDF with its validators."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pdf_text (url, etag, last_modified, text, updated_at) "
+            "VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)",
+            (url, etag, last_modified, text),
+        )
+        self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+class CachedLookup(NamedTuple):
+    """A cached lookup result; `value` may itself be None (e.g. no match found)."""
+    value: Any
+
+
+class LookupCache:
+    """SQLite-backed cache of JSON-serializable lookup results with a time to live."""
+
+    def __init__(self, db_path: str = DEFAULT_LOOKUP_CACHE_PATH,
+                 ttl_seconds: float = DEFAULT_LOOKUP_TTL_SECONDS):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS lookups (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, namespace: str, key: str,
+            max_age_seconds: Optional[float] = None) -> Optional[CachedLookup]:
+        """
+        Return the cached result for a key, unless it is missing or expired.
+        `max_age_seconds` overrides the cache's time to live for this lookup.
+        """
+        if max_age_seconds is None:
+            max_age_seconds = self.ttl_seconds
+        row = self._conn.execute(
+            "SELECT value FROM lookups WHERE namespace = ? AND key = ? AND fetched_at >= ?",
+            (namespace, key, time.time() - max_age_seconds),
+        ).fetchone()
+        return CachedLookup(json.loads(row[0])) if row else None
+
+    def put(self, namespace: str, key: str, value: Any):
+        """Store a lookup result."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO lookups (namespace, key, value, fetched_at) VALUES (?, ?, ?, ?)",
+            (namespace, key, json.dumps(value), time.time()),
+        )
+        self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+_pdf_cache: Optional[PdfTextCache] = None
+_lookup_cache: Optional[LookupCache] = None
+
+
+def get_pdf_cache() -> PdfTextCache:
+    """Get or create the process-wide PDF text cache."""
+    global _pdf_cache
+    if _pdf_cache is None:
+        _pdf_cache = PdfTextCache()
+    return _pdf_cache
+
+
+def get_lookup_cache() -> LookupCache:
+    """Get or create the process-wide lookup cache."""
+    global _lookup_cache
+    if _lookup_cache is None:
+        _lookup_cache = LookupCache()
+    return _lookup_cache
@@ -3,6 +3,7 @@ Data source connectors for bank reputation damage events.
 """
 
 from .base import BaseConnector, Connector
+from .http import get_shared_client, close_shared_client
 from .fdic_edo import FdicEdoConnector
 from .occ_enforcement import OccEnforcementConnector
 from .ffiec_bankfind import BankFindConnector
@@ -10,6 +11,8 @@ from .ffiec_bankfind import BankFindConnector
 __all__ = [
     "BaseConnector",
     "Connector", 
+    "get_shared_client",
+    "close_shared_client",
     "FdicEdoConnector",
     "OccEnforcementConnector",
     "BankFindConnector"
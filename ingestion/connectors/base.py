@@ -3,16 +3,125 @@ Base connector interface and abstract base class for data source connectors.
 All connectors must implement the Connector protocol.
 """
 
+import asyncio
+import hashlib
+import io
+import logging
+import re
+import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import date
-from typing import List, Protocol, Optional, Dict, Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from typing import AsyncIterator, BinaryIO, List, Protocol, Optional, Dict, Any, Tuple, Union
 import httpx
 import structlog
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt, wait_exponential
 
+try:
+    import orjson  # C JSON parser, several times faster than the stdlib on API payloads
+except ImportError:  # pragma: no cover - fall back to httpx's stdlib json decoding
+    orjson = None
+
+try:
+    import pypdfium2 as pdfium  # C-backed (PDFium); far faster than pdfminer
+except ImportError:  # pragma: no cover - fall back to pure-Python pdfminer
+    pdfium = None
+
+from ingestion.cache import get_pdf_cache
+from ingestion.connectors.http import get_shared_client
 from ingestion.normalizers.events_model import Event
 
 
+# Marks the end of discovery in BaseConnector.iter_updates' result queue
+_DISCOVERY_DONE = object()
+
+# Worker thread for PDF text extraction, shared by all connectors. PDFium is not
+# thread-safe, so a single worker keeps extraction serialized and off the event loop.
+_PDF_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-extract")
+
+
+def _extract_pdf_text(content: Union[bytes, BinaryIO]) -> str:
+    """Extract the text of a PDF document, as bytes or a binary stream (runs on the PDF pool)."""
+    if pdfium is None:
+        from pdfminer.high_level import extract_text
+        return extract_text(io.BytesIO(content) if isinstance(content, bytes) else content)
+    
+    pdf = pdfium.PdfDocument(content)
+    try:
+        pages = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            pages.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+        return "\n".join(pages)
+    finally:
+        pdf.close()
+
+
+# Status codes worth retrying; other HTTP errors fail immediately
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Retry network failures and throttling/server errors, not other 4xx responses."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _RETRYABLE_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
+
+def _log_retry(retry_state: RetryCallState):
+    """Log a failed attempt on the connector's logger before tenacity sleeps."""
+    connector, url = retry_state.args[:2]
+    error = retry_state.outcome.exception()
+    connector.logger.warning(
+        "HTTP error, retrying",
+        status_code=error.response.status_code if isinstance(error, httpx.HTTPStatusError) else None,
+        error=str(error),
+        url=url,
+        attempt=retry_state.attempt_number
+    )
+
+
+def _debug_enabled(logger) -> bool:
+    """Whether a connector logger emits DEBUG records (stdlib-backed loggers only)."""
+    is_enabled_for = getattr(logger, "isEnabledFor", None)
+    return bool(is_enabled_for and is_enabled_for(logging.DEBUG))
+
+
+# Retry policy shared by the connector request helpers
+_http_retry = retry(
+    retry=retry_if_exception(_is_retryable),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=4, max=10),
+    before_sleep=_log_retry,
+    reraise=True
+)
+
+
+# Query parameters that only track the referrer, not what the URL points to
+_TRACKING_PARAM_PREFIXES = ('utm_',)
+_TRACKING_PARAMS = frozenset({'fbclid', 'gclid'})
+
+# Event ID normalization patterns
+_RE_KEBAB_NONALNUM = re.compile(r'[^a-zA-Z0-9]')
+_RE_KEBAB_DASHES = re.compile(r'-+')
+
+
+@lru_cache(maxsize=8192)
+def _kebab(source_name: str, external_id: str, iso_date: str) -> str:
+    """Kebab-case event ID for a (source, external ID, ISO date) triple."""
+    base = f"{source_name}:{external_id}:{iso_date}"
+    # Replace non-alphanumeric chars with hyphens
+    kebab = _RE_KEBAB_NONALNUM.sub('-', base.lower())
+    # Remove multiple consecutive hyphens
+    kebab = _RE_KEBAB_DASHES.sub('-', kebab)
+    # Remove leading/trailing hyphens
+    return kebab.strip('-')
+
+
 class Connector(Protocol):
     """Protocol for data source connectors."""
     source_name: str
@@ -20,72 +129,101 @@ class Connector(Protocol):
     async def fetch_updates(self, since: date) -> List[Event]:
         """Fetch updates from the data source since the given date."""
         ...
+    
+    def iter_updates(self, since: date) -> AsyncIterator[Event]:
+        """Yield updates from the data source as they become ready."""
+        ...
 
 
 class BaseConnector(ABC):
     """Abstract base class for data source connectors."""
     
-    def __init__(self, source_name: str, timeout: int = 30):
+    def __init__(self, source_name: str, timeout: int = 30, max_concurrency: int = 10):
         self.source_name = source_name
         self.timeout = timeout
+        # Items processed at once by fetch_updates; lower it for rate-limited sources
+        self.max_concurrency = max_concurrency
         self.logger = structlog.get_logger(source_name)
-        self._client: Optional[httpx.AsyncClient] = None
     
     @property
     def client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
-                http2=True,
-                verify=False,  # Disable SSL verification for government sites
-                follow_redirects=True,  # Follow redirects automatically
-                headers={
-                    "User-Agent": "bank-reputation-monitor/1.0"
-                }
-            )
-        return self._client
+        """HTTP client shared by all connectors (see ingestion.connectors.http)."""
+        return get_shared_client()
     
     async def close(self):
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
-    
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
+        """
+        Release connector resources.
+        The shared HTTP client stays open for other connectors; the application
+        closes it at shutdown with close_shared_client().
+        """
+    
+    @_http_retry
     async def _make_request(self, url: str, **kwargs) -> httpx.Response:
-        """Make HTTP request with retry logic."""
-        try:
-            response = await self.client.get(url, **kwargs)
+        """Make HTTP request with retry logic (transient errors only)."""
+        # Per-connector read timeout on the shared client
+        kwargs.setdefault("timeout", self._request_timeout())
+        response = await self.client.get(url, **kwargs)
+        response.raise_for_status()
+        return response
+    
+    @_http_retry
+    async def _download(self, url: str, headers: Optional[Dict[str, str]] = None,
+                        chunk_size: int = 65536) -> Tuple[Optional[io.BytesIO], httpx.Headers]:
+        """
+        Stream a response body (e.g. a PDF) into a buffer, with retry logic.
+        Returns (buffer, response headers); buffer is None on 304 Not Modified.
+        """
+        buffer = io.BytesIO()
+        async with self.client.stream(
+            "GET", url, headers=headers, timeout=self._request_timeout()
+        ) as response:
+            if response.status_code == 304:
+                return None, response.headers
             response.raise_for_status()
-            return response
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code in [429, 500, 502, 503, 504]:
-                self.logger.warning(
-                    "HTTP error, retrying",
-                    status_code=e.response.status_code,
-                    url=url
-                )
-                raise  # Retry
-            else:
-                self.logger.error(
-                    "HTTP error",
-                    status_code=e.response.status_code,
-                    url=url
-                )
-                raise
-        except httpx.SSLError as e:
-            self.logger.error("SSL certificate error", error=str(e), url=url)
-            raise
-        except httpx.ConnectError as e:
-            self.logger.error("Connection error", error=str(e), url=url)
-            raise
-        except Exception as e:
-            self.logger.error("Request failed", error=str(e), url=url)
-            raise
+            async for chunk in response.aiter_bytes(chunk_size):
+                buffer.write(chunk)
+        buffer.seek(0)
+        return buffer, response.headers
+    
+    @staticmethod
+    def _json(response: httpx.Response) -> Any:
+        """Decode a JSON response body."""
+        if orjson is None:
+            return response.json()
+        # API pages are a few dozen records, so the body is parsed from the single
+        # bytes buffer httpx already holds; no str decode, and nothing to gain from
+        # an incremental parser
+        return orjson.loads(response.content)
+    
+    @staticmethod
+    def _intern(value: Any) -> Any:
+        """Intern repeated field strings so events share a single copy."""
+        return sys.intern(value) if isinstance(value, str) and value else value
+    
+    @staticmethod
+    def _canonical_url(url: str) -> str:
+        """
+        URL with a lowercase scheme and host, and without tracking parameters,
+        so syndicated copies of an article compare equal.
+        """
+        parts = urlsplit(url)
+        query = [
+            (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key not in _TRACKING_PARAMS and not key.startswith(_TRACKING_PARAM_PREFIXES)
+        ]
+        return urlunsplit((
+            parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), parts.fragment
+        ))
+    
+    @classmethod
+    def _url_digest(cls, url: str) -> str:
+        """Short digest of a URL that is stable across runs (unlike hash()), for event IDs."""
+        canonical = cls._canonical_url(url) if url else ''
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=8).hexdigest()
+    
+    def _request_timeout(self) -> httpx.Timeout:
+        """Long reads for PDF downloads, but fail fast on connect/pool waits."""
+        return httpx.Timeout(connect=10.0, read=self.timeout, write=10.0, pool=5.0)
     
     @abstractmethod
     async def discover_items(self, since: date) -> List[Dict[str, Any]]:
@@ -107,60 +245,139 @@ class BaseConnector(ABC):
         """Normalize parsed data into Event model."""
         pass
     
+    def process_item(self, item_detail: Dict[str, Any]) -> Event:
+        """
+        Turn a fetched item into an Event.
+        Connectors can override this to build the Event in a single pass.
+        """
+        return self.normalize_item(self.parse_item(item_detail))
+    
     async def fetch_updates(self, since: date) -> List[Event]:
         """Main method to fetch updates from the data source."""
+        return [event async for event in self.iter_updates(since)]
+    
+    async def iter_items(self, since: date) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield discovered items as they become known.
+        Connectors whose discovery makes several requests can override this so
+        items from the first responses are processed while the rest are pending.
+        """
+        for item in await self.discover_items(since):
+            yield item
+    
+    async def iter_updates(self, since: date) -> AsyncIterator[Event]:
+        """
+        Yield events from the data source as soon as each one is ready.
+        Items are processed concurrently, and while discovery is still running,
+        so events arrive in completion order rather than discovery order.
+        """
         self.logger.info("Starting fetch", since=since.isoformat())
         
+        tasks: List[asyncio.Task] = []
+        discovery: Optional[asyncio.Task] = None
         try:
-            # Discover items
-            items = await self.discover_items(since)
-            self.logger.info("Discovered items", count=len(items))
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            # Finished items' events (None for failures), then _DISCOVERY_DONE
+            results: asyncio.Queue = asyncio.Queue()
             
-            events = []
-            for item in items:
+            async def process(item: Dict[str, Any]):
+                item_id = item.get('id', 'unknown')
+                event = None
                 try:
-                    # Fetch detail
-                    item_detail = await self.fetch_item_detail(item)
-                    
-                    # Parse
-                    parsed_data = self.parse_item(item_detail)
-                    
-                    # Normalize
-                    event = self.normalize_item(parsed_data)
-                    events.append(event)
+                    async with semaphore:
+                        # Fetch detail
+                        item_detail = await self.fetch_item_detail(item)
                     
+                    # Parse and normalize
+                    event = self.process_item(item_detail)
                 except Exception as e:
+                    # One bad item must not sink the batch; tracebacks only when debugging
                     self.logger.error(
                         "Failed to process item",
-                        item=item.get('id', 'unknown'),
-                        error=str(e)
+                        item=item_id,
+                        error=str(e),
+                        exc_info=_debug_enabled(self.logger)
                     )
+                results.put_nowait(event)
+            
+            async def discover() -> int:
+                try:
+                    async for item in self.iter_items(since):
+                        tasks.append(asyncio.create_task(process(item)))
+                    self.logger.info("Discovered items", count=len(tasks))
+                    return len(tasks)
+                finally:
+                    results.put_nowait(_DISCOVERY_DONE)
+            
+            discovery = asyncio.create_task(discover())
+            discovered = None
+            finished = 0
+            events_count = 0
+            while discovered is None or finished < discovered:
+                result = await results.get()
+                if result is _DISCOVERY_DONE:
+                    discovered = discovery.result()
                     continue
+                finished += 1
+                if result is not None:
+                    events_count += 1
+                    yield result
             
-            self.logger.info("Fetch completed", events_count=len(events))
-            return events
+            self.logger.info("Fetch completed", events_count=events_count)
             
         except Exception as e:
             self.logger.error("Fetch failed", error=str(e))
             raise
         finally:
+            # The consumer may stop early; don't leave discovery or item fetches running
+            if discovery is not None:
+                discovery.cancel()
+            for task in tasks:
+                task.cancel()
             await self.close()
     
+    async def fetch_pdf_text(self, url: str) -> str:
+        """
+        Download a PDF and extract its text, reusing the on-disk cache.
+        A cached PDF is revalidated with a conditional GET and only downloaded
+        and parsed again when the server reports it changed.
+        """
+        cache = get_pdf_cache()
+        cached = cache.get(url)
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        
+        buffer, response_headers = await self._download(url, headers=headers)
+        if buffer is None and cached is not None:
+            self.logger.debug("PDF not modified, using cached text", url=url)
+            return cached.text
+        if buffer is None:  # 304 without a cache entry; fetch unconditionally
+            buffer, response_headers = await self._download(url)
+        
+        text = await self.extract_pdf_text(buffer)
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        # Without validators a cached copy could never be confirmed fresh
+        if etag or last_modified:
+            cache.put(url, etag, last_modified, text)
+        return text
+    
+    async def extract_pdf_text(self, content: Union[bytes, BinaryIO]) -> str:
+        """
+        Extract text from PDF bytes or a stream without blocking the event loop.
+        Parsing runs on a worker thread (pypdfium2, or pdfminer if unavailable).
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_PDF_POOL, _extract_pdf_text, content)
+    
     def generate_event_id(self, external_id: str, event_date: date) -> str:
         """Generate standardized event ID."""
-        from urllib.parse import quote
-        import re
-        
         # Create kebab-case ID
-        base = f"{self.source_name}:{external_id}:{event_date.isoformat()}"
-        # Replace non-alphanumeric chars with hyphens
-        kebab = re.sub(r'[^a-zA-Z0-9]', '-', base.lower())
-        # Remove multiple consecutive hyphens
-        kebab = re.sub(r'-+', '-', kebab)
-        # Remove leading/trailing hyphens
-        kebab = kebab.strip('-')
-        
-        return kebab
+        return _kebab(self.source_name, external_id, event_date.isoformat())
     
     def extract_money_amount(self, text: str) -> tuple[int, str]:
         """Extract money amount from text."""
@@ -3,19 +3,87 @@ FDIC Enforcement Decisions & Orders (ED&O) connector.
 Scrapes monthly updated database of FDIC enforcement decisions, orders, and notices.
 """
 
+import asyncio
 import re
 import json
 from datetime import date, datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
 from urllib.parse import urljoin, urlparse
 import dateparser
+import httpx
 from selectolax.parser import HTMLParser
-from pdfminer.high_level import extract_text
-import io
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 from .base import BaseConnector
 from ingestion.normalizers.events_model import Event, SourceRef, ReputationalDrivers, ReputationalDamage
 
+# Patterns used per item, compiled once at import
+_RE_URL_ORDER = re.compile(r'/orders/([^/]+)')
+_RE_TITLE_ORDER = re.compile(r'(?:Order|Notice)\s+(?:No\.?\s*)?([A-Z0-9\-]+)', re.IGNORECASE)
+_RE_INSTITUTION = re.compile(r'(?:against|involving|regarding)\s+([A-Z][A-Za-z\s&.,]+?)(?:\s+Bank|\s+National|\s+Federal|\s+State|\.|$)', re.IGNORECASE)
+_RE_PENALTY = re.compile(r'(?:civil\s+)?(?:money|monetary)\s+penalty\s+(?:of\s*)?\$?([\d,]+(?:\.\d{2})?)', re.IGNORECASE)
+_RE_DOCKET = re.compile(r'(?:docket|case)\s+(?:no\.?\s*)?([A-Z0-9\-]+)', re.IGNORECASE)
+_RE_STATE = re.compile(r'(?:of|in)\s+([A-Z]{2})\s+(?:Bank|National|Federal)')
+_RE_DATE = re.compile(r'(?:effective|issued|dated)\s+(?:date\s+)?([A-Za-z]+\s+\d{1,2},?\s+\d{4})', re.IGNORECASE)
+
+# Date formats seen on FDIC order pages and PDFs, tried before dateparser
+_DATE_FORMATS = ("%B %d, %Y", "%b %d, %Y", "%B %d %Y", "%Y-%m-%d", "%m/%d/%Y")
+
+# Values shared by every FDIC event
+_FDIC_REGULATORS = ('FDIC',)
+_US_JURISDICTIONS = ('USA',)
+_EMPTY_AMOUNTS = {
+    'penalties_usd': 0,
+    'settlements_usd': 0,
+    'other_amounts_usd': 0,
+    'original_text': ''
+}
+
+# Parsed fields that repeat across a batch of orders
+_INTERNED_FIELDS = ('institution', 'order_type', 'state')
+
+
+# Page selectors, in priority order
+_PDF_LINK_SELECTOR = 'a[href*=".pdf"]'
+_ORDER_LINK_SELECTOR = 'a[href*="/orders/"]'
+_LISTING_DATE_SELECTOR = '.date, time'
+_METADATA_INSTITUTION_SELECTORS = ('.institution-name', '.bank-name', 'h1', 'h2')
+_METADATA_DATE_SELECTORS = ('.date', '.order-date', 'time')
+_METADATA_TYPE_SELECTORS = ('.order-type', '.type')
+_INSTITUTION_SELECTORS = ('.institution', '.bank-name', 'h1', 'h2', '.title')
+_DATE_SELECTORS = ('.date', '.order-date', 'time', '.effective-date')
+
+
+def _first_matches(html: LexborHTMLParser, selectors: Sequence[str]) -> Dict[str, LexborNode]:
+    """First node for each selector (as css_first would return), with one query over their union."""
+    firsts: Dict[str, LexborNode] = {}
+    # Lexbor returns the union's matches in document order
+    for node in html.css(", ".join(selectors)):
+        for selector in selectors:
+            # css_matches is also true when only a descendant matches, so check the node itself
+            if selector not in firsts and node.css_first(selector) == node:
+                firsts[selector] = node
+        if len(firsts) == len(selectors):
+            break
+    return firsts
+
+
+def _first_by_priority(found: Dict[str, LexborNode], selectors: Sequence[str]) -> Optional[LexborNode]:
+    """Match of the highest-priority selector that has one."""
+    return next((found[selector] for selector in selectors if selector in found), None)
+
+
+def _parse_fdic_date(text: str) -> Optional[date]:
+    """Parse a date string, trying the known FDIC formats before the slow dateparser."""
+    text = text.strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    parsed = dateparser.parse(text)
+    return parsed.date() if parsed else None
+
 
 class FdicEdoConnector(BaseConnector):
     """Connector for FDIC Enforcement Decisions & Orders."""
@@ -64,7 +132,7 @@ class FdicEdoConnector(BaseConnector):
         items = []
         
         # Look for order links
-        links = section.css('a[href*="/orders/"]')
+        links = section.css(_ORDER_LINK_SELECTOR)
         for link in links:
             item = self._extract_order_from_link(link)
             if item and self._is_recent_order(item, since):
@@ -91,7 +159,9 @@ class FdicEdoConnector(BaseConnector):
                 'title': title,
                 'url': urljoin(self.base_url, href),
                 'order_number': order_number,
-                'discovered_date': datetime.now().date()
+                'discovered_date': datetime.now().date(),
+                # Only an element wrapping this one link can carry its date
+                'order_date': self._listing_date(link.parent, single_link=True)
             }
         except Exception as e:
             self.logger.error("Failed to extract order from link", error=str(e))
@@ -108,7 +178,7 @@ class FdicEdoConnector(BaseConnector):
             title = title_elem.text().strip()
             
             # Look for link
-            link = card.css_first('a[href*="/orders/"]')
+            link = card.css_first(_ORDER_LINK_SELECTOR)
             if not link:
                 return None
             
@@ -123,21 +193,36 @@ class FdicEdoConnector(BaseConnector):
                 'title': title,
                 'url': urljoin(self.base_url, href),
                 'order_number': order_number,
-                'discovered_date': datetime.now().date()
+                'discovered_date': datetime.now().date(),
+                'order_date': self._listing_date(card)
             }
         except Exception as e:
             self.logger.error("Failed to extract order from card", error=str(e))
             return None
     
+    def _listing_date(self, container, single_link: bool = False) -> Optional[date]:
+        """Order date shown next to an order in a listing, if there is one."""
+        try:
+            if container is None:
+                return None
+            if single_link and len(container.css(_ORDER_LINK_SELECTOR)) != 1:
+                return None
+            date_elem = container.css_first(_LISTING_DATE_SELECTOR)
+            if not date_elem:
+                return None
+            return _parse_fdic_date(date_elem.attributes.get('datetime') or date_elem.text())
+        except Exception:
+            return None
+    
     def _extract_order_number(self, title: str, url: str) -> str:
         """Extract order number from title or URL."""
         # Try to extract from URL first
-        url_match = re.search(r'/orders/([^/]+)', url)
+        url_match = _RE_URL_ORDER.search(url)
         if url_match:
             return url_match.group(1)
         
         # Try to extract from title
-        title_match = re.search(r'(?:Order|Notice)\s+(?:No\.?\s*)?([A-Z0-9\-]+)', title, re.IGNORECASE)
+        title_match = _RE_TITLE_ORDER.search(title)
         if title_match:
             return title_match.group(1)
         
@@ -147,9 +232,9 @@ class FdicEdoConnector(BaseConnector):
     
     def _is_recent_order(self, item: Dict[str, Any], since: date) -> bool:
         """Check if order is recent enough to process."""
-        # For now, include all discovered orders
-        # In a real implementation, you'd check the order date
-        return True
+        # Orders whose listing shows no date are kept; their date comes from the detail page
+        order_date = item.get('order_date')
+        return order_date is None or order_date >= since
     
     async def fetch_item_detail(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Fetch detailed information for a specific order."""
@@ -157,60 +242,72 @@ class FdicEdoConnector(BaseConnector):
             url = item['url']
             response = await self._make_request(url)
             
-            # Parse the order detail page
-            html = HTMLParser(response.text)
+            # Parse the order detail page (Lexbor: faster parsing and selector matching)
+            html = LexborHTMLParser(response.text)
             
             # Extract PDF link if available
-            pdf_link = html.css_first('a[href*=".pdf"]')
+            pdf_link = html.css_first(_PDF_LINK_SELECTOR)
             pdf_url = None
             if pdf_link:
                 pdf_url = urljoin(url, pdf_link.attributes.get('href', ''))
             
-            # Extract metadata from the page
-            metadata = self._extract_metadata_from_page(html)
-            
-            # Download and parse PDF if available
-            pdf_text = ""
-            if pdf_url:
-                try:
-                    pdf_response = await self._make_request(pdf_url)
-                    pdf_text = extract_text(io.BytesIO(pdf_response.content))
-                except Exception as e:
-                    self.logger.warning("Failed to download PDF", url=pdf_url, error=str(e))
+            # Start the PDF download while the page fields are extracted
+            pdf_task = asyncio.create_task(self._fetch_order_pdf_text(pdf_url)) if pdf_url else None
+            try:
+                # Metadata, plus HTML fallback fields for parse_item; the markup itself is not kept
+                metadata, html_fields = await asyncio.to_thread(self._extract_page_fields, html)
+                pdf_text = await pdf_task if pdf_task else ""
+            finally:
+                if pdf_task and not pdf_task.done():
+                    pdf_task.cancel()
             
             return {
                 **item,
-                'html_content': response.text,
                 'pdf_url': pdf_url,
                 'pdf_text': pdf_text,
-                'metadata': metadata
+                'metadata': metadata,
+                'html_fields': html_fields
             }
             
-        except Exception as e:
+        except (httpx.HTTPError, KeyError) as e:
             self.logger.error("Failed to fetch item detail", item_id=item.get('id'), error=str(e))
             return item
     
-    def _extract_metadata_from_page(self, html: HTMLParser) -> Dict[str, Any]:
+    async def _fetch_order_pdf_text(self, pdf_url: str) -> str:
+        """Download and extract an order PDF; an unavailable PDF yields no text."""
+        try:
+            return await self.fetch_pdf_text(pdf_url)
+        except Exception as e:
+            self.logger.warning("Failed to download PDF", url=pdf_url, error=str(e))
+            return ""
+    
+    def _extract_page_fields(self, html: LexborHTMLParser) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Extract the metadata and HTML fallback fields of an order detail page."""
+        return self._extract_metadata_from_page(html), self._parse_html_content(html)
+    
+    def _extract_metadata_from_page(self, html: LexborHTMLParser) -> Dict[str, Any]:
         """Extract metadata from the order detail page."""
         metadata = {}
+        found = _first_matches(
+            html, _METADATA_INSTITUTION_SELECTORS + _METADATA_DATE_SELECTORS + _METADATA_TYPE_SELECTORS
+        )
         
         # Look for common metadata patterns
         # Institution name
-        institution_elem = html.css_first('.institution-name, .bank-name, h1, h2')
+        institution_elem = _first_by_priority(found, _METADATA_INSTITUTION_SELECTORS)
         if institution_elem:
             metadata['institution'] = institution_elem.text().strip()
         
         # Date
-        date_elem = html.css_first('.date, .order-date, time')
+        date_elem = _first_by_priority(found, _METADATA_DATE_SELECTORS)
         if date_elem:
             date_text = date_elem.text().strip()
-            try:
-                metadata['date'] = dateparser.parse(date_text).date()
-            except:
-                pass
+            event_date = _parse_fdic_date(date_text)
+            if event_date:
+                metadata['date'] = event_date
         
         # Order type
-        type_elem = html.css_first('.order-type, .type')
+        type_elem = _first_by_priority(found, _METADATA_TYPE_SELECTORS)
         if type_elem:
             metadata['order_type'] = type_elem.text().strip()
         
@@ -246,18 +343,19 @@ class FdicEdoConnector(BaseConnector):
                 pdf_parsed = self._parse_pdf_text(pdf_text)
                 parsed.update(pdf_parsed)
             
-            # Parse HTML content as fallback
-            html_content = item_data.get('html_content', '')
-            if html_content and not parsed['institution']:
-                html_parsed = self._parse_html_content(html_content)
-                parsed.update(html_parsed)
+            # Fields extracted from the HTML page as fallback
+            if not parsed['institution']:
+                parsed.update(item_data.get('html_fields', {}))
+            
+            for field in _INTERNED_FIELDS:
+                parsed[field] = self._intern(parsed.get(field, ''))
             
             # Generate summary
             parsed['summary'] = self._generate_summary(parsed)
             
             return parsed
             
-        except Exception as e:
+        except (ValueError, KeyError) as e:
             self.logger.error("Failed to parse item", item_id=item_data.get('id'), error=str(e))
             return {}
     
@@ -266,12 +364,12 @@ class FdicEdoConnector(BaseConnector):
         parsed = {}
         
         # Extract institution name
-        institution_match = re.search(r'(?:against|involving|regarding)\s+([A-Z][A-Za-z\s&.,]+?)(?:\s+Bank|\s+National|\s+Federal|\s+State|\.|$)', pdf_text, re.IGNORECASE)
+        institution_match = _RE_INSTITUTION.search(pdf_text)
         if institution_match:
             parsed['institution'] = institution_match.group(1).strip()
         
         # Extract penalty amount
-        penalty_match = re.search(r'(?:civil\s+)?(?:money|monetary)\s+penalty\s+(?:of\s*)?\$?([\d,]+(?:\.\d{2})?)', pdf_text, re.IGNORECASE)
+        penalty_match = _RE_PENALTY.search(pdf_text)
         if penalty_match:
             penalty_text = penalty_match.group(0)
             penalty_amount = self.extract_money_amount(penalty_text)[0]
@@ -279,33 +377,33 @@ class FdicEdoConnector(BaseConnector):
             parsed['penalty_text'] = penalty_text
         
         # Extract docket number
-        docket_match = re.search(r'(?:docket|case)\s+(?:no\.?\s*)?([A-Z0-9\-]+)', pdf_text, re.IGNORECASE)
+        docket_match = _RE_DOCKET.search(pdf_text)
         if docket_match:
             parsed['docket_number'] = docket_match.group(1)
         
         # Extract state
-        state_match = re.search(r'(?:of|in)\s+([A-Z]{2})\s+(?:Bank|National|Federal)', pdf_text)
+        state_match = _RE_STATE.search(pdf_text)
         if state_match:
             parsed['state'] = state_match.group(1)
         
         # Extract date
-        date_match = re.search(r'(?:effective|issued|dated)\s+(?:date\s+)?([A-Za-z]+\s+\d{1,2},?\s+\d{4})', pdf_text, re.IGNORECASE)
+        date_match = _RE_DATE.search(pdf_text)
         if date_match:
-            try:
-                parsed['event_date'] = dateparser.parse(date_match.group(1)).date()
-            except:
-                pass
+            event_date = _parse_fdic_date(date_match.group(1))
+            if event_date:
+                parsed['event_date'] = event_date
         
         return parsed
     
-    def _parse_html_content(self, html_content: str) -> Dict[str, Any]:
-        """Parse HTML content to extract key information."""
+    def _parse_html_content(self, html_content: Union[str, LexborHTMLParser]) -> Dict[str, Any]:
+        """Parse HTML content (markup or an already parsed tree) to extract key information."""
         parsed = {}
-        html = HTMLParser(html_content)
+        html = html_content if isinstance(html_content, LexborHTMLParser) else LexborHTMLParser(html_content)
+        found = _first_matches(html, _INSTITUTION_SELECTORS + _DATE_SELECTORS)
         
         # Extract institution name from various selectors
-        for selector in ['.institution', '.bank-name', 'h1', 'h2', '.title']:
-            elem = html.css_first(selector)
+        for selector in _INSTITUTION_SELECTORS:
+            elem = found.get(selector)
             if elem:
                 text = elem.text().strip()
                 if text and len(text) > 3:
@@ -313,14 +411,13 @@ class FdicEdoConnector(BaseConnector):
                     break
         
         # Extract date
-        for selector in ['.date', '.order-date', 'time', '.effective-date']:
-            elem = html.css_first(selector)
+        for selector in _DATE_SELECTORS:
+            elem = found.get(selector)
             if elem:
-                try:
-                    parsed['event_date'] = dateparser.parse(elem.text().strip()).date()
+                event_date = _parse_fdic_date(elem.text())
+                if event_date:
+                    parsed['event_date'] = event_date
                     break
-                except:
-                    continue
         
         return parsed
     
@@ -345,83 +442,80 @@ class FdicEdoConnector(BaseConnector):
     
     def normalize_item(self, parsed_data: Dict[str, Any]) -> Event:
         """Normalize parsed data into Event model."""
-        try:
-            # Generate event ID
-            event_date = parsed_data.get('event_date') or date.today()
-            external_id = parsed_data.get('external_id', 'unknown')
-            event_id = self.generate_event_id(external_id, event_date)
-            
-            # Map categories
-            order_type = parsed_data.get('order_type', '').lower()
-            categories = []
-            if any(term in order_type for term in ['consent', 'cease', 'desist']):
-                categories.append('regulatory_action')
-            if parsed_data.get('penalty_amount', 0) > 0:
-                categories.append('fine')
-            if not categories:
-                categories.append('regulatory_action')
-            
-            # Map nature
-            nature = self.map_nature(order_type)
-            
-            # Calculate materiality score
-            event_data = {
-                'amounts': {'penalties_usd': parsed_data.get('penalty_amount', 0)},
-                'title': parsed_data.get('title', ''),
-                'categories': categories
-            }
-            materiality_score = self.calculate_materiality_score(event_data)
-            
-            # Create reputational drivers
-            drivers = ReputationalDrivers(
-                fine_usd=parsed_data.get('penalty_amount', 0),
-                regulator_involved=['FDIC']
-            )
-            
-            # Create reputational damage
-            reputational_damage = ReputationalDamage(
-                nature=nature,
-                materiality_score=materiality_score,
-                drivers=drivers
-            )
-            
-            # Create source reference
-            source = SourceRef(
-                title=parsed_data.get('title', 'FDIC Enforcement Order'),
-                publisher='FDIC',
-                url=parsed_data.get('url', ''),
-                date_published=event_date,
-                source_type='regulator'
-            )
-            
-            # Create amounts
-            amounts = {
-                'penalties_usd': parsed_data.get('penalty_amount', 0),
-                'settlements_usd': 0,
-                'other_amounts_usd': 0,
-                'original_text': parsed_data.get('penalty_text', '')
-            }
-            
-            # Create event
-            event = Event(
-                event_id=event_id,
-                title=parsed_data.get('title', 'FDIC Enforcement Action'),
-                institutions=[parsed_data.get('institution', 'Unknown Institution')],
-                us_operations=True,
-                jurisdictions=['USA', parsed_data.get('state', '')] if parsed_data.get('state') else ['USA'],
-                categories=categories,
-                event_date=event_date,
-                reported_dates=[event_date],
-                summary=parsed_data.get('summary', ''),
-                reputational_damage=reputational_damage,
-                amounts=amounts,
-                sources=[source],
-                source_count=1,
-                confidence='high' if parsed_data.get('pdf_text') else 'medium'
-            )
-            
-            return event
-            
-        except Exception as e:
-            self.logger.error("Failed to normalize item", error=str(e))
-            raise
+        # Generate event ID
+        event_date = parsed_data.get('event_date') or date.today()
+        external_id = parsed_data.get('external_id', 'unknown')
+        event_id = self.generate_event_id(external_id, event_date)
+        
+        penalty_amount = parsed_data.get('penalty_amount', 0)
+        state = parsed_data.get('state')
+        
+        # Map categories
+        order_type = parsed_data.get('order_type', '').lower()
+        categories = []
+        if any(term in order_type for term in ['consent', 'cease', 'desist']):
+            categories.append('regulatory_action')
+        if penalty_amount > 0:
+            categories.append('fine')
+        if not categories:
+            categories.append('regulatory_action')
+        
+        # Map nature
+        nature = self.map_nature(order_type)
+        
+        # Calculate materiality score
+        event_data = {
+            'amounts': {'penalties_usd': penalty_amount},
+            'title': parsed_data.get('title', ''),
+            'categories': categories
+        }
+        materiality_score = self.calculate_materiality_score(event_data)
+        
+        # Create reputational drivers
+        drivers = ReputationalDrivers(
+            fine_usd=penalty_amount,
+            regulator_involved=_FDIC_REGULATORS
+        )
+        
+        # Create reputational damage
+        reputational_damage = ReputationalDamage(
+            nature=nature,
+            materiality_score=materiality_score,
+            drivers=drivers
+        )
+        
+        # Create source reference
+        source = SourceRef(
+            title=parsed_data.get('title', 'FDIC Enforcement Order'),
+            publisher='FDIC',
+            url=parsed_data.get('url', ''),
+            date_published=event_date,
+            source_type='regulator'
+        )
+        
+        # Create amounts
+        amounts = {
+            **_EMPTY_AMOUNTS,
+            'penalties_usd': penalty_amount,
+            'original_text': parsed_data.get('penalty_text', '')
+        }
+        
+        # Create event
+        event = Event(
+            event_id=event_id,
+            title=parsed_data.get('title', 'FDIC Enforcement Action'),
+            institutions=[parsed_data.get('institution', 'Unknown Institution')],
+            us_operations=True,
+            jurisdictions=(*_US_JURISDICTIONS, state) if state else _US_JURISDICTIONS,
+            categories=categories,
+            event_date=event_date,
+            reported_dates=[event_date],
+            summary=parsed_data.get('summary', ''),
+            reputational_damage=reputational_damage,
+            amounts=amounts,
+            sources=[source],
+            source_count=1,
+            confidence='high' if parsed_data.get('pdf_text') else 'medium'
+        )
+        
+        return event
@@ -3,15 +3,15 @@ FFIEC/FDIC BankFind Suite connector for institution identity and crosswalk.
 Provides institution enrichment with CERT, primary regulator, website, historical names, and failures data.
 """
 
+import asyncio
 import os
 import json
 from datetime import date
 from typing import List, Dict, Any, Optional
-import httpx
-from selectolax.parser import HTMLParser
 
 from .base import BaseConnector
-from ingestion.normalizers.events_model import Event, SourceRef, ReputationalDrivers, ReputationalDamage
+from ingestion.cache import get_lookup_cache
+from ingestion.normalizers.events_model import Event
 
 
 class BankFindConnector(BaseConnector):
@@ -25,6 +25,12 @@ class BankFindConnector(BaseConnector):
         
         # Updated to use the correct FDIC BankFind Suite API endpoints
         self.base_url = "https://banks.data.fdic.gov"
+        
+        # Institution records change rarely; repeat lookups are served from disk
+        self.lookup_cache = get_lookup_cache()
+        
+        # Institution lookups sent to BankFind at once while enriching an event
+        self.lookup_concurrency = 20
     
     async def discover_items(self, since: date) -> List[Dict[str, Any]]:
         """BankFind doesn't have a discovery mechanism - it's used for enrichment."""
@@ -51,6 +57,11 @@ class BankFindConnector(BaseConnector):
             self.logger.warning("Cannot search without FDIC_API_KEY")
             return None
         
+        cache_key = json.dumps([name, state])
+        cached = self.lookup_cache.get("bankfind_institution", cache_key)
+        if cached:
+            return cached.value
+        
         try:
             # Build search filters
             filters = f'NAME:"{name}"'
@@ -74,19 +85,101 @@ class BankFindConnector(BaseConnector):
                 headers=headers
             )
             
-            data = response.json()
+            data = self._json(response)
             institutions = data.get('data', [])
             
-            if institutions:
-                # Return the first (most relevant) match
-                return institutions[0]
-            
-            return None
+            # Return the first (most relevant) match; "no match" is cached too
+            result = institutions[0] if institutions else None
+            self.lookup_cache.put("bankfind_institution", cache_key, result)
+            return result
             
         except Exception as e:
             self.logger.error("Failed to search institution", name=name, state=state, error=str(e))
             return None
     
+    async def search_institutions_bulk(self, names: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Search for several institutions by name, in one BankFind query where possible.
+        Returns {name: institution data or None}. Only rows whose NAME equals a
+        requested name (ignoring case) are taken from the combined query; the
+        other names are searched individually with search_institution.
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        pending = []
+        for name in dict.fromkeys(names):
+            # A name's single search answer wins over a combined-query match
+            cached = (self.lookup_cache.get("bankfind_institution", json.dumps([name, None]))
+                      or self.lookup_cache.get("bankfind_institution_bulk", self._bulk_cache_key(name)))
+            if cached:
+                results[name] = cached.value
+            else:
+                pending.append(name)
+        
+        # A '"' in one name would break the NAME:"..." phrases of the whole query
+        combinable = [name for name in pending if '"' not in name]
+        if len(combinable) > 1 and self.api_key:
+            rows = await self._search_institution_names(combinable)
+            for name in combinable:
+                match = self._exact_name_match(name, rows)
+                if match:
+                    # Kept apart from search_institution's phrase-match results
+                    self.lookup_cache.put("bankfind_institution_bulk", self._bulk_cache_key(name), match)
+                    results[name] = match
+                    pending.remove(name)
+        
+        semaphore = asyncio.Semaphore(self.lookup_concurrency)
+        
+        async def lookup(name: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.search_institution(name)
+        
+        for name, match in zip(pending, await asyncio.gather(*(lookup(name) for name in pending))):
+            results[name] = match
+        
+        return results
+    
+    async def _search_institution_names(self, names: List[str]) -> List[Dict[str, Any]]:
+        """Institutions matching any of several names, from a single BankFind query."""
+        try:
+            params = {
+                'format': 'json',
+                'fields': 'CERT,NAME,STALP,ACTIVE,PRIMARY_REG,ID_RSSD,LEI,WEBSITE,OFFICES',
+                'filters': ' OR '.join(f'NAME:"{name}"' for name in names),
+                'limit': len(names) * 3
+            }
+            
+            headers = {
+                'Accept': 'application/json'
+            }
+            
+            response = await self._make_request(
+                f"{self.base_url}/api/institutions",
+                params=params,
+                headers=headers
+            )
+            
+            data = self._json(response)
+            return data.get('data', [])
+            
+        except Exception as e:
+            self.logger.error("Failed to search institutions", names=names, error=str(e))
+            return []
+    
+    @staticmethod
+    def _bulk_cache_key(name: str) -> str:
+        """Cache key for a combined-query match, which (like the match itself) ignores case."""
+        return name.lower()
+    
+    @staticmethod
+    def _exact_name_match(name: str, rows: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """First row whose NAME equals `name` ignoring case, if any."""
+        name_lower = name.lower()
+        # Rows are either flat records or wrapped as {'data': {...}, 'score': ...}
+        return next(
+            (row for row in rows if (row.get('data', row).get('NAME') or '').lower() == name_lower),
+            None
+        )
+    
     async def get_institution_detail(self, cert: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed institution information by CERT number.
@@ -95,6 +188,10 @@ class BankFindConnector(BaseConnector):
             self.logger.warning("Cannot fetch details without FDIC_API_KEY")
             return None
         
+        cached = self.lookup_cache.get("bankfind_institution_detail", str(cert))
+        if cached:
+            return cached.value
+        
         try:
             params = {
                 'format': 'json',
@@ -111,8 +208,10 @@ class BankFindConnector(BaseConnector):
                 headers=headers
             )
             
-            data = response.json()
-            return data.get('data', [{}])[0] if data.get('data') else None
+            data = self._json(response)
+            result = data.get('data', [{}])[0] if data.get('data') else None
+            self.lookup_cache.put("bankfind_institution_detail", str(cert), result)
+            return result
             
         except Exception as e:
             self.logger.error("Failed to get institution detail", cert=cert, error=str(e))
@@ -142,7 +241,7 @@ class BankFindConnector(BaseConnector):
                 headers=headers
             )
             
-            data = response.json()
+            data = self._json(response)
             return data.get('data', [])
             
         except Exception as e:
@@ -175,38 +274,25 @@ class BankFindConnector(BaseConnector):
                 headers=headers
             )
             
-            data = response.json()
+            data = self._json(response)
             return data.get('data', [])
             
         except Exception as e:
             self.logger.error("Failed to get failed institutions", since=since.isoformat(), error=str(e))
             return []
     
-    def enrich_event_institutions(self, event: Event) -> Event:
+    async def enrich_event_institutions(self, event: Event) -> Event:
         """
         Enrich event with institution information from BankFind.
-        This is a synchronous wrapper for async operations.
-        """
-        import asyncio
-        
-        try:
-            # Run async enrichment
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(self._enrich_event_institutions_async(event))
-        except RuntimeError:
-            # No event loop, create new one
-            return asyncio.run(self._enrich_event_institutions_async(event))
-    
-    async def _enrich_event_institutions_async(self, event: Event) -> Event:
-        """
-        Asynchronously enrich event with institution information.
+        Runs on the caller's event loop, so lookups share its pooled HTTP client.
         """
         enriched_institutions = []
         
+        # Try to find all institutions in BankFind at once
+        matches = await self.search_institutions_bulk(event.institutions)
+        
         for institution_name in event.institutions:
-            # Try to find institution in BankFind
-            bank_data = await self.search_institution(institution_name)
-            
+            bank_data = matches.get(institution_name)
             if bank_data:
                 # Add BankFind identifiers to the event
                 enriched_institutions.append({
@@ -250,7 +336,7 @@ class BankFindConnector(BaseConnector):
         Resolve institution identity using fuzzy matching and BankFind data.
         Returns standardized institution information.
         """
-        from rapidfuzz import fuzz
+        from rapidfuzz import fuzz, process
         
         # First try exact search
         result = await self.search_institution(name, state)
@@ -279,22 +365,18 @@ class BankFindConnector(BaseConnector):
                 headers=headers
             )
             
-            data = response.json()
+            data = self._json(response)
             institutions = data.get('data', [])
             
-            # Find best match using fuzzy string matching
-            best_match = None
-            best_score = 0
-            
-            for inst in institutions:
-                inst_name = inst.get('NAME', '')
-                score = fuzz.ratio(name.lower(), inst_name.lower())
-                
-                if score > best_score and score > 80:  # 80% similarity threshold
-                    best_score = score
-                    best_match = inst
+            # Find best match using fuzzy string matching (all candidates scored in one C call)
+            candidate_names = [inst.get('NAME', '').lower() for inst in institutions]
+            match = process.extractOne(
+                name.lower(), candidate_names, scorer=fuzz.ratio, processor=None, score_cutoff=80
+            )
             
-            if best_match:
+            if match and match[1] > 80:  # 80% similarity threshold
+                _, best_score, index = match
+                best_match = institutions[index]
                 self.logger.info(
                     "Fuzzy matched institution",
                     original=name,
@@ -0,0 +1,92 @@
+"""
+Process-wide HTTP client shared by all data source connectors.
+Reusing one pooled client keeps TCP/TLS connections and HTTP/2 state warm
+across connectors and scheduler runs.
+"""
+
+import asyncio
+from typing import Optional
+
+import httpx
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+# The loop only keeps a weak reference to tasks, so hold on to the closing one
+_shutdown_task: Optional[asyncio.Task] = None
+
+
+def _current_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+async def _close_on_loop_shutdown(client: httpx.AsyncClient) -> None:
+    """Wait until the loop cancels its remaining tasks (asyncio.run does on exit), then close the client."""
+    try:
+        await asyncio.get_running_loop().create_future()
+    except asyncio.CancelledError:
+        await client.aclose()
+        raise
+
+
+def _close_stale_client(client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Close a shared client that belongs to an event loop other than the current one."""
+    if client.is_closed:
+        return
+    if loop is not None and loop.is_running():
+        # Connections can only be closed on the loop that opened them
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        logger.info("Closing shared HTTP client of another event loop")
+    else:
+        # Its loop is not running, so its transports can no longer be closed
+        logger.warning("Dropping shared HTTP client of an event loop that is no longer running")
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client."""
+    global _shared_client, _shared_loop, _shutdown_task
+    loop = _current_loop()
+    # A client's connections belong to the event loop that opened them, so each
+    # asyncio.run() gets a fresh client, closed when that loop shuts down
+    stale = _shared_client is not None and (
+        _shared_client.is_closed or (loop is not None and _shared_loop is not loop)
+    )
+    if _shared_client is None or stale:
+        if stale:
+            _close_stale_client(_shared_client, _shared_loop)
+        _shared_client = httpx.AsyncClient(
+            # Long reads for PDF downloads, but fail fast on connect/pool waits
+            timeout=httpx.Timeout(connect=10.0, read=30.0, write=10.0, pool=5.0),
+            # Keep connections alive so concurrent item fetches reuse them
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=30.0
+            ),
+            http2=True,
+            verify=False,  # Disable SSL verification for government sites
+            follow_redirects=True,  # Follow redirects automatically
+            headers={
+                "User-Agent": "bank-reputation-monitor/1.0"
+            }
+        )
+        _shared_loop = loop
+        _shutdown_task = loop.create_task(_close_on_loop_shutdown(_shared_client)) if loop else None
+    return _shared_client
+
+
+async def close_shared_client():
+    """Close the shared HTTP client; call once at application shutdown."""
+    global _shared_client, _shared_loop, _shutdown_task
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+        _shared_loop = None
+    if _shutdown_task is not None:
+        _shutdown_task.cancel()
+        _shutdown_task = None
@@ -3,15 +3,21 @@ MediaStack API connector for financial news and bank reputation monitoring.
 Provides news articles about banks, financial institutions, and regulatory actions.
 """
 
+import asyncio
 import os
-import json
-from datetime import date, datetime, timedelta
-from typing import List, Dict, Any, Optional
-import httpx
-from urllib.parse import quote_plus
+from datetime import date, datetime
+from typing import AsyncIterator, List, Dict, Any, FrozenSet, Optional
 
 from .base import BaseConnector
 from ingestion.normalizers.events_model import Event, SourceRef, ReputationalDrivers, ReputationalDamage
+from ingestion.normalizers.keywords import (
+    news_keyword_matcher,
+    NEWS_CATEGORY_KEYWORDS,
+    NEWS_REGULATOR_KEYWORDS,
+    HIGH_IMPACT_KEYWORDS,
+    MATERIAL_BANK_KEYWORDS,
+    MATERIAL_REGULATOR_KEYWORDS,
+)
 
 
 class MediaStackConnector(BaseConnector):
@@ -41,39 +47,73 @@ class MediaStackConnector(BaseConnector):
             "Capital One", "American Express", "Bank of New York Mellon",
             "State Street", "Charles Schwab", "Citizens Financial", "Fifth Third"
         ]
+        
+        # Searches sent to MediaStack at once by discover_items
+        self.search_concurrency = 10
+        
+        # MediaStack news categories searched; bank and regulatory stories are filed under these
+        self.news_categories = "business,general"
+        
+        # Reputable news sources, matched against the lowercased source name
+        self.reputable_sources = (
+            'reuters', 'bloomberg', 'wall street journal', 'financial times', 'cnbc', 'yahoo finance'
+        )
+        
+        # Every keyword parse_item looks for, matched in a single pass over an article
+        self._keyword_matcher = news_keyword_matcher(self.major_banks)
+        self._bank_keywords = [(bank, bank.lower()) for bank in dict.fromkeys(self.major_banks)]
     
     async def discover_items(self, since: date) -> List[Dict[str, Any]]:
         """Discover news articles related to bank reputation events."""
+        return [article async for article in self.iter_items(since)]
+    
+    async def iter_items(self, since: date) -> AsyncIterator[Dict[str, Any]]:
+        """Yield news articles related to bank reputation events as each search returns."""
         if not self.api_key:
             self.logger.warning("Cannot search without MEDIASTACK_API_KEY")
-            return []
+            return
         
+        tasks: List[asyncio.Task] = []
         try:
-            articles = []
+            semaphore = asyncio.Semaphore(self.search_concurrency)
             
-            # Search for each major bank with reputation keywords
-            for bank in self.major_banks:
-                bank_articles = await self._search_bank_news(bank, since)
-                articles.extend(bank_articles)
+            async def bounded(search):
+                async with semaphore:
+                    return await search
             
-            # Search for general financial regulatory news
-            regulatory_articles = await self._search_regulatory_news(since)
-            articles.extend(regulatory_articles)
+            # Search for each major bank, plus general financial regulatory news, concurrently
+            searches = [self._search_bank_news(bank, since) for bank in self.major_banks]
+            searches.append(self._search_regulatory_news(since))
+            tasks = [asyncio.create_task(bounded(search)) for search in searches]
             
-            # Remove duplicates based on URL
+            # Yield results as searches finish, removing duplicates based on the canonical URL
             seen_urls = set()
-            unique_articles = []
-            for article in articles:
-                if article.get('url') not in seen_urls:
-                    seen_urls.add(article.get('url'))
-                    unique_articles.append(article)
-            
-            self.logger.info(f"Discovered {len(unique_articles)} unique MediaStack articles")
-            return unique_articles
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    result = await next_done
+                except Exception as e:
+                    self.logger.error("MediaStack search failed", error=str(e))
+                    continue
+                for article in result:
+                    url = article.get('url')
+                    key = self._canonical_url(url) if url else url
+                    if key not in seen_urls:
+                        seen_urls.add(key)
+                        yield article
+            
+            self.logger.info(f"Discovered {len(seen_urls)} unique MediaStack articles")
             
         except Exception as e:
             self.logger.error("Failed to discover MediaStack articles", error=str(e))
-            return []
+        finally:
+            # The consumer may stop early; don't leave searches running
+            for task in tasks:
+                task.cancel()
+    
+    @staticmethod
+    def _date_range(since: date) -> str:
+        """MediaStack `date` filter covering `since` through today."""
+        return f"{since.isoformat()},{date.today().isoformat()}"
     
     async def _search_bank_news(self, bank_name: str, since: date) -> List[Dict[str, Any]]:
         """Search for news about a specific bank."""
@@ -85,6 +125,8 @@ class MediaStackConnector(BaseConnector):
                 'access_key': self.api_key,
                 'keywords': query,
                 'languages': 'en',
+                'date': self._date_range(since),
+                'categories': self.news_categories,
                 'limit': 20
             }
             
@@ -93,7 +135,7 @@ class MediaStackConnector(BaseConnector):
                 params=params
             )
             
-            data = response.json()
+            data = self._json(response)
             articles = data.get('data', [])
             
             # Add bank name to each article for tracking
@@ -118,6 +160,8 @@ class MediaStackConnector(BaseConnector):
                 'access_key': self.api_key,
                 'keywords': query,
                 'languages': 'en',
+                'date': self._date_range(since),
+                'categories': self.news_categories,
                 'limit': 30
             }
             
@@ -126,7 +170,7 @@ class MediaStackConnector(BaseConnector):
                 params=params
             )
             
-            data = response.json()
+            data = self._json(response)
             articles = data.get('data', [])
             
             # Mark as regulatory news
@@ -152,8 +196,9 @@ class MediaStackConnector(BaseConnector):
             published_at = item_data.get('published_at')
             if published_at:
                 try:
-                    # Parse MediaStack date format (YYYY-MM-DD HH:MM:SS)
-                    pub_date = datetime.strptime(published_at, '%Y-%m-%d %H:%M:%S')
+                    # MediaStack sends ISO 8601 (YYYY-MM-DDTHH:MM:SS+00:00); older
+                    # responses used YYYY-MM-DD HH:MM:SS, which fromisoformat also reads
+                    pub_date = datetime.fromisoformat(published_at)
                     event_date = pub_date.date()
                 except:
                     event_date = date.today()
@@ -171,52 +216,40 @@ class MediaStackConnector(BaseConnector):
             description = item_data.get('description', '')
             content = f"{title} {description}"
             
-            for bank in self.major_banks:
-                if bank.lower() in content.lower():
-                    if bank not in institutions:
-                        institutions.append(bank)
+            # All keywords mentioned in the article
+            found = self._keyword_matcher.find(content.lower())
+            
+            # Bank names are unique, so only the searched bank can repeat
+            institutions.extend(
+                bank for bank, bank_keyword in self._bank_keywords
+                if bank_keyword in found and bank != bank_name
+            )
             
             # Determine categories based on content
-            categories = []
-            content_lower = content.lower()
-            
-            if any(word in content_lower for word in ['fine', 'penalty', 'settlement']):
-                categories.append('fine')
-            if any(word in content_lower for word in ['enforcement', 'regulatory', 'compliance']):
-                categories.append('regulatory_action')
-            if any(word in content_lower for word in ['fraud', 'scandal', 'misconduct']):
-                categories.append('misconduct')
-            if any(word in content_lower for word in ['lawsuit', 'litigation', 'legal']):
-                categories.append('litigation')
-            if any(word in content_lower for word in ['bankruptcy', 'failure']):
-                categories.append('financial_distress')
+            categories = [
+                category for category, words in NEWS_CATEGORY_KEYWORDS
+                if not found.isdisjoint(words)
+            ]
             
             # Default category if none found
             if not categories:
                 categories.append('news')
             
             # Determine regulators mentioned
-            regulators = []
-            if any(reg in content_lower for reg in ['fdic', 'federal deposit insurance']):
-                regulators.append('FDIC')
-            if any(reg in content_lower for reg in ['occ', 'office of the comptroller']):
-                regulators.append('OCC')
-            if any(reg in content_lower for reg in ['federal reserve', 'fed']):
-                regulators.append('Federal Reserve')
-            if any(reg in content_lower for reg in ['cfpb', 'consumer financial protection']):
-                regulators.append('CFPB')
-            if any(reg in content_lower for reg in ['sec', 'securities and exchange']):
-                regulators.append('SEC')
+            regulators = [
+                regulator for regulator, words in NEWS_REGULATOR_KEYWORDS
+                if not found.isdisjoint(words)
+            ]
             
             # Calculate materiality score based on source and content
-            materiality_score = self._calculate_materiality_score(item_data)
+            materiality_score = self._calculate_materiality_score(item_data, found)
             
             return {
                 'title': item_data.get('title', 'Unknown Title'),
                 'description': item_data.get('description', ''),
                 'content': item_data.get('content', ''),
                 'url': item_data.get('url', ''),
-                'source': item_data.get('source', 'Unknown'),
+                'source': self._intern(item_data.get('source', 'Unknown')),
                 'published_at': published_at,
                 'event_date': event_date,
                 'institutions': institutions,
@@ -225,38 +258,40 @@ class MediaStackConnector(BaseConnector):
                 'materiality_score': materiality_score,
                 'search_query': item_data.get('search_query', ''),
                 'bank_name': item_data.get('bank_name', ''),
-                'country': item_data.get('country', ''),
-                'language': item_data.get('language', 'en')
+                'country': self._intern(item_data.get('country', '')),
+                'language': self._intern(item_data.get('language', 'en'))
             }
             
         except Exception as e:
             self.logger.error("Failed to parse MediaStack article", error=str(e), article=item_data.get('title'))
             return {}
     
-    def _calculate_materiality_score(self, article: Dict[str, Any]) -> int:
-        """Calculate materiality score for MediaStack news article (1-5 scale)."""
+    def _calculate_materiality_score(self, article: Dict[str, Any],
+                                     found: Optional[FrozenSet[str]] = None) -> int:
+        """
+        Calculate materiality score for MediaStack news article (1-5 scale).
+        `found` is the keyword set already matched in the title and description, if any.
+        """
         score = 1
-        content = f"{article.get('title', '')} {article.get('description', '')}".lower()
+        if found is None:
+            content = f"{article.get('title', '')} {article.get('description', '')}".lower()
+            found = self._keyword_matcher.find(content)
         
         # High-impact keywords
-        high_impact = ['fine', 'penalty', 'settlement', 'enforcement', 'fraud', 'scandal']
-        if any(word in content for word in high_impact):
+        if not found.isdisjoint(HIGH_IMPACT_KEYWORDS):
             score += 2
         
         # Major banks mentioned
-        major_banks = ['jpmorgan', 'bank of america', 'wells fargo', 'citigroup', 'goldman sachs']
-        if any(bank in content for bank in major_banks):
+        if not found.isdisjoint(MATERIAL_BANK_KEYWORDS):
             score += 1
         
         # Regulatory agencies mentioned
-        regulators = ['fdic', 'occ', 'federal reserve', 'cfpb', 'sec']
-        if any(reg in content for reg in regulators):
+        if not found.isdisjoint(MATERIAL_REGULATOR_KEYWORDS):
             score += 1
         
         # Reputable news sources (MediaStack specific)
-        reputable_sources = ['reuters', 'bloomberg', 'wall street journal', 'financial times', 'cnbc', 'yahoo finance']
         source_name = article.get('source', '').lower()
-        if any(source in source_name for source in reputable_sources):
+        if any(source in source_name for source in self.reputable_sources):
             score += 1
         
         return min(score, 5)  # Cap at 5
@@ -292,7 +327,7 @@ class MediaStackConnector(BaseConnector):
             )
             
             # Create event ID
-            event_id = f"mediastack-{parsed_data.get('source', 'unknown').replace(' ', '-')}-{parsed_data.get('event_date')}-{hash(parsed_data.get('url', '')) % 10000}"
+            event_id = f"mediastack-{parsed_data.get('source', 'unknown').replace(' ', '-')}-{parsed_data.get('event_date')}-{self._url_digest(parsed_data.get('url', ''))}"
             
             return Event(
                 event_id=event_id,
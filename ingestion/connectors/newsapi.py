@@ -3,15 +3,23 @@ NewsAPI.org connector for financial news and bank reputation monitoring.
 Provides news articles about banks, financial institutions, and regulatory actions.
 """
 
-import os
+import asyncio
 import json
-from datetime import date, datetime, timedelta
-from typing import List, Dict, Any, Optional
-import httpx
-from urllib.parse import quote_plus
+import os
+from datetime import date, datetime
+from typing import AsyncIterator, List, Dict, Any, FrozenSet, Optional
 
 from .base import BaseConnector
+from ingestion.cache import get_lookup_cache
 from ingestion.normalizers.events_model import Event, SourceRef, ReputationalDrivers, ReputationalDamage
+from ingestion.normalizers.keywords import (
+    news_keyword_matcher,
+    NEWS_CATEGORY_KEYWORDS,
+    NEWS_REGULATOR_KEYWORDS,
+    HIGH_IMPACT_KEYWORDS,
+    MATERIAL_BANK_KEYWORDS,
+    MATERIAL_REGULATOR_KEYWORDS,
+)
 
 
 class NewsApiConnector(BaseConnector):
@@ -41,45 +49,101 @@ class NewsApiConnector(BaseConnector):
             "Capital One", "American Express", "Bank of New York Mellon",
             "State Street", "Charles Schwab", "Citizens Financial", "Fifth Third"
         ]
+        
+        # NewsAPI rejects search queries longer than this
+        self.max_query_chars = 500
+        
+        # Banks per search; NewsAPI pages hold at most 100 articles, 20 per bank
+        self.banks_per_search = 5
+        
+        # Identical searches within this many seconds are served from the lookup cache
+        self.lookup_cache = get_lookup_cache()
+        self.search_cache_seconds = 30 * 60
+        
+        # Searches sent to NewsAPI at once by discover_items
+        self.search_concurrency = int(os.getenv("NEWSAPI_CONCURRENCY", "5"))
+        
+        # Reputable news sources, matched against the lowercased source name
+        self.reputable_sources = ('reuters', 'bloomberg', 'wall street journal', 'financial times', 'cnbc')
+        
+        # Every keyword parse_item looks for, matched in a single pass over an article
+        self._keyword_matcher = news_keyword_matcher(self.major_banks)
+        self._bank_keywords = [(bank, bank.lower()) for bank in dict.fromkeys(self.major_banks)]
     
     async def discover_items(self, since: date) -> List[Dict[str, Any]]:
         """Discover news articles related to bank reputation events."""
+        return [article async for article in self.iter_items(since)]
+    
+    async def iter_items(self, since: date) -> AsyncIterator[Dict[str, Any]]:
+        """Yield news articles related to bank reputation events as each search returns."""
         if not self.api_key:
             self.logger.warning("Cannot search without NEWS_API_KEY")
-            return []
+            return
         
+        tasks: List[asyncio.Task] = []
         try:
-            articles = []
+            semaphore = asyncio.Semaphore(self.search_concurrency)
             
-            # Search for each major bank with reputation keywords
-            for bank in self.major_banks:
-                bank_articles = await self._search_bank_news(bank, since)
-                articles.extend(bank_articles)
+            async def bounded(search):
+                async with semaphore:
+                    return await search
             
-            # Search for general financial regulatory news
-            regulatory_articles = await self._search_regulatory_news(since)
-            articles.extend(regulatory_articles)
+            # Search for the major banks in batches, plus general financial regulatory news, concurrently
+            searches = [self._search_bank_news(banks, since) for banks in self._bank_batches()]
+            searches.append(self._search_regulatory_news(since))
+            tasks = [asyncio.create_task(bounded(search)) for search in searches]
             
-            # Remove duplicates based on URL
+            # Yield results as searches finish, removing duplicates based on the canonical URL
             seen_urls = set()
-            unique_articles = []
-            for article in articles:
-                if article.get('url') not in seen_urls:
-                    seen_urls.add(article.get('url'))
-                    unique_articles.append(article)
-            
-            self.logger.info(f"Discovered {len(unique_articles)} unique news articles")
-            return unique_articles
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    result = await next_done
+                except Exception as e:
+                    self.logger.error("NewsAPI search failed", error=str(e))
+                    continue
+                for article in result:
+                    url = article.get('url')
+                    key = self._canonical_url(url) if url else url
+                    if key not in seen_urls:
+                        seen_urls.add(key)
+                        yield article
+            
+            self.logger.info(f"Discovered {len(seen_urls)} unique news articles")
             
         except Exception as e:
             self.logger.error("Failed to discover news articles", error=str(e))
-            return []
+        finally:
+            # The consumer may stop early; don't leave searches running
+            for task in tasks:
+                task.cancel()
+    
+    def _bank_batches(self) -> List[List[str]]:
+        """
+        Pack the major banks into searches of at most banks_per_search banks
+        that fit NewsAPI's query length limit.
+        """
+        keyword_query = " OR ".join(f'"{keyword}"' for keyword in self.reputation_keywords[:5])
+        batches = []
+        batch = []
+        query_len = len(keyword_query)
+        for bank in self.major_banks:
+            bank_len = len(bank) + len('"" OR ')
+            if batch and (len(batch) >= self.banks_per_search
+                          or query_len + bank_len > self.max_query_chars):
+                batches.append(batch)
+                batch = []
+                query_len = len(keyword_query)
+            batch.append(bank)
+            query_len += bank_len
+        if batch:
+            batches.append(batch)
+        return batches
     
-    async def _search_bank_news(self, bank_name: str, since: date) -> List[Dict[str, Any]]:
-        """Search for news about a specific bank."""
+    async def _search_bank_news(self, banks: List[str], since: date) -> List[Dict[str, Any]]:
+        """Search for news about a batch of banks with one query."""
         try:
-            # Create search query combining bank name with reputation keywords
-            query_parts = [bank_name]
+            # Create search query combining the bank names with reputation keywords
+            query_parts = list(banks)
             query_parts.extend(self.reputation_keywords[:5])  # Use first 5 keywords
             
             query = " OR ".join([f'"{part}"' for part in query_parts])
@@ -90,28 +154,23 @@ class NewsApiConnector(BaseConnector):
                 'to': date.today().isoformat(),
                 'language': 'en',
                 'sortBy': 'relevancy',
-                'pageSize': 20,
+                'pageSize': 20 * len(banks),
                 'apiKey': self.api_key
             }
             
-            response = await self._make_request(
-                f"{self.base_url}/everything",
-                params=params
-            )
-            
-            data = response.json()
-            articles = data.get('articles', [])
+            articles = await self._search_articles(params)
             
-            # Add bank name to each article for tracking
+            # Record the searched banks; parse_item attributes each article to the
+            # first of them it mentions, during its own keyword scan
             for article in articles:
-                article['bank_name'] = bank_name
+                article['search_banks'] = banks
                 article['search_query'] = query
             
-            self.logger.info(f"Found {len(articles)} articles for {bank_name}")
+            self.logger.info(f"Found {len(articles)} articles for {len(banks)} banks")
             return articles
             
         except Exception as e:
-            self.logger.error(f"Failed to search news for {bank_name}", error=str(e))
+            self.logger.error(f"Failed to search news for {', '.join(banks)}", error=str(e))
             return []
     
     async def _search_regulatory_news(self, since: date) -> List[Dict[str, Any]]:
@@ -135,13 +194,7 @@ class NewsApiConnector(BaseConnector):
                 'apiKey': self.api_key
             }
             
-            response = await self._make_request(
-                f"{self.base_url}/everything",
-                params=params
-            )
-            
-            data = response.json()
-            articles = data.get('articles', [])
+            articles = await self._search_articles(params)
             
             # Mark as regulatory news
             for article in articles:
@@ -155,6 +208,25 @@ class NewsApiConnector(BaseConnector):
             self.logger.error("Failed to search regulatory news", error=str(e))
             return []
     
+    async def _search_articles(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Articles returned by an /everything search, reusing a recent identical search.
+        Searches are cached by every parameter except the API key.
+        """
+        cache_key = json.dumps({k: v for k, v in params.items() if k != 'apiKey'}, sort_keys=True)
+        cached = self.lookup_cache.get("newsapi_everything", cache_key, self.search_cache_seconds)
+        if cached:
+            return cached.value
+        
+        response = await self._make_request(
+            f"{self.base_url}/everything",
+            params=params
+        )
+        
+        articles = self._json(response).get('articles', [])
+        self.lookup_cache.put("newsapi_everything", cache_key, articles)
+        return articles
+    
     async def fetch_item_detail(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """NewsAPI articles come with full content, so just return the item."""
         return item
@@ -174,63 +246,55 @@ class NewsApiConnector(BaseConnector):
             else:
                 event_date = date.today()
             
+            # All keywords mentioned in the title and description
+            title = item_data.get('title', '')
+            description = item_data.get('description', '')
+            content = f"{title} {description}"
+            found = self._keyword_matcher.find(content.lower())
+            
+            # Articles from a bank search belong to the first searched bank they mention
+            bank_name = item_data.get('bank_name', '')
+            if not bank_name and item_data.get('search_banks'):
+                bank_name = next(
+                    (bank for bank in item_data['search_banks'] if bank.lower() in found), ''
+                )
+            
             # Extract institutions mentioned
             institutions = []
-            bank_name = item_data.get('bank_name')
             if bank_name and bank_name != 'regulatory':
                 institutions.append(bank_name)
             
-            # Try to extract other bank names from title and description
-            title = item_data.get('title', '')
-            description = item_data.get('description', '')
-            content = f"{title} {description}"
-            
-            for bank in self.major_banks:
-                if bank.lower() in content.lower():
-                    if bank not in institutions:
-                        institutions.append(bank)
+            # Bank names are unique, so only the searched bank can repeat
+            institutions.extend(
+                bank for bank, bank_keyword in self._bank_keywords
+                if bank_keyword in found and bank != bank_name
+            )
             
             # Determine categories based on content
-            categories = []
-            content_lower = content.lower()
-            
-            if any(word in content_lower for word in ['fine', 'penalty', 'settlement']):
-                categories.append('fine')
-            if any(word in content_lower for word in ['enforcement', 'regulatory', 'compliance']):
-                categories.append('regulatory_action')
-            if any(word in content_lower for word in ['fraud', 'scandal', 'misconduct']):
-                categories.append('misconduct')
-            if any(word in content_lower for word in ['lawsuit', 'litigation', 'legal']):
-                categories.append('litigation')
-            if any(word in content_lower for word in ['bankruptcy', 'failure']):
-                categories.append('financial_distress')
+            categories = [
+                category for category, words in NEWS_CATEGORY_KEYWORDS
+                if not found.isdisjoint(words)
+            ]
             
             # Default category if none found
             if not categories:
                 categories.append('news')
             
             # Determine regulators mentioned
-            regulators = []
-            if any(reg in content_lower for reg in ['fdic', 'federal deposit insurance']):
-                regulators.append('FDIC')
-            if any(reg in content_lower for reg in ['occ', 'office of the comptroller']):
-                regulators.append('OCC')
-            if any(reg in content_lower for reg in ['federal reserve', 'fed']):
-                regulators.append('Federal Reserve')
-            if any(reg in content_lower for reg in ['cfpb', 'consumer financial protection']):
-                regulators.append('CFPB')
-            if any(reg in content_lower for reg in ['sec', 'securities and exchange']):
-                regulators.append('SEC')
+            regulators = [
+                regulator for regulator, words in NEWS_REGULATOR_KEYWORDS
+                if not found.isdisjoint(words)
+            ]
             
             # Calculate materiality score based on source and content
-            materiality_score = self._calculate_materiality_score(item_data)
+            materiality_score = self._calculate_materiality_score(item_data, found)
             
             return {
                 'title': item_data.get('title', 'Unknown Title'),
                 'description': item_data.get('description', ''),
                 'content': item_data.get('content', ''),
                 'url': item_data.get('url', ''),
-                'source': item_data.get('source', {}).get('name', 'Unknown'),
+                'source': self._intern(item_data.get('source', {}).get('name', 'Unknown')),
                 'published_at': published_at,
                 'event_date': event_date,
                 'institutions': institutions,
@@ -238,37 +302,39 @@ class NewsApiConnector(BaseConnector):
                 'regulators': regulators,
                 'materiality_score': materiality_score,
                 'search_query': item_data.get('search_query', ''),
-                'bank_name': item_data.get('bank_name', '')
+                'bank_name': bank_name
             }
             
         except Exception as e:
             self.logger.error("Failed to parse news article", error=str(e), article=item_data.get('title'))
             return {}
     
-    def _calculate_materiality_score(self, article: Dict[str, Any]) -> int:
-        """Calculate materiality score for news article (1-5 scale)."""
+    def _calculate_materiality_score(self, article: Dict[str, Any],
+                                     found: Optional[FrozenSet[str]] = None) -> int:
+        """
+        Calculate materiality score for news article (1-5 scale).
+        `found` is the keyword set already matched in the title and description, if any.
+        """
         score = 1
-        content = f"{article.get('title', '')} {article.get('description', '')}".lower()
+        if found is None:
+            content = f"{article.get('title', '')} {article.get('description', '')}".lower()
+            found = self._keyword_matcher.find(content)
         
         # High-impact keywords
-        high_impact = ['fine', 'penalty', 'settlement', 'enforcement', 'fraud', 'scandal']
-        if any(word in content for word in high_impact):
+        if not found.isdisjoint(HIGH_IMPACT_KEYWORDS):
             score += 2
         
         # Major banks mentioned
-        major_banks = ['jpmorgan', 'bank of america', 'wells fargo', 'citigroup', 'goldman sachs']
-        if any(bank in content for bank in major_banks):
+        if not found.isdisjoint(MATERIAL_BANK_KEYWORDS):
             score += 1
         
         # Regulatory agencies mentioned
-        regulators = ['fdic', 'occ', 'federal reserve', 'cfpb', 'sec']
-        if any(reg in content for reg in regulators):
+        if not found.isdisjoint(MATERIAL_REGULATOR_KEYWORDS):
             score += 1
         
         # Reputable news sources
-        reputable_sources = ['reuters', 'bloomberg', 'wall street journal', 'financial times', 'cnbc']
         source_name = article.get('source', {}).get('name', '').lower()
-        if any(source in source_name for source in reputable_sources):
+        if any(source in source_name for source in self.reputable_sources):
             score += 1
         
         return min(score, 5)  # Cap at 5
@@ -304,7 +370,7 @@ class NewsApiConnector(BaseConnector):
             )
             
             # Create event ID
-            event_id = f"newsapi-{parsed_data.get('source', 'unknown')}-{parsed_data.get('event_date')}-{hash(parsed_data.get('url', '')) % 10000}"
+            event_id = f"newsapi-{parsed_data.get('source', 'unknown')}-{parsed_data.get('event_date')}-{self._url_digest(parsed_data.get('url', ''))}"
             
             return Event(
                 event_id=event_id,
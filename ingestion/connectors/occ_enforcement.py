@@ -236,10 +236,7 @@ class OccEnforcementConnector(BaseConnector):
             pdf_text = ""
             if pdf_url:
                 try:
-                    pdf_response = await self._make_request(pdf_url)
-                    from pdfminer.high_level import extract_text
-                    import io
-                    pdf_text = extract_text(io.BytesIO(pdf_response.content))
+                    pdf_text = await self.fetch_pdf_text(pdf_url)
                 except Exception as e:
                     self.logger.warning("Failed to download PDF", url=pdf_url, error=str(e))
             
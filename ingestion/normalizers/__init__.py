@@ -3,6 +3,7 @@ Data normalization components for bank reputation damage events.
 """
 
 from .events_model import Event, SourceRef, ReputationalDrivers, ReputationalDamage
+from .keywords import KeywordMatcher, news_keyword_matcher
 from .mappings import (
     map_category, 
     map_nature, 
@@ -17,6 +18,8 @@ __all__ = [
     "SourceRef",
     "ReputationalDrivers", 
     "ReputationalDamage",
+    "KeywordMatcher",
+    "news_keyword_matcher",
     "map_category",
     "map_nature",
     "map_regulator",
@@ -0,0 +1,102 @@
+"""
+Multi-keyword matching for classifying free text such as news headlines.
+Finds every keyword of a fixed vocabulary that occurs in a text in one pass.
+"""
+
+import re
+from typing import FrozenSet, Iterable
+
+try:
+    import ahocorasick  # C Aho-Corasick automaton (pyahocorasick)
+except ImportError:  # pragma: no cover - fall back to per-keyword substring checks
+    ahocorasick = None
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class KeywordMatcher:
+    """
+    Find which of a set of lowercase keywords occur as substrings of a text.
+    Keywords given as `whole_words` only count where they are not part of a
+    longer word (e.g. a bank name inside another name); a keyword given both
+    ways is treated as a whole word.
+    """
+
+    def __init__(self, keywords: Iterable[str], whole_words: Iterable[str] = ()):
+        self.whole_words = frozenset(word.lower() for word in whole_words if word)
+        self.keywords = frozenset(keyword.lower() for keyword in keywords if keyword) | self.whole_words
+        self._automaton = None
+        self._whole_word_patterns = {}
+        if ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            self._whole_word_patterns = {
+                word: re.compile(r'(?<!\w)' + re.escape(word) + r'(?!\w)') for word in self.whole_words
+            }
+
+    def find(self, text_lower: str) -> FrozenSet[str]:
+        """
+        Keywords occurring in an already lowercased text.
+        Same result as checking `keyword in text_lower` for every keyword, with
+        whole-word keywords also required to stand on word boundaries.
+        """
+        if self._automaton is None:
+            return frozenset(
+                keyword for keyword in self.keywords
+                if keyword in text_lower and (
+                    keyword not in self._whole_word_patterns
+                    or self._whole_word_patterns[keyword].search(text_lower)
+                )
+            )
+        return frozenset(
+            keyword for end, keyword in self._automaton.iter(text_lower)
+            if keyword not in self.whole_words or self._on_word_boundaries(text_lower, end, keyword)
+        )
+
+    @staticmethod
+    def _on_word_boundaries(text: str, end: int, keyword: str) -> bool:
+        """Whether the match of `keyword` ending at index `end` is a whole word."""
+        start = end - len(keyword) + 1
+        return not (
+            (start > 0 and _is_word_char(text[start - 1]) and _is_word_char(keyword[0]))
+            or (end + 1 < len(text) and _is_word_char(text[end + 1]) and _is_word_char(keyword[-1]))
+        )
+
+
+# News article categories and the keywords that indicate them, in output order
+NEWS_CATEGORY_KEYWORDS = (
+    ('fine', ('fine', 'penalty', 'settlement')),
+    ('regulatory_action', ('enforcement', 'regulatory', 'compliance')),
+    ('misconduct', ('fraud', 'scandal', 'misconduct')),
+    ('litigation', ('lawsuit', 'litigation', 'legal')),
+    ('financial_distress', ('bankruptcy', 'failure')),
+)
+
+# Regulators and the keywords that indicate them in news articles, in output order
+NEWS_REGULATOR_KEYWORDS = (
+    ('FDIC', ('fdic', 'federal deposit insurance')),
+    ('OCC', ('occ', 'office of the comptroller')),
+    ('Federal Reserve', ('federal reserve', 'fed')),
+    ('CFPB', ('cfpb', 'consumer financial protection')),
+    ('SEC', ('sec', 'securities and exchange')),
+)
+
+# News article materiality score keywords
+HIGH_IMPACT_KEYWORDS = ('fine', 'penalty', 'settlement', 'enforcement', 'fraud', 'scandal')
+MATERIAL_BANK_KEYWORDS = ('jpmorgan', 'bank of america', 'wells fargo', 'citigroup', 'goldman sachs')
+MATERIAL_REGULATOR_KEYWORDS = ('fdic', 'occ', 'federal reserve', 'cfpb', 'sec')
+
+
+def news_keyword_matcher(bank_names: Iterable[str]) -> KeywordMatcher:
+    """Matcher for the bank names (as whole words) and every news classification keyword above."""
+    return KeywordMatcher(
+        [word for _, words in NEWS_CATEGORY_KEYWORDS + NEWS_REGULATOR_KEYWORDS for word in words]
+        + list(HIGH_IMPACT_KEYWORDS + MATERIAL_BANK_KEYWORDS + MATERIAL_REGULATOR_KEYWORDS),
+        whole_words=[bank.lower() for bank in bank_names]
+    )
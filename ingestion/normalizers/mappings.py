@@ -3,7 +3,8 @@ Category and nature mappings for bank reputation damage events.
 Provides controlled vocabulary for normalization across different data sources.
 """
 
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 import re
 
 
@@ -275,6 +276,13 @@ MATERIALITY_RULES = [
 ]
 
 
+# Fields read by MATERIALITY_RULES; their values form the materiality cache key
+_MATERIALITY_FIELDS = tuple(dict.fromkeys(
+    condition["field"] for rule in MATERIALITY_RULES for condition in rule["conditions"]
+))
+
+
+@lru_cache(maxsize=4096)
 def map_category(source_text: str) -> str:
     """Map source text to standardized category."""
     source_lower = source_text.lower()
@@ -288,6 +296,12 @@ def map_category(source_text: str) -> str:
 
 def map_nature(source_text: str) -> List[str]:
     """Map source text to standardized nature types."""
+    # Fresh list per call so callers can't alter the cached result
+    return list(_map_nature(source_text))
+
+
+@lru_cache(maxsize=4096)
+def _map_nature(source_text: str) -> Tuple[str, ...]:
     source_lower = source_text.lower()
     natures = []
     
@@ -298,9 +312,10 @@ def map_nature(source_text: str) -> List[str]:
     if not natures:
         natures.append("other")
     
-    return natures
+    return tuple(natures)
 
 
+@lru_cache(maxsize=4096)
 def map_regulator(source_text: str) -> str:
     """Map source text to standardized regulator name."""
     source_lower = source_text.lower()
@@ -312,26 +327,40 @@ def map_regulator(source_text: str) -> str:
     return "Other"
 
 
+def _field_value(event_data: Dict, field: str) -> Any:
+    """Look up a dotted field path; lists come back as tuples so they can be hashed."""
+    field_value = event_data
+    for key in field.split("."):
+        if isinstance(field_value, dict):
+            field_value = field_value.get(key, "")
+        else:
+            field_value = ""
+            break
+    return tuple(field_value) if isinstance(field_value, list) else field_value
+
+
 def calculate_materiality_score(event_data: Dict) -> int:
     """Calculate materiality score based on event data."""
+    values = tuple(_field_value(event_data, field) for field in _MATERIALITY_FIELDS)
+    try:
+        return _materiality_score(values)
+    except TypeError:  # Unhashable field value; score without the cache
+        return _materiality_score.__wrapped__(values)
+
+
+@lru_cache(maxsize=4096)
+def _materiality_score(values: Tuple[Any, ...]) -> int:
+    """Score the MATERIALITY_RULES field values (ordered as _MATERIALITY_FIELDS)."""
+    field_values = dict(zip(_MATERIALITY_FIELDS, values))
     for rule in MATERIALITY_RULES:
         score = rule["score"]
         conditions = rule["conditions"]
         
         for condition in conditions:
-            field = condition["field"]
+            field_value = field_values[condition["field"]]
             operator = condition["operator"]
             value = condition["value"]
             
-            # Navigate nested fields
-            field_value = event_data
-            for key in field.split("."):
-                if isinstance(field_value, dict):
-                    field_value = field_value.get(key, "")
-                else:
-                    field_value = ""
-                    break
-            
             # Apply operator
             if operator == ">=":
                 if isinstance(field_value, (int, float)) and field_value >= value:
@@ -339,13 +368,13 @@ def calculate_materiality_score(event_data: Dict) -> int:
             elif operator == "contains":
                 if isinstance(field_value, str) and value in field_value.lower():
                     return score
-                elif isinstance(field_value, list) and value in field_value:
+                elif isinstance(field_value, tuple) and value in field_value:
                     return score
             elif operator == "contains_any":
-                if isinstance(value, list):
-                    for v in value:
-                        if isinstance(field_value, str) and v in field_value.lower():
-                            return score
+                if isinstance(value, list) and isinstance(field_value, str):
+                    field_lower = field_value.lower()
+                    if any(v in field_lower for v in value):
+                        return score
     
     return 1  # Default to lowest score
 
@@ -84,17 +84,16 @@ class EventScheduler:
             try:
                 self.logger.info(f"Running connector: {connector_name}")
                 
-                # Fetch updates
-                events = await connector.fetch_updates(target_date)
-                
-                # Store events
+                # Store events as the connector produces them
+                fetched_count = 0
                 stored_count = 0
-                for event in events:
+                async for event in connector.iter_updates(target_date):
+                    fetched_count += 1
                     try:
                         # Enrich with BankFind data if available
                         if 'ffiec_bankfind' in self.connectors:
                             bankfind = self.connectors['ffiec_bankfind']
-                            event = await bankfind._enrich_event_institutions_async(event)
+                            event = await bankfind.enrich_event_institutions(event)
                         
                         # Store in repository
                         if self.repository.upsert_event(event):
@@ -110,14 +109,14 @@ class EventScheduler:
                         })
                 
                 results['connectors'][connector_name] = {
-                    'events_fetched': len(events),
+                    'events_fetched': fetched_count,
                     'events_stored': stored_count,
                     'status': 'success'
                 }
                 results['total_events'] += stored_count
                 
                 self.logger.info(f"Completed {connector_name}", 
-                               fetched=len(events), stored=stored_count)
+                               fetched=fetched_count, stored=stored_count)
                 
             except Exception as e:
                 self.logger.error(f"Failed to run connector: {connector_name}", error=str(e))
@@ -166,23 +165,23 @@ class EventScheduler:
             try:
                 self.logger.info(f"Running monthly backfill for: {connector_name}")
                 
-                # Fetch updates for the entire month
-                events = await connector.fetch_updates(start_date)
-                
-                # Filter events to the specific month
-                month_events = [
-                    event for event in events 
-                    if start_date <= event.event_date <= end_date
-                ]
-                
-                # Store events
+                # Fetch updates for the entire month, storing them as they arrive
+                fetched_count = 0
+                in_period_count = 0
                 stored_count = 0
-                for event in month_events:
+                async for event in connector.iter_updates(start_date):
+                    fetched_count += 1
+                    
+                    # Filter events to the specific month
+                    if not start_date <= event.event_date <= end_date:
+                        continue
+                    in_period_count += 1
+                    
                     try:
                         # Enrich with BankFind data if available
                         if 'ffiec_bankfind' in self.connectors:
                             bankfind = self.connectors['ffiec_bankfind']
-                            event = await bankfind._enrich_event_institutions_async(event)
+                            event = await bankfind.enrich_event_institutions(event)
                         
                         # Store in repository
                         if self.repository.upsert_event(event):
@@ -198,15 +197,15 @@ class EventScheduler:
                         })
                 
                 results['connectors'][connector_name] = {
-                    'events_fetched': len(events),
-                    'events_in_period': len(month_events),
+                    'events_fetched': fetched_count,
+                    'events_in_period': in_period_count,
                     'events_stored': stored_count,
                     'status': 'success'
                 }
                 results['total_events'] += stored_count
                 
                 self.logger.info(f"Completed monthly backfill for {connector_name}", 
-                               fetched=len(events), in_period=len(month_events), stored=stored_count)
+                               fetched=fetched_count, in_period=in_period_count, stored=stored_count)
                 
             except Exception as e:
                 self.logger.error(f"Failed to run monthly backfill for: {connector_name}", error=str(e))
@@ -240,19 +239,18 @@ class EventScheduler:
         try:
             self.logger.info(f"Running connector: {connector_name}", since=since.isoformat())
             
-            # Fetch updates
-            events = await connector.fetch_updates(since)
-            
-            # Store events
+            # Store events as the connector produces them
+            fetched_count = 0
             stored_count = 0
             errors = []
             
-            for event in events:
+            async for event in connector.iter_updates(since):
+                fetched_count += 1
                 try:
                     # Enrich with BankFind data if available
                     if 'ffiec_bankfind' in self.connectors:
                         bankfind = self.connectors['ffiec_bankfind']
-                        event = await bankfind._enrich_event_institutions_async(event)
+                        event = await bankfind.enrich_event_institutions(event)
                     
                     # Store in repository
                     if self.repository.upsert_event(event):
@@ -269,14 +267,14 @@ class EventScheduler:
             result = {
                 'connector': connector_name,
                 'since': since.isoformat(),
-                'events_fetched': len(events),
+                'events_fetched': fetched_count,
                 'events_stored': stored_count,
                 'status': 'success',
                 'errors': errors
             }
             
             self.logger.info(f"Completed {connector_name}", 
-                           fetched=len(events), stored=stored_count)
+                           fetched=fetched_count, stored=stored_count)
             
             return result
             
@@ -20,6 +20,7 @@ from dotenv import load_dotenv
 
 from storage.repository import EventRepository
 from ingestion.orchestrators.scheduler import EventScheduler, run_daily_collection, run_monthly_backfill
+from ingestion.connectors.http import close_shared_client
 import structlog
 
 # Load environment variables from .env file
@@ -176,6 +177,9 @@ async def main():
     except Exception as e:
         logger.error("Application failed", error=str(e))
         raise
+    finally:
+        # Connectors share one HTTP client; close it once on shutdown
+        await close_shared_client()
 
 
 def run_single_connector_example():
@@ -183,21 +187,24 @@ def run_single_connector_example():
     import asyncio
     
     async def run_connector_examples():
-        repository = EventRepository("bank_events.db")
-        scheduler = EventScheduler(repository)
+        try:
+            repository = EventRepository("bank_events.db")
+            scheduler = EventScheduler(repository)
         
-        # Run FDIC connector for last week
-        last_week = date.today() - timedelta(days=7)
-        fdic_results = await scheduler.run_connector('fdic_edo', last_week)
+            # Run FDIC connector for last week
+            last_week = date.today() - timedelta(days=7)
+            fdic_results = await scheduler.run_connector('fdic_edo', last_week)
         
-        print("FDIC ED&O Connector Results:")
-        print(json.dumps(fdic_results, indent=2, default=str))
+            print("FDIC ED&O Connector Results:")
+            print(json.dumps(fdic_results, indent=2, default=str))
         
-        # Run OCC connector for last week
-        occ_results = await scheduler.run_connector('occ_enforcement', last_week)
+            # Run OCC connector for last week
+            occ_results = await scheduler.run_connector('occ_enforcement', last_week)
         
-        print("\nOCC Enforcement Connector Results:")
-        print(json.dumps(occ_results, indent=2, default=str))
+            print("\nOCC Enforcement Connector Results:")
+            print(json.dumps(occ_results, indent=2, default=str))
+        finally:
+            await close_shared_client()
     
     asyncio.run(run_connector_examples())
 
@@ -234,20 +241,23 @@ def run_occ_connector_only():
     import asyncio
     
     async def run_occ():
-        repository = EventRepository("bank_events.db")
-        scheduler = EventScheduler(repository)
+        try:
+            repository = EventRepository("bank_events.db")
+            scheduler = EventScheduler(repository)
         
-        # Run OCC connector for last 7 days
-        last_week = date.today() - timedelta(days=7)
-        results = await scheduler.run_connector('occ_enforcement', last_week)
+            # Run OCC connector for last 7 days
+            last_week = date.today() - timedelta(days=7)
+            results = await scheduler.run_connector('occ_enforcement', last_week)
         
-        print("OCC Enforcement Connector Results:")
-        print(json.dumps(results, indent=2, default=str))
+            print("OCC Enforcement Connector Results:")
+            print(json.dumps(results, indent=2, default=str))
         
-        if results['events_stored'] > 0:
-            print(f"\nSuccessfully stored {results['events_stored']} events from OCC")
-        else:
-            print("\nNo new events found from OCC")
+            if results['events_stored'] > 0:
+                print(f"\nSuccessfully stored {results['events_stored']} events from OCC")
+            else:
+                print("\nNo new events found from OCC")
+        finally:
+            await close_shared_client()
     
     asyncio.run(run_occ())
 
@@ -6,6 +6,7 @@ MediaStack Search and News Article Analysis Classes
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import os
 import json
 import httpx
@@ -24,7 +25,14 @@ from enum import Enum
 # Load environment variables
 load_dotenv()
 
-@dataclass
+# NewsArticle fields written by the JSON exporters (raw content and pdf_path are omitted)
+EXPORT_FIELDS = (
+    "title", "description", "url", "source", "published_at",
+    "country", "language", "category", "scraped_text", "analysis",
+)
+
+
+@dataclass(slots=True)
 class NewsArticle:
     """Represents a news article from MediaStack API"""
     title: str
@@ -40,6 +48,10 @@ class NewsArticle:
     pdf_path: Optional[str] = None
     analysis: Optional[Dict[str, Any]] = None
     
+    def to_export_dict(self) -> Dict[str, Any]:
+        """Return the exported fields of this article as a plain dict"""
+        return {name: getattr(self, name) for name in EXPORT_FIELDS}
+    
     @classmethod
     def from_mediastack_json(cls, article_data: Dict[str, Any]) -> 'NewsArticle':
         """Create NewsArticle from MediaStack API JSON response"""
@@ -320,8 +332,10 @@ class NewsArticle:
             from openai import OpenAI
             client = OpenAI(api_key=openai_api_key)
             
-            # Send to ChatGPT-4o-mini with text-only messages
-            response = client.chat.completions.create(
+            # Send to ChatGPT-4o-mini with text-only messages; the client is blocking,
+            # so run it in a worker thread to keep other articles moving
+            response = await asyncio.to_thread(
+                client.chat.completions.create,
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -364,12 +378,18 @@ class NewsArticle:
 class MediaStackSearch:
     """Class for searching MediaStack API and managing results"""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            client: Optional shared AsyncClient (the caller owns and closes it);
+                by default each search opens its own client
+        """
         self.api_key = os.getenv("MEDIASTACK_API_KEY")
         if not self.api_key:
             raise ValueError("MEDIASTACK_API_KEY not found in environment")
         
         self.base_url = "https://api.mediastack.com/v1/news"
+        self.client = client
         self.articles: List[NewsArticle] = []
     
     async def search(self, 
@@ -411,7 +431,9 @@ class MediaStackSearch:
             offset = 0
             page = 1
             
-            async with httpx.AsyncClient() as client:
+            # Reuse the injected client (and its open connections) when there is one
+            client_context = httpx.AsyncClient() if self.client is None else contextlib.nullcontext(self.client)
+            async with client_context as client:
                 while True:
                     params['offset'] = offset
                     
@@ -491,47 +513,57 @@ class MediaStackSearch:
             return self.articles[index]
         return None
     
-    async def scrape_all_articles(self) -> Dict[str, int]:
-        """Scrape all articles in the collection"""
+    async def scrape_all_articles(self, max_concurrency: int = 4) -> Dict[str, int]:
+        """Scrape all articles in the collection, up to max_concurrency pages at a time"""
         results = {"success": 0, "failed": 0}
+        slots = asyncio.Semaphore(max_concurrency)
         
         print(f"🔄 Scraping {len(self.articles)} articles...")
         
-        for i, article in enumerate(self.articles):
-            print(f"   Scraping article {i+1}/{len(self.articles)}: {article.title[:50]}...")
-            
-            success = await article.scrape()
-            if success:
-                results["success"] += 1
-            else:
-                results["failed"] += 1
-            
-            # Small delay between requests
-            await asyncio.sleep(0.5)
+        async def scrape_one(i: int, article: NewsArticle) -> bool:
+            async with slots:
+                print(f"   Scraping article {i+1}/{len(self.articles)}: {article.title[:50]}...")
+                success = await article.scrape()
+                # Small delay before this slot takes the next request
+                await asyncio.sleep(0.5)
+                return success
+        
+        outcomes = await asyncio.gather(*(
+            scrape_one(i, article) for i, article in enumerate(self.articles)
+        ))
+        results["success"] = sum(outcomes)
+        results["failed"] = len(outcomes) - results["success"]
         
         print(f"✅ Scraping complete: {results['success']} successful, {results['failed']} failed")
         return results
     
-    async def analyse_all_articles(self, banking_entity: str, specific_event: Optional[str] = None) -> Dict[str, int]:
-        """Analyze all articles in the collection"""
+    async def analyse_all_articles(self, banking_entity: str, specific_event: Optional[str] = None,
+                                   max_concurrency: int = 4) -> Dict[str, int]:
+        """Analyze all articles in the collection, up to max_concurrency at a time"""
         results = {"success": 0, "failed": 0}
+        slots = asyncio.Semaphore(max_concurrency)
         
         print(f"🧠 Analyzing {len(self.articles)} articles...")
         if specific_event:
             print(f"🎯 Looking for articles about specific event: '{specific_event}'")
         
-        for i, article in enumerate(self.articles):
-            print(f"   Analyzing article {i+1}/{len(self.articles)}: {article.title[:50]}...")
-            
-            analysis = await article.analyse(banking_entity, specific_event)
-            if "error" not in analysis:
-                results["success"] += 1
-            else:
-                results["failed"] += 1
-                print(f"      Analysis failed: {analysis.get('error', 'Unknown error')}")
-            
-            # Small delay between requests to avoid rate limiting
-            await asyncio.sleep(1)
+        async def analyse_one(i: int, article: NewsArticle) -> None:
+            async with slots:
+                print(f"   Analyzing article {i+1}/{len(self.articles)}: {article.title[:50]}...")
+                
+                analysis = await article.analyse(banking_entity, specific_event)
+                if "error" not in analysis:
+                    results["success"] += 1
+                else:
+                    results["failed"] += 1
+                    print(f"      Analysis failed: {analysis.get('error', 'Unknown error')}")
+                
+                # Small delay before this slot takes the next request, to avoid rate limiting
+                await asyncio.sleep(1)
+        
+        await asyncio.gather(*(
+            analyse_one(i, article) for i, article in enumerate(self.articles)
+        ))
         
         print(f"✅ Analysis complete: {results['success']} successful, {results['failed']} failed")
         return results
@@ -539,22 +571,7 @@ class MediaStackSearch:
     def export_results(self, filename: str) -> bool:
         """Export all articles and their analysis to a JSON file"""
         try:
-            export_data = []
-            
-            for article in self.articles:
-                article_data = {
-                    "title": article.title,
-                    "description": article.description,
-                    "url": article.url,
-                    "source": article.source,
-                    "published_at": article.published_at,
-                    "country": article.country,
-                    "language": article.language,
-                    "category": article.category,
-                    "scraped_text": article.scraped_text,
-                    "analysis": article.analysis
-                }
-                export_data.append(article_data)
+            export_data = [article.to_export_dict() for article in self.articles]
             
             with open(filename, 'w', encoding='utf-8') as f:
                 json.dump(export_data, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,74 @@
+"""
+Tests for the URL helpers shared by all connectors.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from ingestion.connectors.base import BaseConnector
+
+ARTICLE_URL = "https://www.reuters.com/business/finance/bank-fined-2024-05-01/?utm_source=x"
+ARTICLE_DIGEST = "cd915f93b1d80907"
+
+
+class TestCanonicalUrl:
+    """Test cases for BaseConnector._canonical_url."""
+
+    def test_strips_tracking_parameters(self):
+        """utm_*, fbclid and gclid parameters are removed."""
+        url = "https://example.com/story?utm_source=x&utm_medium=y&fbclid=abc&gclid=def"
+
+        assert BaseConnector._canonical_url(url) == "https://example.com/story"
+
+    def test_keeps_other_parameters(self):
+        """Non-tracking parameters are kept in their original order."""
+        url = "https://example.com/story?id=42&utm_campaign=z&page=2"
+
+        assert BaseConnector._canonical_url(url) == "https://example.com/story?id=42&page=2"
+
+    def test_lowercases_scheme_and_host_only(self):
+        """Scheme and host are case-insensitive; the path is not."""
+        url = "HTTPS://Example.COM/News/Story?ref=Home"
+
+        assert BaseConnector._canonical_url(url) == "https://example.com/News/Story?ref=Home"
+
+    def test_tracking_variants_compare_equal(self):
+        """Syndicated copies of one article share a canonical URL."""
+        assert (
+            BaseConnector._canonical_url("https://EXAMPLE.com/a?utm_source=feed")
+            == BaseConnector._canonical_url("https://example.com/a?fbclid=123")
+        )
+
+
+class TestUrlDigest:
+    """Test cases for BaseConnector._url_digest."""
+
+    def test_known_digest(self):
+        """The digest of a known URL is fixed, so event IDs do not change between releases."""
+        assert BaseConnector._url_digest(ARTICLE_URL) == ARTICLE_DIGEST
+
+    def test_digest_ignores_tracking_parameters(self):
+        """Tracking-only differences give the same digest."""
+        canonical = "https://www.reuters.com/business/finance/bank-fined-2024-05-01/"
+
+        assert BaseConnector._url_digest(canonical) == ARTICLE_DIGEST
+
+    def test_digest_stable_across_processes(self):
+        """Unlike hash(), the digest does not depend on the interpreter's hash seed."""
+        code = (
+            "from ingestion.connectors.base import BaseConnector; "
+            f"print(BaseConnector._url_digest({ARTICLE_URL!r}))"
+        )
+        root = Path(__file__).resolve().parents[1]
+        digests = set()
+        for seed in ("1", "2"):
+            env = {**os.environ, "PYTHONHASHSEED": seed, "PYTHONPATH": str(root)}
+            result = subprocess.run(
+                [sys.executable, "-c", code], env=env, cwd=root,
+                capture_output=True, text=True, check=True,
+            )
+            digests.add(result.stdout.strip().splitlines()[-1])
+
+        assert digests == {ARTICLE_DIGEST}
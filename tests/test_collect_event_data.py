@@ -0,0 +1,230 @@
+"""
+Tests for the monthly event collection helpers in collect_event_data.
+"""
+
+import httpx
+import pandas as pd
+import pytest
+
+import collect_event_data
+from collect_event_data import (
+    JSONStructureError,
+    _events_overview,
+    _fetch_with_retries,
+    _split_range_payload,
+    json_to_bank_events_table,
+)
+
+
+def _payload(events):
+    return {
+        "query": {"timeframe": {"start": "2024-01-01", "end": "2024-01-31", "timezone": "UTC"}},
+        "events": events,
+        "last_updated": "2024-02-01T00:00:00Z",
+    }
+
+
+class TestJsonToBankEventsTable:
+    """Test cases for flattening event payloads into the events table."""
+
+    def test_parent_company_defaults_like_event_get(self):
+        """A missing parent_company becomes '', an explicit null stays null."""
+        events = [
+            {"event_id": "a"},
+            {"event_id": "b", "parent_company": "PC"},
+            {"event_id": "c"},
+            {"event_id": "d", "parent_company": None},
+        ]
+        df = json_to_bank_events_table(_payload(events))
+
+        values = df["parent_company"].tolist()
+        assert values[:3] == ["", "PC", ""]
+        assert pd.isna(values[3])
+
+    def test_parent_company_missing_from_every_event(self):
+        """The column is all '' (not None/NaN) when no event has the key."""
+        df = json_to_bank_events_table(_payload([{"event_id": "a"}, {"event_id": "b"}]))
+
+        assert df["parent_company"].tolist() == ["", ""]
+
+    def test_scalar_field_defaults(self):
+        """Nested driver fields fall back to the same defaults as event.get chains."""
+        events = [
+            {
+                "event_id": "a",
+                "reputational_damage": {
+                    "materiality_score": 4,
+                    "drivers": {"customers_affected": 1200, "litigation_status": "filed"},
+                },
+            },
+            {"event_id": "b"},
+        ]
+        df = json_to_bank_events_table(_payload(events))
+
+        assert df["materiality_score"].tolist() == [4, 0]
+        assert df["litigation_status"].tolist() == ["filed", ""]
+        assert df["executive_changes"].tolist() == [False, False]
+        # Numeric driver columns are coerced, with missing counts as 0
+        assert df["customers_affected"].tolist() == [1200, 0]
+        assert df["service_disruption_hours"].tolist() == [0, 0]
+
+    def test_list_and_amount_fields(self):
+        """List fields are joined with '; ' and amounts are summed."""
+        events = [{
+            "event_id": "a",
+            "institutions": ["ABC Bank", "ABC Holdings"],
+            "amounts": {"penalties_usd": 1000, "settlements_usd": "500", "other_amounts_usd": None},
+        }]
+        df = json_to_bank_events_table(_payload(events))
+
+        assert df.loc[0, "institutions"] == "ABC Bank; ABC Holdings"
+        assert df.loc[0, "total_financial_impact_usd"] == 1500.0
+        assert pd.isna(df.loc[0, "event_date"])
+
+
+class TestEventsOverview:
+    """Test cases for the summary figures of the events table."""
+
+    def test_overview_from_event_columns(self):
+        """Banks, event types, severity and dates come from the real table columns."""
+        events = [
+            {
+                "event_id": "a", "event_date": "2024-01-03",
+                "institutions": ["ABC Bank", "XYZ Bank"], "categories": ["fine", "misconduct"],
+                "reputational_damage": {"materiality_score": 3},
+            },
+            {
+                "event_id": "b", "event_date": "2024-02-03",
+                "institutions": ["ABC Bank"], "categories": ["fine"],
+                "reputational_damage": {"materiality_score": 5},
+            },
+            {"event_id": "c", "event_date": "2024-01-20"},
+        ]
+        overview = _events_overview(json_to_bank_events_table(_payload(events)))
+
+        assert overview["total"] == 3
+        assert overview["unique_banks"] == 2
+        assert overview["event_types"] == 2
+        assert overview["top_event_type"] == "fine"
+        # The event without a score is left out rather than counted as 0
+        assert overview["severity"] == {"mean": 4.0, "min": 3, "max": 5}
+        assert str(overview["date"]["min"].date()) == "2024-01-03"
+        assert str(overview["date"]["max"].date()) == "2024-02-03"
+
+    def test_overview_of_empty_table(self):
+        """An empty table only reports its size."""
+        assert _events_overview(json_to_bank_events_table(_payload([]))) == {"total": 0}
+
+
+def _range_payload(windows):
+    return {
+        "query": {"timeframe": {"start": "2024-01-01", "end": "2024-03-31", "timezone": "UTC"}},
+        "events_by_window": [{"window": {"start": start, "end": end}, "events": events}
+                             for start, end, events in windows],
+        "dedupe_note": "note",
+        "coverage_notes": "coverage",
+        "last_updated": "2024-04-01T00:00:00Z",
+    }
+
+
+class TestSplitRangePayload:
+    """Test cases for fanning a multi-month response out into months."""
+
+    MONTHS = ((2024, 1), (2024, 2), (2024, 3))
+
+    def test_split_into_months(self):
+        """Each window becomes a single-month payload with its own timeframe."""
+        payload = _range_payload([
+            ("2024-01-01", "2024-01-31", [{"event_id": "jan"}]),
+            ("2024-02-01", "2024-02-29", [{"event_id": "feb-1"}, {"event_id": "feb-2"}]),
+            ("2024-03-01", "2024-03-31", []),
+        ])
+        results = _split_range_payload(payload, self.MONTHS)
+
+        assert list(results) == list(self.MONTHS)
+        assert [e["event_id"] for e in results[(2024, 2)]["events"]] == ["feb-1", "feb-2"]
+        assert results[(2024, 3)]["events"] == []
+        assert results[(2024, 2)]["query"]["timeframe"] == {
+            "start": "2024-02-01", "end": "2024-02-29", "timezone": "UTC",
+        }
+        assert results[(2024, 1)]["last_updated"] == "2024-04-01T00:00:00Z"
+        # Every month is a valid single-month payload for the events table
+        assert json_to_bank_events_table(results[(2024, 1)])["event_id"].tolist() == ["jan"]
+
+    def test_windows_in_any_order(self):
+        """Windows are matched by their start month, not their position."""
+        payload = _range_payload([
+            ("2024-03-01T00:00:00Z", "2024-03-31", [{"event_id": "mar"}]),
+            ("2024-01-01", "2024-01-31", [{"event_id": "jan"}]),
+            ("2024-02-01", "2024-02-29", [{"event_id": "feb"}]),
+        ])
+        results = _split_range_payload(payload, self.MONTHS)
+
+        assert [results[m]["events"][0]["event_id"] for m in self.MONTHS] == ["jan", "feb", "mar"]
+
+    def test_event_dates_do_not_move_events(self):
+        """Events stay in the window they were reported under, whatever their own date says."""
+        events = [
+            {"event_id": "early", "event_date": "2023-12-30"},
+            {"event_id": "bad", "event_date": "sometime in spring"},
+        ]
+        payload = _range_payload([
+            ("2024-01-01", "2024-01-31", events),
+            ("2024-02-01", "2024-02-29", []),
+            ("2024-03-01", "2024-03-31", []),
+        ])
+        results = _split_range_payload(payload, self.MONTHS)
+
+        assert results[(2024, 1)]["events"] == events
+        df = json_to_bank_events_table(results[(2024, 1)])
+        assert df["event_date"].isna().tolist() == [False, True]
+
+    def test_extra_window_is_ignored(self):
+        """A window outside the requested months is not attributed to any of them."""
+        payload = _range_payload([
+            ("2023-12-01", "2023-12-31", [{"event_id": "dec"}]),
+            ("2024-01-01", "2024-01-31", []),
+            ("2024-02-01", "2024-02-29", []),
+            ("2024-03-01", "2024-03-31", []),
+        ])
+        results = _split_range_payload(payload, self.MONTHS)
+
+        assert all(results[m]["events"] == [] for m in self.MONTHS)
+
+    @pytest.mark.parametrize("start", ["February 2024", "2024/02/01", ""])
+    def test_malformed_window_raises(self, start):
+        """A month without a recognisable window raises, so the batch is fetched month by month."""
+        payload = _range_payload([
+            ("2024-01-01", "2024-01-31", []),
+            (start, "2024-02-29", [{"event_id": "feb"}]),
+            ("2024-03-01", "2024-03-31", []),
+        ])
+
+        with pytest.raises(JSONStructureError, match="2024-02"):
+            _split_range_payload(payload, self.MONTHS)
+
+
+class TestTransientRetries:
+    """Test cases for retrying transient Perplexity API failures."""
+
+    @pytest.mark.asyncio
+    async def test_single_retry_layer(self, monkeypatch):
+        """A month that keeps failing with 503 makes one HTTP request per tenacity attempt."""
+        monkeypatch.setattr(collect_event_data, "_TRANSIENT_BACKOFF", lambda retry_state: 0)
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            return httpx.Response(503, content=b"unavailable")
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            result, error = await _fetch_with_retries(
+                lambda: collect_event_data.fetch_negative_bank_events_async(
+                    2024, 1, client=client, max_retries=1, api_key="test-key", cache_path=None,
+                ),
+                "2024-01", delay_seconds=0,
+            )
+
+        assert result is None
+        assert "HTTP 503" in error
+        assert len(attempts) == 6
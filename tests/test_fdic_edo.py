@@ -6,9 +6,10 @@ import pytest
 import asyncio
 from datetime import date, datetime
 from unittest.mock import Mock, patch, AsyncMock
+from selectolax.lexbor import LexborHTMLParser
 from selectolax.parser import HTMLParser
 
-from ingestion.connectors.fdic_edo import FdicEdoConnector
+from ingestion.connectors.fdic_edo import FdicEdoConnector, _first_matches
 from ingestion.normalizers.events_model import Event
 
 
@@ -124,7 +125,73 @@ class TestFdicEdoConnector:
         assert item["id"] == "2024-003"
         assert item["title"] == "Recent Order"
         assert item["url"] == "https://orders.fdic.gov/orders/2024-003"
-    
+
+    def test_listing_recency_filter(self, connector):
+        """Test that dated listing orders before `since` are dropped and undated ones kept."""
+        html = HTMLParser("""
+        <section>
+            <h2>Recent Orders</h2>
+            <ul>
+                <li><a href="/orders/2024-010">Consent Order Against ABC Bank</a>
+                    <span class="date">May 20, 2024</span></li>
+                <li><a href="/orders/2023-005">Consent Order Against XYZ Bank</a>
+                    <time datetime="2023-11-02">November 2, 2023</time></li>
+                <li><a href="/orders/2024-011">Civil Money Penalty Against DEF Bank</a></li>
+            </ul>
+        </section>
+        """)
+        section = html.css_first('section')
+
+        items = connector._extract_orders_from_section(section, date(2024, 1, 1))
+
+        assert [item["id"] for item in items] == ["2024-010", "2024-011"]
+        assert items[0]["order_date"] == date(2024, 5, 20)
+        assert items[1]["order_date"] is None
+
+    def test_listing_date_needs_single_link(self, connector):
+        """Test that a date shared by several links is not attributed to any of them."""
+        html = HTMLParser("""
+        <p><span class="date">May 20, 2024</span>
+            <a href="/orders/2024-010">Order A</a>
+            <a href="/orders/2024-011">Order B</a></p>
+        """)
+        link = html.css_first('a')
+
+        item = connector._extract_order_from_link(link)
+
+        assert item["order_date"] is None
+        assert connector._is_recent_order(item, date(2024, 6, 1))
+
+    def test_card_recency_filter(self, connector):
+        """Test that a card's listing date is compared against `since`."""
+        html = HTMLParser("""
+        <div class="slds-card">
+            <h3>Enforcement Action Against DEF Bank</h3>
+            <a href="/orders/2023-007">View order</a>
+            <span class="date">03/15/2023</span>
+        </div>
+        """)
+        item = connector._extract_order_from_card(html.css_first('.slds-card'))
+
+        assert item["order_date"] == date(2023, 3, 15)
+        assert connector._is_recent_order(item, date(2023, 3, 15))
+        assert not connector._is_recent_order(item, date(2023, 3, 16))
+
+    def test_first_matches_nested_selectors(self):
+        """Test that a container is not picked for a selector only its descendants match."""
+        html = LexborHTMLParser("""
+        <div class="institution">
+            <h1>ABC Bank</h1>
+            <span class="date">May 20, 2024</span>
+        </div>
+        """)
+
+        found = _first_matches(html, ('.institution', 'h1', '.date'))
+
+        assert found['h1'].text() == "ABC Bank"
+        assert found['.date'].text() == "May 20, 2024"
+        assert found['.institution'].tag == "div"
+
     def test_parse_pdf_text(self, connector):
         """Test PDF text parsing."""
         parsed = connector._parse_pdf_text(self.sample_pdf_text)
@@ -207,7 +274,8 @@ class TestFdicEdoConnector:
                 
                 result = await connector.fetch_item_detail(item)
                 
-                assert result["html_content"] == "<html><body><h1>ABC Bank Order</h1></body></html>"
+                assert result["html_fields"] == {"institution": "ABC Bank Order"}
+                assert "html_content" not in result
                 assert result["pdf_text"] == "PDF text content"
     
     def test_parse_item(self, connector):
@@ -0,0 +1,109 @@
+"""
+Tests for the BankFind institution lookup connector.
+"""
+
+import json
+
+import httpx
+import pytest
+
+from ingestion.cache import LookupCache
+from ingestion.connectors.ffiec_bankfind import BankFindConnector
+
+
+def _response(rows):
+    return httpx.Response(200, content=json.dumps({'data': rows}).encode())
+
+
+def _row(name, cert):
+    return {'data': {'NAME': name, 'CERT': cert}}
+
+
+class TestSearchInstitutionsBulk:
+    """Test cases for combined institution name lookups."""
+
+    @pytest.fixture
+    def connector(self, monkeypatch, tmp_path):
+        """Connector with an API key, a private lookup cache and a fake BankFind API."""
+        monkeypatch.setenv("FDIC_API_KEY", "test-key")
+        connector = BankFindConnector()
+        connector.lookup_cache = LookupCache(str(tmp_path / "lookups.db"))
+        connector.requests = []
+
+        async def fake_request(url, params=None, **kwargs):
+            filters = params['filters']
+            connector.requests.append(filters)
+            if ' OR ' in filters:
+                # Combined query: phrase matches for every requested name
+                return _response([
+                    _row('FIRST BANK OF TEXAS', 2),
+                    _row('First Bank', 1),
+                    _row('Wells Fargo Bank', 3),
+                ])
+            if filters == 'NAME:"Wells Fargo"':
+                return _response([_row('Wells Fargo Bank', 3)])
+            return _response([])
+
+        connector._make_request = fake_request
+        yield connector
+        connector.lookup_cache.close()
+
+    @pytest.mark.asyncio
+    async def test_exact_names_from_combined_query(self, connector):
+        """Exact (case-insensitive) names resolve from one combined query."""
+        results = await connector.search_institutions_bulk(['First Bank', 'First Bank of Texas'])
+
+        assert results['First Bank']['data']['CERT'] == 1
+        assert results['First Bank of Texas']['data']['CERT'] == 2
+        assert len(connector.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_inexact_names_use_single_search(self, connector):
+        """Names without an exact row fall back to search_institution."""
+        results = await connector.search_institutions_bulk(['First Bank', 'Wells Fargo', 'Nobank'])
+
+        assert results['First Bank']['data']['CERT'] == 1
+        assert results['Wells Fargo']['data']['CERT'] == 3
+        assert results['Nobank'] is None
+        assert sorted(connector.requests[1:]) == ['NAME:"Nobank"', 'NAME:"Wells Fargo"']
+
+    @pytest.mark.asyncio
+    async def test_bulk_matches_do_not_change_single_search(self, connector):
+        """search_institution is not served a combined-query match from the cache."""
+        await connector.search_institutions_bulk(['First Bank', 'First Bank of Texas'])
+
+        assert await connector.search_institution('First Bank') is None
+        assert connector.requests[-1] == 'NAME:"First Bank"'
+
+    @pytest.mark.asyncio
+    async def test_cached_results_skip_requests(self, connector):
+        """A repeated bulk search is answered entirely from the cache."""
+        names = ['First Bank', 'First Bank of Texas', 'Nobank']
+        first = await connector.search_institutions_bulk(names)
+        request_count = len(connector.requests)
+
+        assert await connector.search_institutions_bulk(names) == first
+        assert len(connector.requests) == request_count
+
+    @pytest.mark.asyncio
+    async def test_quoted_name_left_out_of_combined_query(self, connector):
+        """A name containing '"' is searched on its own instead of breaking the combined query."""
+        results = await connector.search_institutions_bulk(['First Bank', 'The "Best" Bank', 'First Bank of Texas'])
+
+        assert results['First Bank']['data']['CERT'] == 1
+        assert results['First Bank of Texas']['data']['CERT'] == 2
+        assert results['The "Best" Bank'] is None
+        assert '"Best"' not in connector.requests[0]
+        assert connector.requests[1:] == ['NAME:"The "Best" Bank"']
+
+    @pytest.mark.asyncio
+    async def test_cache_ignores_name_case(self, connector):
+        """A combined-query match is reused for the same name in different casing."""
+        await connector.search_institutions_bulk(['First Bank', 'First Bank of Texas'])
+        request_count = len(connector.requests)
+
+        results = await connector.search_institutions_bulk(['FIRST BANK', 'first bank of texas'])
+
+        assert results['FIRST BANK']['data']['CERT'] == 1
+        assert results['first bank of texas']['data']['CERT'] == 2
+        assert len(connector.requests) == request_count
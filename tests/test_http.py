@@ -0,0 +1,82 @@
+"""
+Tests for the shared HTTP client.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from ingestion.connectors import http
+
+
+@pytest.fixture(autouse=True)
+def fresh_shared_client(monkeypatch):
+    """Start each test without a shared client."""
+    monkeypatch.setattr(http, "_shared_client", None)
+    monkeypatch.setattr(http, "_shared_loop", None)
+    monkeypatch.setattr(http, "_shutdown_task", None)
+
+
+async def _get_client():
+    return http.get_shared_client()
+
+
+class TestSharedClient:
+    """Test cases for get_shared_client across event loops."""
+
+    def test_client_closed_with_its_loop(self):
+        """asyncio.run() closes the client it created, and the next run gets a new one."""
+        first = asyncio.run(_get_client())
+        assert first.is_closed
+
+        second = asyncio.run(_get_client())
+        assert second is not first
+        assert second.is_closed
+
+    def test_same_loop_reuses_client(self):
+        """Repeated calls on one loop share a single client."""
+        async def get_twice():
+            return http.get_shared_client() is http.get_shared_client()
+
+        assert asyncio.run(get_twice())
+
+    def test_close_shared_client(self):
+        """close_shared_client closes the client and the next call creates a new one."""
+        async def close_and_reopen():
+            first = http.get_shared_client()
+            await http.close_shared_client()
+            return first, http.get_shared_client()
+
+        first, second = asyncio.run(close_and_reopen())
+        assert first.is_closed
+        assert second is not first
+
+    def test_client_of_running_loop_closed_on_that_loop(self):
+        """A client replaced while its loop runs in another thread is closed on that loop."""
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            first = asyncio.run_coroutine_threadsafe(_get_client(), other_loop).result(5)
+
+            async def replace_and_wait():
+                second = http.get_shared_client()
+                for _ in range(100):
+                    if first.is_closed:
+                        break
+                    await asyncio.sleep(0.01)
+                return second
+
+            second = asyncio.run(replace_and_wait())
+            assert second is not first
+            assert first.is_closed
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(5)
+            # Shut the loop down the way asyncio.run() would
+            tasks = asyncio.all_tasks(other_loop)
+            for task in tasks:
+                task.cancel()
+            other_loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            other_loop.close()
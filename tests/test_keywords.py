@@ -0,0 +1,69 @@
+"""
+Tests for the news keyword matcher.
+"""
+
+import pytest
+
+from ingestion.normalizers import keywords
+from ingestion.normalizers.keywords import KeywordMatcher, news_keyword_matcher
+
+
+@pytest.fixture(params=["ahocorasick", "fallback"])
+def matcher_factory(request, monkeypatch):
+    """Build matchers with the pyahocorasick automaton and with the substring fallback."""
+    if request.param == "ahocorasick":
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(keywords, "ahocorasick", None)
+
+    def factory(*args, **kwargs):
+        matcher = KeywordMatcher(*args, **kwargs)
+        assert (matcher._automaton is not None) == (request.param == "ahocorasick")
+        return matcher
+
+    return factory
+
+
+class TestKeywordMatcher:
+    """Test cases for KeywordMatcher on both matching paths."""
+
+    def test_substring_keywords(self, matcher_factory):
+        """Plain keywords match anywhere, including inside longer words."""
+        matcher = matcher_factory(["fed", "fine", "sec"])
+
+        assert matcher.find("the federal reserve fined the bank") == {"fed", "fine"}
+        assert matcher.find("nothing to see") == frozenset()
+
+    def test_whole_word_keywords(self, matcher_factory):
+        """Whole-word keywords need word boundaries on both sides."""
+        matcher = matcher_factory([], whole_words=["State Street"])
+
+        assert matcher.find("state street settles probe") == {"state street"}
+        assert matcher.find("upstate street closures") == frozenset()
+        assert matcher.find("state streets were closed") == frozenset()
+        assert matcher.find("state street's penalty") == {"state street"}
+
+    def test_whole_word_at_text_edges(self, matcher_factory):
+        """A whole word at the very start or end of the text still matches."""
+        matcher = matcher_factory([], whole_words=["citigroup"])
+
+        assert matcher.find("citigroup") == {"citigroup"}
+        assert matcher.find("citigroup fined") == {"citigroup"}
+        assert matcher.find("regulators fined citigroup") == {"citigroup"}
+        assert matcher.find("xcitigroup") == frozenset()
+
+    def test_whole_word_after_embedded_occurrence(self, matcher_factory):
+        """A later standalone occurrence counts even if an earlier one is embedded."""
+        matcher = matcher_factory([], whole_words=["capital one"])
+
+        assert matcher.find("capital ones and capital one") == {"capital one"}
+
+    def test_news_matcher(self, matcher_factory, monkeypatch):
+        """Bank names are whole words; classification keywords stay substrings."""
+        monkeypatch.setattr(keywords, "KeywordMatcher", matcher_factory)
+        matcher = news_keyword_matcher(["State Street", "Wells Fargo"])
+
+        found = matcher.find("federal regulators fined wells fargo, not upstate street")
+        assert "wells fargo" in found
+        assert "state street" not in found
+        assert {"fed", "fine", "federal reserve"} & found == {"fed", "fine"}
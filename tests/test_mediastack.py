@@ -0,0 +1,36 @@
+"""
+Tests for the MediaStack news connector.
+"""
+
+from datetime import date
+
+import pytest
+
+from ingestion.connectors.mediastack import MediaStackConnector
+
+
+class TestParseItem:
+    """Test cases for MediaStack article parsing."""
+
+    @pytest.fixture
+    def connector(self, monkeypatch):
+        """Connector with an API key."""
+        monkeypatch.setenv("MEDIASTACK_API_KEY", "test-key")
+        return MediaStackConnector()
+
+    @pytest.mark.parametrize("published_at", [
+        "2024-05-01T12:30:00+00:00",
+        "2024-05-01T12:30:00Z",
+        "2024-05-01 12:30:00",
+    ])
+    def test_publication_date(self, connector, published_at):
+        """ISO 8601 and space-separated timestamps give the publication date."""
+        parsed = connector.parse_item({"title": "Bank fined", "published_at": published_at})
+
+        assert parsed["event_date"] == date(2024, 5, 1)
+
+    def test_unparseable_publication_date(self, connector):
+        """An unreadable timestamp falls back to today."""
+        parsed = connector.parse_item({"title": "Bank fined", "published_at": "last Tuesday"})
+
+        assert parsed["event_date"] == date.today()
@@ -0,0 +1,90 @@
+"""
+Tests for the NewsAPI connector.
+"""
+
+import json
+from datetime import date
+
+import httpx
+import pytest
+
+from ingestion.cache import LookupCache
+from ingestion.connectors.newsapi import NewsApiConnector
+
+
+class TestNewsApiConnector:
+    """Test cases for NewsAPI bank searches."""
+
+    @pytest.fixture
+    def connector(self, monkeypatch, tmp_path):
+        """Connector with an API key and a private lookup cache."""
+        monkeypatch.setenv("NEWS_API_KEY", "test-key")
+        connector = NewsApiConnector()
+        connector.lookup_cache = LookupCache(str(tmp_path / "lookups.db"))
+        yield connector
+        connector.lookup_cache.close()
+
+    def test_bank_batches_cover_every_bank(self, connector):
+        """Banks are packed in order, at most banks_per_search per search."""
+        batches = connector._bank_batches()
+
+        assert [bank for batch in batches for bank in batch] == connector.major_banks
+        assert all(len(batch) <= connector.banks_per_search for batch in batches)
+        assert len(batches) == 3
+
+    def test_bank_batches_respect_query_limit(self, connector):
+        """A batch is split before its query would exceed max_query_chars."""
+        connector.major_banks = [f"Bank Number {i} " + "x" * 80 for i in range(5)]
+        batches = connector._bank_batches()
+
+        assert len(batches) > 1
+        keywords = [f'"{keyword}"' for keyword in connector.reputation_keywords[:5]]
+        for batch in batches:
+            query = " OR ".join([f'"{bank}"' for bank in batch] + keywords)
+            assert len(query) <= connector.max_query_chars
+
+    @pytest.mark.asyncio
+    async def test_bank_search_queries(self, connector):
+        """Each bank search stays under the query limit and asks for 20 articles per bank."""
+        params_seen = []
+
+        async def fake_request(url, params=None, **kwargs):
+            params_seen.append(params)
+            return httpx.Response(200, content=json.dumps({'articles': []}).encode())
+
+        connector._make_request = fake_request
+        for batch in connector._bank_batches():
+            await connector._search_bank_news(batch, date(2024, 1, 1))
+
+        assert len(params_seen) == 3
+        for params in params_seen:
+            assert len(params['q']) <= connector.max_query_chars
+            assert params['pageSize'] == 100
+
+    def test_batch_article_attributed_to_first_mentioned_bank(self, connector):
+        """parse_item names the first searched bank the article mentions."""
+        article = {
+            'title': 'Citigroup and Wells Fargo fined over fees',
+            'description': 'Regulators ordered a settlement.',
+            'url': 'https://example.com/a',
+            'source': {'name': 'Reuters'},
+            'search_banks': ['JPMorgan Chase', 'Wells Fargo', 'Citigroup'],
+        }
+        parsed = connector.parse_item(article)
+
+        assert parsed['bank_name'] == 'Wells Fargo'
+        assert parsed['institutions'] == ['Wells Fargo', 'Citigroup']
+
+    def test_batch_article_without_bank_mention(self, connector):
+        """An article matched only on a reputation keyword names no bank."""
+        article = {
+            'title': 'Regional lender hit with penalty',
+            'description': '',
+            'url': 'https://example.com/b',
+            'source': {'name': 'Reuters'},
+            'search_banks': ['JPMorgan Chase', 'Wells Fargo'],
+        }
+        parsed = connector.parse_item(article)
+
+        assert parsed['bank_name'] == ''
+        assert parsed['institutions'] == []